@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import RevokedToken
 
-# Register your models here.
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ('jti', 'token_type', 'user', 'revoked_at', 'expires_at')
+    list_filter = ('token_type',)
+    search_fields = ('jti', 'user__username')
+    readonly_fields = ('jti', 'token_type', 'user', 'revoked_at', 'expires_at')
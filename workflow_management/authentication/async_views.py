@@ -0,0 +1,19 @@
+# authentication/async_views.py
+from asgiref.sync import sync_to_async
+from django.urls import path
+
+from core.async_views import async_read_view
+from .views import search_users, search_users_payload
+
+
+async def search_users_async(request, user):
+    """Kullanıcı arama - indeks kurulumu veritabanına gidebildiği için thread havuzunda"""
+    return await sync_to_async(search_users_payload)(request.GET)
+
+
+search_users_view = async_read_view(search_users_async, search_users)
+
+# authentication/urls.py bunları senkron eşlemelerin önüne ekler
+urlpatterns = [
+    path('users/search/', search_users_view, name='search_users'),
+]
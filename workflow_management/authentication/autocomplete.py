@@ -0,0 +1,336 @@
+# authentication/autocomplete.py
+import heapq
+import logging
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Türkçe büyük/küçük harf dönüşümü (İ -> i, I -> ı) ve aksan katlama
+_TURKISH_UPPER = str.maketrans({'İ': 'i', 'I': 'ı'})
+_ASCII_FOLD = str.maketrans('çğıöşüâîû', 'cgiosuaiu')
+
+# Tek istekte dönebilecek en fazla sonuç
+MAX_RESULTS = 50
+
+
+def normalize(text):
+    """Arama için metni küçük harfe çevirip Türkçe karakterleri katlar"""
+    return (text or '').translate(_TURKISH_UPPER).lower().translate(_ASCII_FOLD)
+
+
+def _ngrams(token, size):
+    return {token[i:i + size] for i in range(len(token) - size + 1)}
+
+
+def _level(term, text):
+    """
+    Terimin kullanıcı metniyle (' token1 token2 ') eşleşme seviyesi:
+    0 tam token, 1 önek, 2 iç eşleşme, None eşleşme yok
+    """
+    if f' {term} ' in text:
+        return 0
+    if f' {term}' in text:
+        return 1
+    if len(term) >= 2 and term in text:
+        return 2
+    return None
+
+
+class _IndexState:
+    """
+    Tek bir kurulumun değişmez görüntüsü. Kullanıcılar ad/soyad sırasına göre
+    numaralanır (pozisyon); tüm pozisyon listeleri sıralıdır.
+    - tokens / postings / offsets: sıralı token listesi; token i'yi taşıyan
+      pozisyonlar postings[offsets[i]:offsets[i + 1]]
+    - tops: BLOCK_SIZE token'lık bloklar üzerinde segment ağacı; her düğüm
+      bloklarındaki kullanıcıların en küçük TOP_K pozisyonunu tutar. Geniş önek
+      aralıklarında (ör. 'a') ilk sonuçlar aralıktaki tüm listeleri birleştirmeden bulunur.
+    - grams: 2/3-gram -> o gram'ı içeren token'ı olan pozisyonlar (iç eşleşme)
+    - texts: pozisyon başına ' token1 token2 ' (çok terimli doğrulama)
+    """
+
+    TOP_K = 2 * MAX_RESULTS
+    BLOCK_SIZE = 16
+
+    def __init__(self, rows):
+        # Ad/soyad bir kez normalize edilir, hem sıralamada hem token'larda kullanılır
+        prepared = sorted(
+            (normalize(row[2]), normalize(row[3]), row[0], row) for row in rows
+        )
+
+        self.records = []
+        self.texts = []
+        postings = defaultdict(list)
+        grams = defaultdict(list)
+        for position, (first, last, _, row) in enumerate(prepared):
+            user_id, username, first_name, last_name, email, is_staff = row
+            self.records.append((user_id, username, f"{first_name} {last_name}".strip() or username, email, is_staff))
+
+            tokens = set(first.split())
+            tokens.update(last.split())
+            tokens.add(normalize(username))
+            tokens.discard('')
+            self.texts.append(' %s ' % ' '.join(tokens))
+            user_grams = set()
+            for token in tokens:
+                postings[token].append(position)
+                user_grams.update(_ngrams(token, 2))
+                user_grams.update(_ngrams(token, 3))
+            for gram in user_grams:
+                grams[gram].append(position)
+
+        self.tokens = sorted(postings)
+        self.postings = array('I')
+        self.offsets = array('I', [0])
+        for token in self.tokens:
+            self.postings.extend(postings[token])
+            self.offsets.append(len(self.postings))
+        self.grams = {gram: array('I', positions) for gram, positions in grams.items()}
+        self._build_tops()
+
+    def _token_top(self, index):
+        start = self.offsets[index]
+        return self.postings[start:min(start + self.TOP_K, self.offsets[index + 1])]
+
+    def _range_top(self, lo, hi):
+        """Token aralığını doğrudan birleştirir (kısa aralıklar için)"""
+        found = set()
+        for index in range(lo, hi):
+            found.update(self._token_top(index))
+        return found
+
+    def _build_tops(self):
+        blocks = -(-len(self.tokens) // self.BLOCK_SIZE)
+        tops = [()] * blocks + [
+            tuple(sorted(self._range_top(block * self.BLOCK_SIZE, min((block + 1) * self.BLOCK_SIZE, len(self.tokens))))[:self.TOP_K])
+            for block in range(blocks)
+        ]
+        for node in range(blocks - 1, 0, -1):
+            tops[node] = tuple(sorted(set(tops[2 * node]).union(tops[2 * node + 1]))[:self.TOP_K])
+        self.blocks = blocks
+        self.tops = tops
+
+    def prefix_range(self, term):
+        """term ile başlayan token'ların [lo, hi) aralığı"""
+        lo = bisect_left(self.tokens, term)
+        hi = bisect_left(self.tokens, term + '\uffff', lo)
+        return lo, hi
+
+    def prefix_top(self, lo, hi, count):
+        """Aralıktaki token'ları taşıyan en küçük count pozisyon (count <= TOP_K, sıralı)"""
+        first_block = -(-lo // self.BLOCK_SIZE)
+        last_block = hi // self.BLOCK_SIZE
+        if first_block >= last_block:
+            return sorted(self._range_top(lo, hi))[:count]
+
+        # Kenarlardaki yarım bloklar doğrudan, aradaki tam bloklar ağaçtan
+        found = self._range_top(lo, first_block * self.BLOCK_SIZE)
+        found.update(self._range_top(last_block * self.BLOCK_SIZE, hi))
+        left, right = first_block + self.blocks, last_block + self.blocks
+        while left < right:
+            if left & 1:
+                found.update(self.tops[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                found.update(self.tops[right])
+            left >>= 1
+            right >>= 1
+        return sorted(found)[:count]
+
+    def exact(self, term):
+        index = bisect_left(self.tokens, term)
+        if index < len(self.tokens) and self.tokens[index] == term:
+            return self.postings[self.offsets[index]:self.offsets[index + 1]]
+        return ()
+
+    def candidates(self, term):
+        """
+        Terimle herhangi bir seviyede eşleşebilecek pozisyonlar (sıralı üst küme).
+        2-3 harfte gram listesi iç eşleşmenin kendisidir; daha uzun terimlerde
+        en kısa 3-gram listesi kullanılır, tek harfte önek aralığı.
+        """
+        if len(term) == 1:
+            lo, hi = self.prefix_range(term)
+            return self.postings[self.offsets[lo]:self.offsets[hi]]
+        if len(term) <= 3:
+            return self.grams.get(term, ())
+        return min((self.grams.get(gram, ()) for gram in _ngrams(term, 3)), key=len)
+
+    def record(self, position):
+        user_id, username, full_name, email, is_staff = self.records[position]
+        return {
+            'id': user_id,
+            'username': username,
+            'full_name': full_name,
+            'email': email,
+            'display_name': f"{full_name} ({username})",
+            'is_staff': is_staff
+        }
+
+
+class UserAutocompleteIndex:
+    """
+    Aktif kullanıcılar için süreç içi arama indeksi.
+    - Önek eşleşmesi: sıralı token listesinde ikili arama + segment ağacı
+    - İç eşleşme: 2/3-gram -> kullanıcı pozisyonları listesi + doğrulama
+    Sıralama: tam token eşleşmesi > önek > iç eşleşme, sonra ad/soyad.
+    Bellek kullanıcı başına token sayısıyla doğrusal büyür (bit maskesi tutulmaz).
+    Kullanıcılar değiştiğinde sürüm artırılır; indeks bir kez kurulduktan sonra
+    yeniden kurulum arka plan thread'inde yapılır, aramalar o sırada eski
+    görüntüden cevaplanır (USER_INDEX_BACKGROUND_REBUILD=False ise istek içinde).
+    """
+
+    VERSION_KEY = 'user_autocomplete:version'
+    REFRESH_INTERVAL = 5  # saniye
+    MAX_TERMS = 4
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0
+        self._state = None
+        self._rebuild_thread = None
+
+    def reset_after_fork(self):
+        """Fork öncesi başlamış bir kurulum thread'i çocuk süreçte yoktur"""
+        self._lock = threading.Lock()
+        self._rebuild_thread = None
+
+    def _load(self):
+        return _IndexState(User.objects.filter(is_active=True).values_list(
+            'id', 'username', 'first_name', 'last_name', 'email', 'is_staff'
+        ))
+
+    def _rebuild(self, version):
+        try:
+            state = self._load()
+            with self._lock:
+                self._state = state
+                self._version = version
+        except Exception:
+            logger.exception('Kullanıcı arama indeksi yeniden kurulamadı')
+        finally:
+            # Thread'e ait bağlantılar açık kalmasın
+            connections.close_all()
+            self._rebuild_thread = None
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        if self._state is not None and now - self._checked_at < self.REFRESH_INTERVAL:
+            return
+
+        version = cache.get(self.VERSION_KEY, 0)
+        with self._lock:
+            self._checked_at = now
+            if self._state is not None and version == self._version:
+                return
+            if self._state is not None and settings.USER_INDEX_BACKGROUND_REBUILD:
+                if self._rebuild_thread is None:
+                    self._rebuild_thread = threading.Thread(
+                        target=self._rebuild, args=(version,), name='user-index-rebuild', daemon=True
+                    )
+                    self._rebuild_thread.start()
+                return
+            # İlk kurulum (veya arka plan kurulumu kapalı) istek içinde yapılır
+            self._state = self._load()
+            self._version = version
+
+    def invalidate(self):
+        """İndeksi tüm worker'lar için eskitir; bu worker sonraki aramada yeniler"""
+        try:
+            cache.incr(self.VERSION_KEY)
+        except ValueError:
+            cache.set(self.VERSION_KEY, 1, None)
+        self._checked_at = 0
+
+    def reset(self):
+        """Bellekteki indeksi atar; sonraki arama indeksi istek içinde kurar"""
+        with self._lock:
+            self._state = None
+            self._version = None
+
+    def search(self, query, limit):
+        self._ensure_fresh()
+        state = self._state
+        limit = max(1, min(limit, MAX_RESULTS))
+        terms = normalize(query).split()[:self.MAX_TERMS]
+
+        if not terms:
+            positions = range(min(limit, len(state.records)))
+        elif len(terms) == 1:
+            positions = self._search_term(state, terms[0], limit)
+        else:
+            positions = self._search_terms(state, terms, limit)
+        return [state.record(position) for position in positions]
+
+    def _search_term(self, state, term, limit):
+        """Tek terim: seviyeler sırayla doldurulur, her seviyede pozisyon sırası korunur"""
+        results = list(state.exact(term)[:limit])
+        if len(results) >= limit:
+            return results
+
+        # Tam eşleşme limit'in altında; önek kümesinin ilk limit + tam eşleşme kadarı yeter
+        seen = set(results)
+        prefix = state.prefix_top(*state.prefix_range(term), limit + len(results))
+        for position in prefix:
+            if position not in seen:
+                results.append(position)
+                if len(results) >= limit:
+                    return results
+        if len(term) < 2:
+            return results
+
+        # Buraya gelindiyse önek eşleşmelerinin tamamı prefix içindedir
+        seen.update(prefix)
+        check = len(term) > 3
+        texts = state.texts
+        for position in state.candidates(term):
+            if position in seen or (check and term not in texts[position]):
+                continue
+            results.append(position)
+            if len(results) >= limit:
+                break
+        return results
+
+    def _search_terms(self, state, terms, limit):
+        """
+        Çok terimli arama: terimlerin aday listeleri kesiştirilir, kalanlar
+        tüm terimlerle doğrulanıp skor (seviyeler toplamı) ve pozisyona göre sıralanır.
+        """
+        candidates = sorted((state.candidates(term) for term in terms), key=len)
+        positions = set(candidates[0])
+        for other in candidates[1:]:
+            if not positions:
+                break
+            positions = positions.intersection(other)
+
+        texts = state.texts
+        scored = []
+        for position in positions:
+            text = texts[position]
+            score = 0
+            for term in terms:
+                level = _level(term, text)
+                if level is None:
+                    break
+                score += level
+            else:
+                scored.append((score, position))
+        return [position for _, position in heapq.nsmallest(limit, scored)]
+
+
+user_index = UserAutocompleteIndex()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=user_index.reset_after_fork)
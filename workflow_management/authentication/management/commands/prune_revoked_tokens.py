@@ -0,0 +1,13 @@
+# authentication/management/commands/prune_revoked_tokens.py
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from authentication.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = 'Süresi dolmuş iptal kayıtlarını siler (cron ile çalıştırılabilir)'
+    
+    def handle(self, *args, **options):
+        deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} süresi dolmuş kayıt silindi'))
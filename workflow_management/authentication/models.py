@@ -1,3 +1,32 @@
 from django.db import models
+from django.contrib.auth.models import User
 
-# Create your models here.
+
+class RevokedToken(models.Model):
+    """Çıkış veya rotasyon ile iptal edilen JWT'ler"""
+    
+    TOKEN_TYPE_CHOICES = [
+        ('access', 'Access'),
+        ('refresh', 'Refresh'),
+    ]
+    
+    jti = models.CharField(max_length=255, unique=True, verbose_name='Token ID')
+    token_type = models.CharField(max_length=10, choices=TOKEN_TYPE_CHOICES, verbose_name='Token Tipi')
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='revoked_tokens',
+        verbose_name='Kullanıcı'
+    )
+    expires_at = models.DateTimeField(db_index=True, verbose_name='Geçerlilik Sonu')
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='İptal Tarihi')
+    
+    def __str__(self):
+        return f"{self.token_type} - {self.jti}"
+    
+    class Meta:
+        verbose_name = 'İptal Edilen Token'
+        verbose_name_plural = 'İptal Edilen Tokenlar'
+        ordering = ['-revoked_at']
@@ -0,0 +1,11 @@
+# authentication/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """Kullanıcı listesi için cursor sayfalama - en yeni kayıt önce"""
+    # Aynı date_joined'e sahip kullanıcılar sayfa sınırında atlanmasın/tekrarlanmasın diye id ile tekilleştirilir
+    ordering = ('-date_joined', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,99 @@
+# authentication/revocation.py
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken
+
+
+class RevocationList:
+    """
+    İptal edilen token'ların süreç içi listesi.
+    Üyelik kontrolü bellekteki kümeden yapılır, her istekte veritabanına gidilmez.
+    Diğer worker'larda yapılan iptaller en geç SYNC_INTERVAL saniye içinde
+    artımlı olarak (önceki senkronizasyondan SYNC_OVERLAP saniye öncesinden beri
+    iptal edilenler) yüklenir.
+    
+    id'ye göre artımlı okuma, daha yüksek id'li satır okunduktan sonra commit edilen
+    düşük id'li satırı kalıcı olarak atlayabilir; revoked_at penceresi bu satırları
+    ve worker'lar arası küçük saat farklarını örtüşme payı içinde yakalar.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._expires = {}  # jti -> expires_at
+        self._sync_started_at = None  # Son senkronizasyonun başladığı an (duvar saati)
+        self._synced_at = None
+    
+    def _sync(self):
+        now = timezone.now()
+        queryset = RevokedToken.objects.filter(expires_at__gt=now)
+        if self._sync_started_at is not None:
+            since = self._sync_started_at - timedelta(seconds=settings.TOKEN_REVOCATION_SYNC_OVERLAP)
+            queryset = queryset.filter(revoked_at__gte=since)
+        
+        rows = list(queryset.values_list('jti', 'expires_at'))
+        
+        with self._lock:
+            self._expires.update(rows)
+            # Süresi dolmuş token'lar zaten geçersiz, bellekten at
+            self._expires = {jti: exp for jti, exp in self._expires.items() if exp > now}
+            self._sync_started_at = now
+            self._synced_at = time.monotonic()
+    
+    def _ensure_synced(self):
+        if self._synced_at is None or time.monotonic() - self._synced_at >= settings.TOKEN_REVOCATION_SYNC_INTERVAL:
+            self._sync()
+    
+    def invalidate(self):
+        """Bellekteki listeyi boşaltır; sonraki kontrol tam senkronizasyon yapar"""
+        with self._lock:
+            self._expires = {}
+            self._sync_started_at = None
+            self._synced_at = None
+    
+    def is_revoked(self, jti):
+        """Token iptal edilmiş mi? (bellekteki liste - diğer worker'lar en geç SYNC_INTERVAL gecikmeli)"""
+        if not jti:
+            return False
+        self._ensure_synced()
+        return jti in self._expires
+    
+    def is_revoked_in_db(self, jti):
+        """Kesin kontrol: bellekte yoksa veritabanına bakılır (refresh gibi seyrek istekler için)"""
+        if not jti:
+            return False
+        return self.is_revoked(jti) or RevokedToken.objects.filter(jti=jti).exists()
+    
+    def revoke(self, token, user=None):
+        """
+        Token'ı iptal eder ve bu worker'da hemen etkili kılar.
+        Satırı bu çağrı eklediyse True, token zaten iptal edilmişse False döner;
+        aynı refresh token ile eşzamanlı iki istekten yalnızca biri True alır.
+        """
+        jti = token[api_settings.JTI_CLAIM]
+        expires_at = datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+        
+        try:
+            _, created = RevokedToken.objects.get_or_create(
+                jti=jti,
+                defaults={
+                    'token_type': token.get(api_settings.TOKEN_TYPE_CLAIM, 'access'),
+                    'user': user,
+                    'expires_at': expires_at,
+                }
+            )
+        except IntegrityError:
+            created = False  # Aynı anda başka bir istekte iptal edilmiş
+        
+        with self._lock:
+            self._expires[jti] = expires_at
+        return created
+
+
+revocation_list = RevocationList()
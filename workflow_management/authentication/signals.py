@@ -0,0 +1,18 @@
+# authentication/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+from .autocomplete import user_index
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_index(sender, instance, **kwargs):
+    """
+    Kullanıcı eklendiğinde, güncellendiğinde veya silindiğinde arama indeksini yenile
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    
+    user_index.invalidate()
@@ -1,3 +1,288 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.autocomplete import MAX_RESULTS, user_index
+from authentication.models import RevokedToken
+from authentication.revocation import revocation_list
+from core.testing import AsyncParityMixin, QueryCountTestMixin, client_for, reset_caches
+from permissions.models import ColumnPermission, Role, SystemPermission, UserRole
+from permissions.sync import sync_role_permissions
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class LoginQueryCountTests(QueryCountTestMixin, TestCase):
+    """Giriş sırasında token'a gömülen yetkiler rol sayısından bağımsız sorgu ile hesaplanmalıdır"""
+
+    def setUp(self):
+        reset_caches()
+        self.user = User.objects.create_user('girisci', password='gizli-sifre')
+
+    def seed(self, size):
+        for index in range(Role.objects.count(), size):
+            role = Role.objects.create(name=f'Rol {index}')
+            sync_role_permissions(role, ColumnPermission, {
+                column: ('write', 'read', 'none')[(index + position) % 3]
+                for position, (column, _) in enumerate(ColumnPermission.COLUMN_CHOICES)
+            }, replace=True)
+            sync_role_permissions(role, SystemPermission, {'work_reorder': index % 2 == 0})
+            UserRole.objects.create(user=self.user, role=role)
+
+    def test_login(self):
+        client = APIClient()
+        credentials = {'username': 'girisci', 'password': 'gizli-sifre'}
+        self.assertConstantQueries(
+            self.seed, lambda: client.post('/api/auth/login/', credentials, format='json'), expected=4
+        )
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None, TOKEN_REVOCATION_SYNC_INTERVAL=0)
+class TokenRevocationTests(TestCase):
+    """Refresh rotasyonu, çıkış ve worker'lar arası iptal senkronizasyonu"""
+
+    def setUp(self):
+        reset_caches()
+        self.user = User.objects.create_user('iptalci', password='gizli-sifre')
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post(
+            '/api/auth/login/', {'username': 'iptalci', 'password': 'gizli-sifre'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def refresh(self, refresh_token):
+        return self.client.post('/api/auth/refresh/', {'refresh_token': refresh_token}, format='json')
+
+    def test_revoke_reports_first_insert_only(self):
+        token = RefreshToken.for_user(self.user)
+        self.assertTrue(revocation_list.revoke(token, self.user))
+        self.assertFalse(revocation_list.revoke(token, self.user))
+        self.assertTrue(revocation_list.is_revoked(token['jti']))
+        self.assertEqual(RevokedToken.objects.filter(jti=token['jti']).count(), 1)
+
+    def test_sync_picks_up_row_committed_after_previous_sync(self):
+        revocation_list.is_revoked('ilk-senkron')
+        # Başka bir worker'ın satırı, önceki senkronizasyondan önce zaman damgalı ama sonra commit edilmiş
+        token = RefreshToken.for_user(self.user)
+        RevokedToken.objects.create(
+            jti=token['jti'], token_type='refresh', user=self.user,
+            expires_at=revocation_list._sync_started_at + timedelta(days=1),
+        )
+        RevokedToken.objects.filter(jti=token['jti']).update(
+            revoked_at=revocation_list._sync_started_at - timedelta(seconds=5)
+        )
+        self.assertTrue(revocation_list.is_revoked(token['jti']))
+
+    def test_refresh_rotates_and_rejects_reuse(self):
+        tokens = self.login()
+        response = self.refresh(tokens['refresh_token'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.data['refresh_token'], tokens['refresh_token'])
+
+        self.assertEqual(self.refresh(tokens['refresh_token']).status_code, 401)
+        self.assertEqual(self.refresh(response.data['refresh_token']).status_code, 200)
+
+    def test_refresh_rejects_token_revoked_by_another_worker(self):
+        tokens = self.login()
+        revocation_list.is_revoked('ilk-senkron')
+        token = RefreshToken(tokens['refresh_token'])
+        RevokedToken.objects.create(
+            jti=token['jti'], token_type='refresh', user=self.user,
+            expires_at=revocation_list._sync_started_at + timedelta(days=1),
+        )
+        with override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=3600):
+            self.assertFalse(revocation_list.is_revoked(token['jti']))
+            self.assertEqual(self.refresh(tokens['refresh_token']).status_code, 401)
+
+    def test_concurrent_refresh_issues_one_pair(self):
+        tokens = self.login()
+        self.assertEqual(self.refresh(tokens['refresh_token']).status_code, 200)
+        # İkinci istek iptal kontrolünü ilk istek satırı eklemeden önce geçmiş gibi
+        with mock.patch.object(revocation_list, 'is_revoked_in_db', return_value=False):
+            response = self.refresh(tokens['refresh_token'])
+        self.assertEqual(response.status_code, 401)
+        self.assertNotIn('refresh_token', response.data)
+
+    def test_logout_revokes_access_and_refresh(self):
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}")
+        response = self.client.post('/api/auth/logout/', {'refresh_token': tokens['refresh_token']}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.client.get('/api/auth/users/search/', {'q': 'ip'}).status_code, 401)
+        self.client.credentials()
+        self.assertEqual(self.refresh(tokens['refresh_token']).status_code, 401)
+
+    def test_logout_ignores_refresh_token_of_another_user(self):
+        other = User.objects.create_user('baskasi', password='gizli-sifre')
+        other_refresh = RefreshToken.for_user(other)
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access_token']}")
+        self.client.post('/api/auth/logout/', {'refresh_token': str(other_refresh)}, format='json')
+
+        self.assertFalse(RevokedToken.objects.filter(jti=other_refresh['jti']).exists())
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class UserListTests(TestCase):
+    """Kullanıcı listesi: cursor sayfalama ve alan seçimi"""
+
+    URL = '/api/auth/users/'
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_user('yonetici', is_staff=True)
+        self.api = client_for(self.admin)
+
+    def test_pages_do_not_skip_users_with_same_date_joined(self):
+        joined = self.admin.date_joined
+        for index in range(5):
+            User.objects.create_user(f'ayni_{index}', date_joined=joined)
+
+        seen = []
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api.get(self.URL, {'page_size': 2, 'fields': 'id'})
+        # Eşit date_joined değerleri veritabanının keyfi sırasına bırakılmaz
+        self.assertTrue(any(
+            'ORDER BY "auth_user"."date_joined" DESC, "auth_user"."id" DESC' in query['sql'] for query in queries
+        ))
+        while True:
+            self.assertEqual(response.status_code, 200)
+            seen += [user['id'] for user in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.api.get(response.data['next'])
+        self.assertEqual(sorted(seen), sorted(User.objects.values_list('id', flat=True)))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_fields(self):
+        response = self.api.get(self.URL, {'fields': 'username, roles'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [{'username': 'yonetici', 'roles': []}])
+
+        response = self.api.get(self.URL, {'fields': 'username,password,sifre'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['errors']['field_errors'], {'fields': ['password', 'sifre']})
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None, USER_INDEX_BACKGROUND_REBUILD=False)
+class UserSearchTests(TestCase):
+    """Kullanıcı arama indeksi: Türkçe harf katlama, sıralama, limit ve yenileme"""
+
+    def setUp(self):
+        reset_caches()
+        self.searcher = User.objects.create_user('arayan', first_name='Zehra', last_name='Zorlu')
+        self.api = client_for(self.searcher)
+
+    def search(self, q, **params):
+        response = self.api.get('/api/auth/users/search/', {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [user['username'] for user in response.data['users']]
+
+    def test_turkish_case_folding(self):
+        User.objects.create_user('ismail', first_name='İsmail', last_name='Işık')
+        User.objects.create_user('sule', first_name='Şule', last_name='Çağlar')
+        for query in ('ismail', 'İSMAİL', 'ISMAIL', 'işık', 'IŞIK', 'isik'):
+            with self.subTest(query=query):
+                self.assertEqual(self.search(query), ['ismail'])
+        self.assertEqual(self.search('ŞULE çağ'), ['sule'])
+        self.assertEqual(self.search('cagla'), ['sule'])
+
+    def test_ranking_exact_prefix_infix(self):
+        User.objects.create_user('vali', first_name='Vali', last_name='Öz')
+        User.objects.create_user('alican', first_name='Alican', last_name='Demir')
+        User.objects.create_user('ali_b', first_name='Ali', last_name='Boz')
+        User.objects.create_user('ali_a', first_name='Ali', last_name='Akın')
+
+        # Tam eşleşmeler ad/soyad sırasıyla, sonra önek, sonra iç eşleşme
+        self.assertEqual(self.search('ali'), ['ali_a', 'ali_b', 'alican', 'vali'])
+        self.assertEqual(self.search('ali', limit=3), ['ali_a', 'ali_b', 'alican'])
+        # Çok terimli aramada tüm terimler eşleşmeli, seviye toplamı sıralar
+        self.assertEqual(self.search('ali boz'), ['ali_b'])
+        self.assertEqual(self.search('li de'), ['alican'])
+        self.assertEqual(self.search('ali xyz'), [])
+
+    def test_limit_is_capped(self):
+        User.objects.bulk_create([
+            User(username=f'kullanici{index:03}', first_name='Deniz', last_name=f'Soyad{index:03}')
+            for index in range(MAX_RESULTS + 10)
+        ])
+        user_index.invalidate()
+
+        self.assertEqual(len(self.search('deniz', limit=1000)), MAX_RESULTS)
+        self.assertEqual(len(self.search('deniz', limit='abc')), 20)
+        self.assertEqual(len(self.search('deniz', limit=0)), 1)
+        self.assertEqual(self.search('deniz', limit=2), ['kullanici000', 'kullanici001'])
+        self.assertEqual(len(self.search('', limit=5)), 5)
+
+    def test_user_changes_invalidate_index(self):
+        self.assertEqual(self.search('emre'), [])
+        user = User.objects.create_user('emre', first_name='Emre', last_name='Kaya')
+        self.assertEqual(self.search('emre'), ['emre'])
+
+        user.first_name = 'Mert'
+        user.save()
+        self.assertEqual(self.search('emre'), ['emre'])  # kullanıcı adı hâlâ eşleşiyor
+        self.assertEqual(self.search('mert kaya'), ['emre'])
+
+        user.is_active = False
+        user.save()
+        self.assertEqual(self.search('mert'), [])
+
+    def test_login_does_not_invalidate_index(self):
+        self.search('')
+        version = user_index._version
+        self.searcher.last_login = self.searcher.date_joined
+        self.searcher.save(update_fields=['last_login'])
+        self.search('')
+        self.assertEqual(user_index._version, version)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None, USER_INDEX_BACKGROUND_REBUILD=True)
+@override_settings(DATABASE_REPLICA_ALIAS=None, ASYNC_READ_VIEWS=True, USER_INDEX_BACKGROUND_REBUILD=False)
+class AsyncUserSearchTests(AsyncParityMixin, TransactionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.searcher = User.objects.create_user('arayan', first_name='Zehra', last_name='Zorlu')
+        User.objects.create_user('ismail', first_name='İsmail', last_name='Işık')
+        User.objects.create_user('ali', first_name='Ali', last_name='Akın')
+
+    def test_search(self):
+        for params in ({'q': 'ali'}, {'q': 'IŞIK'}, {'q': 'z', 'limit': 1}, {'q': 'a', 'limit': 'çok'}, {}):
+            with self.subTest(params=params):
+                self.assertSameResponse(self.searcher, '/api/auth/users/search/', params)
+
+    def test_unauthenticated(self):
+        self.assertSameResponse(None, '/api/auth/users/search/', {'q': 'ali'}, status_code=401)
+        self.assertSameResponse(
+            None, '/api/auth/users/search/', headers={'Authorization': 'Bearer bozuk'}, status_code=401
+        )
+
+
+class UserSearchBackgroundRebuildTests(TransactionTestCase):
+    """İlk kurulumdan sonra yeniden kurulum istek dışında, arka plan thread'inde yapılır"""
+
+    def setUp(self):
+        reset_caches()
+
+    def test_rebuild_runs_in_background(self):
+        User.objects.create_user('ilk', first_name='İlk', last_name='Kullanıcı')
+        self.assertEqual([user['username'] for user in user_index.search('ilk', 5)], ['ilk'])
+
+        User.objects.create_user('yeni', first_name='Yeni', last_name='Kullanıcı')
+        # Eski görüntüden cevaplanır, kurulum arka planda başlar
+        self.assertEqual([user['username'] for user in user_index.search('yeni', 5)], [])
+        thread = user_index._rebuild_thread
+        self.assertIsNotNone(thread)
+        thread.join(timeout=10)
+
+        self.assertEqual([user['username'] for user in user_index.search('yeni', 5)], ['yeni'])
@@ -1,11 +1,19 @@
 # authentication/urls.py
+from django.conf import settings
 from django.urls import path
-from .views import login_view, register_view, list_users, user_detail, search_users
+from .views import login_view, refresh_view, logout_view, register_view, list_users, user_detail, search_users
 
 urlpatterns = [
     path('login/', login_view, name='login'),
+    path('refresh/', refresh_view, name='token_refresh'),
+    path('logout/', logout_view, name='logout'),
     path('register/', register_view, name='register'),
     path('users/', list_users, name='list_users'),
     path('users/search/', search_users, name='search_users'),  # Yeni endpoint
     path('users/<int:pk>/', user_detail, name='user_detail'),
-]
\ No newline at end of file
+]
+
+if settings.ASYNC_READ_VIEWS:
+    # ASGI modunda arama async view ile karşılanır
+    from . import async_views
+    urlpatterns = async_views.urlpatterns + urlpatterns
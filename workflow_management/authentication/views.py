@@ -1,49 +1,51 @@
 # authentication/views.py
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from django.conf import settings
 from datetime import datetime, timezone
 from django.contrib.auth.models import User
-from django.db.models import Q
 from .serializers import LoginSerializer, UserSerializer, RegisterSerializer
 from .permissions import IsSuperUser
+from permissions.claims import add_permission_claims
+from .revocation import revocation_list
+from .autocomplete import MAX_RESULTS, user_index
+from .pagination import UserCursorPagination
+from permissions.models import UserRole
+
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = MAX_RESULTS
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def search_users(request):
-    """Kullanıcı arama - isim, soyisim veya username ile"""
-    search_term = request.query_params.get('q', '').strip()
-    limit = int(request.query_params.get('limit', 20))
-    
-    users_query = User.objects.filter(is_active=True)
-    
-    if search_term:
-        users_query = users_query.filter(
-            Q(first_name__icontains=search_term) |
-            Q(last_name__icontains=search_term) |
-            Q(username__icontains=search_term)
-        )
-    
-    users = users_query.order_by('first_name', 'last_name')[:limit]
-    
-    users_data = [{
-        'id': user.id,
-        'username': user.username,
-        'full_name': user.get_full_name() or user.username,
-        'email': user.email,
-        'display_name': f"{user.get_full_name() or user.username} ({user.username})",
-        'is_staff': user.is_staff
-    } for user in users]
+    """Kullanıcı arama - isim, soyisim veya username ile (önek ve iç eşleşme)"""
+    return Response(search_users_payload(request.query_params))
+
+
+def search_users_payload(params):
+    """Arama parametrelerinden yanıt verisini üretir (senkron ve async view ortak)"""
+    search_term = params.get('q', '').strip()
     
-    return Response({
+    try:
+        limit = int(params.get('limit', SEARCH_DEFAULT_LIMIT))
+    except (TypeError, ValueError):
+        limit = SEARCH_DEFAULT_LIMIT
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+    
+    users_data = user_index.search(search_term, limit)
+    
+    return {
         'message': f'{len(users_data)} kullanıcı bulundu',
         'users': users_data
-    })
+    }
 
 
 @api_view(['POST'])
@@ -56,6 +58,9 @@ def login_view(request):
         user = serializer.validated_data['user']
         refresh = RefreshToken.for_user(user)
         
+        # Yetkiler token'a gömülür, yetki kontrolleri veritabanına gitmez
+        access_token = add_permission_claims(refresh.access_token, user)
+        
         access_token_lifetime = settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME']
         refresh_token_lifetime = settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
         
@@ -63,7 +68,7 @@ def login_view(request):
         
         return Response({
             'message': 'Giriş başarılı',
-            'access_token': str(refresh.access_token),
+            'access_token': str(access_token),
             'refresh_token': str(refresh),
             'token_type': 'Bearer',
             'access_expires_at': (now + access_token_lifetime).isoformat(),
@@ -74,6 +79,72 @@ def login_view(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@authentication_classes([])  # Süresi dolmuş access token gönderilse de çalışmalı
+@permission_classes([AllowAny])
+def refresh_view(request):
+    """Refresh token ile yeni access token al"""
+    raw_token = request.data.get('refresh_token')
+    if not raw_token:
+        return Response({'message': 'refresh_token alanı gerekli'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        refresh = RefreshToken(raw_token)
+    except TokenError:
+        return Response({'message': 'Geçersiz veya süresi dolmuş refresh token'}, 
+                      status=status.HTTP_401_UNAUTHORIZED)
+    
+    # Diğer worker'lardaki iptaller bellekteki listeye gecikmeli düşer; refresh seyrek, veritabanına bakılır
+    if revocation_list.is_revoked_in_db(refresh.get(api_settings.JTI_CLAIM)):
+        return Response({'message': 'Refresh token iptal edilmiş. Lütfen tekrar giriş yapın.'}, 
+                      status=status.HTTP_401_UNAUTHORIZED)
+    
+    try:
+        user = User.objects.get(pk=refresh[api_settings.USER_ID_CLAIM], is_active=True)
+    except (User.DoesNotExist, KeyError):
+        return Response({'message': 'Kullanıcı bulunamadı veya aktif değil'}, 
+                      status=status.HTTP_401_UNAUTHORIZED)
+    
+    # Rotasyon: eski refresh token iptal edilir, yenisi verilir
+    if settings.SIMPLE_JWT.get('ROTATE_REFRESH_TOKENS'):
+        # İptal satırını ekleyemeyen istek (aynı token ile eşzamanlı refresh) yeni token alamaz
+        if settings.SIMPLE_JWT.get('BLACKLIST_AFTER_ROTATION') and not revocation_list.revoke(refresh, user):
+            return Response({'message': 'Refresh token iptal edilmiş. Lütfen tekrar giriş yapın.'}, 
+                          status=status.HTTP_401_UNAUTHORIZED)
+        refresh = RefreshToken.for_user(user)
+    
+    access_token = add_permission_claims(refresh.access_token, user)
+    now = datetime.now(timezone.utc)
+    
+    return Response({
+        'message': 'Token yenilendi',
+        'access_token': str(access_token),
+        'refresh_token': str(refresh),
+        'token_type': 'Bearer',
+        'access_expires_at': (now + settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME']).isoformat(),
+        'refresh_expires_at': datetime.fromtimestamp(refresh['exp'], tz=timezone.utc).isoformat(),
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def logout_view(request):
+    """Çıkış - access token ve (varsa) refresh token iptal edilir"""
+    revocation_list.revoke(request.auth, request.user)
+    
+    raw_refresh = request.data.get('refresh_token')
+    if raw_refresh:
+        try:
+            refresh = RefreshToken(raw_refresh)
+        except TokenError:
+            refresh = None  # Süresi dolmuş refresh token için yapılacak bir şey yok
+        
+        if refresh is not None and refresh.get(api_settings.USER_ID_CLAIM) == request.user.id:
+            revocation_list.revoke(refresh, request.user)
+    
+    return Response({'message': 'Çıkış yapıldı'})
+
+
 @api_view(['POST'])
 @permission_classes([IsSuperUser])
 def register_view(request):
@@ -90,53 +161,97 @@ def register_view(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+USER_LIST_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name',
+    'is_staff', 'is_superuser', 'is_active', 'date_joined', 'last_login', 'roles'
+)
+USER_DETAIL_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name',
+    'is_staff', 'is_active', 'date_joined', 'last_login'
+)
+
+
+def _parse_bool(value):
+    """Query param'daki true/false değerini çevirir, geçersizse None"""
+    if value is None:
+        return None
+    return {'true': True, '1': True, 'false': False, '0': False}.get(value.lower())
+
+
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def list_users(request):
-    """Tüm kullanıcıları listele"""
-    users = User.objects.all().order_by('-date_joined')
+    """
+    Kullanıcıları cursor sayfalama ile listele
+    Query params: is_active, is_staff, role (rol id), fields (virgülle ayrılmış alanlar),
+    page_size, cursor
+    """
+    params = request.query_params
+    
+    fields = [name.strip() for name in (params.get('fields') or '').split(',') if name.strip()]
+    invalid = [name for name in fields if name not in USER_LIST_FIELDS]
+    if invalid:
+        return Response({'message': 'Geçersiz alan', 'fields': invalid}, status=status.HTTP_400_BAD_REQUEST)
+    if not fields:
+        fields = list(USER_LIST_FIELDS)
+    
+    # Sayfalama için id ve date_joined her zaman çekilir
+    db_fields = {f for f in fields if f != 'roles'} | {'id', 'date_joined'}
+    users = User.objects.values(*db_fields)
     
-    users_data = [{
-        'id': user.id,
-        'username': user.username,
-        'email': user.email,
-        'first_name': user.first_name,
-        'last_name': user.last_name,
-        'is_staff': user.is_staff,
-        'is_superuser': user.is_superuser,
-        'is_active': user.is_active,
-        'date_joined': user.date_joined,
-        'last_login': user.last_login
-    } for user in users]
+    for field in ('is_active', 'is_staff'):
+        value = _parse_bool(params.get(field))
+        if value is not None:
+            users = users.filter(**{field: value})
     
-    return Response(users_data)
+    role = params.get('role')
+    if role:
+        if not role.isdigit():
+            return Response({'message': 'Geçersiz rol'}, status=status.HTTP_400_BAD_REQUEST)
+        users = users.filter(user_roles__role_id=role)
+    
+    paginator = UserCursorPagination()
+    page = paginator.paginate_queryset(users, request)
+    
+    if 'roles' in fields:
+        # Sayfadaki tüm kullanıcıların rolleri tek sorguda
+        roles_by_user = {}
+        user_roles = UserRole.objects.filter(
+            user_id__in=[row['id'] for row in page]
+        ).values_list('user_id', 'role_id', 'role__name')
+        for user_id, role_id, role_name in user_roles:
+            roles_by_user.setdefault(user_id, []).append({'id': role_id, 'name': role_name})
+    
+    users_data = []
+    for row in page:
+        item = {field: row[field] for field in fields if field != 'roles'}
+        if 'roles' in fields:
+            item['roles'] = roles_by_user.get(row['id'], [])
+        users_data.append(item)
+    
+    return paginator.get_paginated_response(users_data)
 
 
 @api_view(['GET', 'PATCH', 'DELETE'])
 @permission_classes([IsSuperUser])
 def user_detail(request, pk):
     """Kullanıcı detay, güncelleme ve silme"""
+    if request.method == 'GET':
+        # Kullanıcı ve rolleri tek sorguda (rol başına bir satır)
+        rows = list(User.objects.filter(pk=pk).values(*USER_DETAIL_FIELDS, 'user_roles__role_id'))
+        if not rows:
+            return Response({'message': 'Kullanıcı bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
+        
+        user_data = {field: rows[0][field] for field in USER_DETAIL_FIELDS}
+        user_data['roles'] = [row['user_roles__role_id'] for row in rows if row['user_roles__role_id'] is not None]
+        return Response(user_data)
+    
     try:
         user = User.objects.get(pk=pk)
     except User.DoesNotExist:
         return Response({'message': 'Kullanıcı bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
     
-    if request.method == 'GET':
-        user_data = {
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'is_staff': user.is_staff,
-            'is_active': user.is_active,
-            'date_joined': user.date_joined,
-            'last_login': user.last_login,
-            'roles': list(user.user_roles.values_list('role_id', flat=True))
-        }
-        return Response(user_data)
-    
-    elif request.method == 'PATCH':
+    if request.method == 'PATCH':
         data = request.data
         
         # Email benzersizlik kontrolü
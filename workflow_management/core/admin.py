@@ -1,3 +1,127 @@
-from django.contrib import admin
+# core/admin.py
+"""Büyük tablolarda admin listelerini hızlandıran ortak parçalar"""
+import datetime
+from functools import cache as memoize
 
-# Register your models here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Max, Min, QuerySet
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from core.db.estimates import estimated_row_count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Filtresiz listede tablo eşikten büyükse COUNT(*) yerine tahmini satır sayısı kullanır.
+    Tahmin gerçek sayıdan büyükse son sayfa boş görünebilir; filtreli listeler tam sayılır.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class DateHierarchyCacheMixin:
+    """
+    date_hierarchy sorgularını büyük tablolara uygun hale getirir:
+    - Filtresiz listede MIN/MAX sınırları cache'lenir.
+    - Yıl/ay/gün seçenekleri DISTINCT tarih sorgusu (satır başına tarih kesme, tam tarama)
+      yerine sınırlar arasındaki takvimden üretilir; kaydı olmayan günler de listelenebilir.
+    """
+    date_hierarchy_field = None
+
+    def _is_hierarchy_field(self, expression):
+        sources = expression.get_source_expressions()
+        return len(sources) == 1 and getattr(sources[0], 'name', None) == self.date_hierarchy_field
+
+    def aggregate(self, *args, **kwargs):
+        if not (
+            not args and set(kwargs) == {'first', 'last'}
+            and isinstance(kwargs['first'], Min) and isinstance(kwargs['last'], Max)
+            and self._is_hierarchy_field(kwargs['first']) and self._is_hierarchy_field(kwargs['last'])
+        ):
+            return super().aggregate(*args, **kwargs)
+
+        # Aynı liste içinde takvim üretimi sınırları yeniden sorgulamaz
+        if getattr(self, '_hierarchy_bounds', None) is None:
+            if self.query.where:
+                self._hierarchy_bounds = super().aggregate(**kwargs)
+            else:
+                key = f'admin_date_hierarchy:{self.model._meta.label_lower}:{self.date_hierarchy_field}'
+                self._hierarchy_bounds = cache.get_or_set(
+                    key,
+                    lambda: super(DateHierarchyCacheMixin, self).aggregate(**kwargs),
+                    settings.ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT
+                )
+        return dict(self._hierarchy_bounds)
+
+    def _calendar(self, field_name, kind, as_datetime):
+        field = self.date_hierarchy_field
+        bounds = self.aggregate(first=Min(field), last=Max(field))
+        first, last = bounds['first'], bounds['last']
+        if not (first and last):
+            return []
+        if isinstance(first, datetime.datetime):
+            if timezone.is_aware(first):
+                first, last = timezone.localtime(first), timezone.localtime(last)
+            first, last = first.date(), last.date()
+
+        if kind == 'year':
+            values = [datetime.date(year, 1, 1) for year in range(first.year, last.year + 1)]
+        elif kind == 'month':
+            values = [
+                datetime.date(index // 12, index % 12 + 1, 1)
+                for index in range(first.year * 12 + first.month - 1, last.year * 12 + last.month)
+            ]
+        else:
+            values = [first + datetime.timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+        if not as_datetime:
+            return values
+        values = [datetime.datetime.combine(value, datetime.time()) for value in values]
+        if settings.USE_TZ:
+            values = [timezone.make_aware(value) for value in values]
+        return values
+
+    def dates(self, field_name, kind, *args, **kwargs):
+        if field_name != self.date_hierarchy_field or kind not in ('year', 'month', 'day'):
+            return super().dates(field_name, kind, *args, **kwargs)
+        return self._calendar(field_name, kind, as_datetime=False)
+
+    def datetimes(self, field_name, kind, *args, **kwargs):
+        if field_name != self.date_hierarchy_field or kind not in ('year', 'month', 'day'):
+            return super().datetimes(field_name, kind, *args, **kwargs)
+        return self._calendar(field_name, kind, as_datetime=True)
+
+
+@memoize
+def _date_hierarchy_queryset_class(queryset_class, field_name):
+    return type(
+        f'DateHierarchyCache{queryset_class.__name__}',
+        (DateHierarchyCacheMixin, queryset_class),
+        {'date_hierarchy_field': field_name}
+    )
+
+
+class LargeTableAdminMixin:
+    """
+    Milyonlarca satırlık tablolar için ModelAdmin ayarları:
+    tahmini sayfa sayısı, tam sayım kapalı ve tarama yapmayan date_hierarchy.
+    list_select_related ve indeksli search_fields ayrıca her admin'de tanımlanmalıdır.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.date_hierarchy:
+            queryset.__class__ = _date_hierarchy_queryset_class(queryset.__class__, self.date_hierarchy)
+        return queryset
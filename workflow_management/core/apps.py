@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+    
+    def ready(self):
+        # Signal'leri import et
+        import core.signals
+        
+        # Serializer sürelerini istek ölçümlerine bağla
+        from core.timing import instrument_serializers
+        instrument_serializers()
@@ -0,0 +1,105 @@
+# core/async_views.py
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+READ_METHODS = ('GET',)
+
+
+def _authenticate(request, permission_class):
+    """
+    DRF kimlik doğrulama sınıflarını senkron çalıştırır (JWT çözme, kullanıcı cache'i).
+    Başarısızlıkta None döner; hata yanıtı senkron view'a bırakılır.
+    """
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        try:
+            result = authentication_class().authenticate(request)
+        except exceptions.APIException:
+            return None
+        if result is not None:
+            request.user, request.auth = result
+            break
+    else:
+        return None
+
+    if not permission_class().has_permission(request, None):
+        return None
+    return request.user
+
+
+def _allowed_methods(sync_view):
+    """Senkron view'ın Allow başlığı (APIView.allowed_methods ile aynı hesap)"""
+    view = sync_view.cls(**sync_view.initkwargs)
+    actions = getattr(sync_view, 'actions', None) or {}
+    for method in actions:
+        setattr(view, method, getattr(view, actions[method]))
+    if hasattr(view, 'get') and not hasattr(view, 'head'):
+        view.head = view.get
+    return ', '.join(view.allowed_methods)
+
+
+def render_response(request, data, allow, status=200):
+    """
+    Veriyi DRF içerik müzakeresiyle seçilen renderer ile zarflayıp HTTP yanıtına çevirir
+    (APIView.finalize_response ile aynı başlıklar). Kabul edilebilir renderer yoksa None.
+    """
+    renderers = [renderer_class() for renderer_class in api_settings.DEFAULT_RENDERER_CLASSES]
+    drf_request = Request(request)
+    try:
+        renderer, media_type = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS().select_renderer(
+            drf_request, renderers
+        )
+    except exceptions.NotAcceptable:
+        return None
+    response = Response(data, status=status)
+    response.accepted_renderer = renderer
+    response.accepted_media_type = media_type
+    response.renderer_context = {'view': None, 'args': (), 'kwargs': {}, 'request': drf_request}
+    response['Allow'] = allow
+    if len(renderers) > 1:
+        response['Vary'] = 'Accept'
+    return response.render()
+
+
+def async_read_view(read_handler, sync_view, permission_class=IsAuthenticated):
+    """
+    GET isteklerini async handler ile, diğer metodları senkron DRF view'ı ile karşılar.
+
+    read_handler(request, user, **kwargs) bir coroutine'dir ve yanıt verisini döndürür.
+    Veritabanı okumaları async ORM ile yapılır; serializer ve yetki filtresi gibi
+    senkron kısımlar handler içinde sync_to_async ile thread havuzunda çalışır.
+    Kimlik doğrulama/yetki hatası, kayıt bulunamaması, geçersiz parametre ya da kabul
+    edilemeyen Accept başlığı durumunda istek senkron view'a devredilir; hata yanıtları
+    DRF exception handler'ından geçer ve birebir aynı kalır.
+    """
+    sync_handler = sync_to_async(sync_view)
+    allow = _allowed_methods(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method not in READ_METHODS:
+            return await sync_handler(request, *args, **kwargs)
+
+        user = await sync_to_async(_authenticate)(request, permission_class)
+        if user is None:
+            return await sync_handler(request, *args, **kwargs)
+
+        try:
+            data = await read_handler(request, user, *args, **kwargs)
+        except (ObjectDoesNotExist, Http404, exceptions.APIException):
+            # Hata yanıtı DRF exception handler'ından geçsin
+            return await sync_handler(request, *args, **kwargs)
+
+        response = render_response(request, data, allow)
+        if response is None:
+            return await sync_handler(request, *args, **kwargs)
+        return response
+
+    view.__name__ = getattr(read_handler, '__name__', 'async_read_view')
+    view.__doc__ = read_handler.__doc__
+    return csrf_exempt(view)
@@ -0,0 +1,191 @@
+# core/benchmarks.py
+"""
+Uç nokta ölçüm senaryoları (manage.py run_benchmarks).
+
+Her senaryo Django test Client'ı ile süreç içinde çalışır; ağ ve sunucu
+maliyeti dahil değildir, view + serializer + ORM + render ölçülür.
+Sonuçlar commit'ler arasında karşılaştırılabilecek JSON olarak yazılır.
+"""
+import random
+import statistics
+import time
+import tracemalloc
+from contextlib import ExitStack
+from datetime import date, timedelta
+
+from django.db import connections
+from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from permissions.claims import add_permission_claims
+from workflows.models import Work
+
+
+class QueryCounter:
+    """Tüm veritabanı bağlantılarındaki sorguları sayan execute_wrapper"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class BenchmarkContext:
+    """Senaryoların paylaştığı istemci, kullanıcı ve deterministik iş id'leri"""
+
+    def __init__(self, user, seed=42, host='localhost', sample_size=500):
+        self.user = user
+        self.rng = random.Random(seed)
+        token = add_permission_claims(RefreshToken.for_user(user).access_token, user)
+        # 500 yanıtları istisna olarak fırlatılmaz, durum kodu olarak raporlanır
+        self.client = Client(raise_request_exception=False, SERVER_NAME=host, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        work_ids = list(Work.objects.order_by('id').values_list('id', flat=True)[:sample_size * 4])
+        if not work_ids:
+            raise ValueError('Ölçüm için iş kaydı yok (generate_synthetic_data çalıştırın)')
+        self.work_ids = self.rng.sample(work_ids, min(sample_size, len(work_ids)))
+        self.iteration = 0
+
+    def work_id(self):
+        return self.work_ids[self.iteration % len(self.work_ids)]
+
+
+# Senaryolar isteği hazırlayıp çağrılabilir döndürür; hazırlık sorguları ölçüme girmez
+
+def _list(ctx):
+    return lambda: ctx.client.get('/api/workflows/')
+
+
+def _retrieve(ctx):
+    work_id = ctx.work_id()
+    return lambda: ctx.client.get(f'/api/workflows/{work_id}/')
+
+
+def _update(ctx):
+    path = f'/api/workflows/{ctx.work_id()}/'
+    data = {'note': f'benchmark {ctx.iteration}'}
+    return lambda: ctx.client.patch(path, data, content_type='application/json')
+
+
+def _set_priority(ctx):
+    path = f'/api/workflows/{ctx.work_id()}/set_priority/'
+    data = {'priority': ctx.rng.randint(1, 1000)}
+    return lambda: ctx.client.post(path, data, content_type='application/json')
+
+
+def _reorder_bulk(ctx):
+    # Örneklemdeki 20 işin mevcut sıraları kendi aralarında döndürülür
+    ids = [ctx.work_ids[(ctx.iteration + offset) % len(ctx.work_ids)] for offset in range(20)]
+    priorities = dict(Work.objects.filter(id__in=ids).values_list('id', 'priority'))
+    rotated = ids[1:] + ids[:1]
+    payload = [{'id': work_id, 'priority': priorities[other]} for work_id, other in zip(ids, rotated)]
+    return lambda: ctx.client.post('/api/workflows/reorder_bulk/', {'reorder': payload}, content_type='application/json')
+
+
+def _add_confirmation(ctx):
+    # Sentetik verideki tarihlerle çakışmayan benzersiz bir tarih
+    confirmation_date = date(2090, 1, 1) + timedelta(days=ctx.iteration)
+    path = f'/api/workflows/{ctx.work_id()}/add_confirmation/'
+    data = {'date': confirmation_date.isoformat(), 'text': 'benchmark'}
+    return lambda: ctx.client.post(path, data, content_type='application/json')
+
+
+def _movements(ctx):
+    return lambda: ctx.client.get('/api/movements/')
+
+
+def _search_users(ctx):
+    params = {'q': ctx.rng.choice(['ah', 'ayşe', 'yıl', 'syn', 'de'])}
+    return lambda: ctx.client.get('/api/auth/users/search/', params)
+
+
+def _my_permissions(ctx):
+    return lambda: ctx.client.get('/api/permissions/my-work-permissions/')
+
+
+def _roles(ctx):
+    return lambda: ctx.client.get('/api/permissions/roles/')
+
+
+# ad: (fonksiyon, ağır mı) - ağır senaryolar tüm tabloyu döndürür, daha az tekrarlanır
+SCENARIOS = {
+    'list': (_list, True),
+    'retrieve': (_retrieve, False),
+    'update': (_update, False),
+    'set_priority': (_set_priority, False),
+    'reorder_bulk': (_reorder_bulk, False),
+    'add_confirmation': (_add_confirmation, False),
+    'movements': (_movements, True),
+    'search_users': (_search_users, False),
+    'my_permissions': (_my_permissions, False),
+    'roles': (_roles, False),
+}
+
+
+def percentile(sorted_values, percent):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method='inclusive')[percent - 1]
+
+
+def run_scenario(ctx, name, iterations, warmup=2, memory_iterations=3):
+    """
+    Senaryoyu çalıştırıp gecikme yüzdelikleri, sorgu sayıları ve tepe bellek kullanımını döndürür.
+    Bellek ölçümü (tracemalloc) gecikmeyi bozduğu için ayrı turlarda yapılır.
+    """
+    func, _ = SCENARIOS[name]
+
+    for _ in range(warmup):
+        func(ctx)()
+        ctx.iteration += 1
+
+    latencies = []
+    query_counts = []
+    statuses = {}
+    for _ in range(iterations):
+        send = func(ctx)
+        counter = QueryCounter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(counter))
+            started = time.perf_counter()
+            response = send()
+            latencies.append(time.perf_counter() - started)
+        query_counts.append(counter.count)
+        statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+        ctx.iteration += 1
+
+    peaks = []
+    for _ in range(memory_iterations):
+        send = func(ctx)
+        tracemalloc.start()
+        try:
+            send()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+        ctx.iteration += 1
+
+    latencies.sort()
+    milliseconds = [value * 1000 for value in latencies]
+    return {
+        'iterations': iterations,
+        'status_codes': statuses,
+        'latency_ms': {
+            'min': round(milliseconds[0], 2),
+            'p50': round(percentile(milliseconds, 50), 2),
+            'p90': round(percentile(milliseconds, 90), 2),
+            'p95': round(percentile(milliseconds, 95), 2),
+            'p99': round(percentile(milliseconds, 99), 2),
+            'max': round(milliseconds[-1], 2),
+            'mean': round(statistics.fmean(milliseconds), 2),
+        },
+        'queries': {
+            'min': min(query_counts),
+            'median': statistics.median(query_counts),
+            'max': max(query_counts),
+        },
+        'peak_memory_kib': round(max(peaks) / 1024, 1) if peaks else None,
+    }
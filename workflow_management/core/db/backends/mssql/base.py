@@ -0,0 +1,11 @@
+# core/db/backends/mssql/base.py
+from mssql.base import DatabaseWrapper as MSSQLDatabaseWrapper
+
+from core.db.backends.pooled import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, MSSQLDatabaseWrapper):
+    """
+    Havuzlu SQL Server backend'i.
+    Şifreli ODBC bağlantısının (TLS el sıkışması) her istekte yeniden kurulmasını önler.
+    """
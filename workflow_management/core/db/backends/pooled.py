@@ -0,0 +1,39 @@
+# core/db/backends/pooled.py
+from core.db.pool import get_pool
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Django bağlantı sarmalayıcısına havuz desteği ekler.
+    Bağlantı açma isteği havuzdan checkout, kapatma isteği havuza iade olur.
+    Ayarlar DATABASES[alias]['POOL'] sözlüğünden okunur (bkz. core.db.pool.DEFAULT_POOL_OPTIONS).
+    İstek sonunda bağlantının iade edilmesi için CONN_MAX_AGE = 0 kullanılmalıdır.
+    """
+
+    def _get_pool(self):
+        key = (self.alias, str(self.settings_dict['NAME']))
+        return get_pool(key, self.settings_dict.get('POOL'))
+
+    def get_new_connection(self, conn_params):
+        return self._get_pool().checkout(lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(conn_params))
+
+    _discard_on_close = False
+
+    def discard(self):
+        """Bağlantıyı havuza iade etmeden kapatır (oturum durumu bozulmuşsa)"""
+        self._discard_on_close = True
+        try:
+            self.close()
+        finally:
+            self._discard_on_close = False
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # Transaction ortasında kapatılan ya da hata almış bağlantı havuza dönmez
+        discard = (
+            self._discard_on_close or self.in_atomic_block
+            or (self.errors_occurred and not self.is_usable())
+        )
+        with self.wrap_database_errors:
+            self._get_pool().checkin(self.connection, discard=discard)
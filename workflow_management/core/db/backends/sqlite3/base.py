@@ -0,0 +1,8 @@
+# core/db/backends/sqlite3/base.py
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+
+from core.db.backends.pooled import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, SQLiteDatabaseWrapper):
+    """Havuzlu SQLite backend'i - havuz davranışını yerelde denemek için"""
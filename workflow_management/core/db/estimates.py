@@ -0,0 +1,61 @@
+# core/db/estimates.py
+"""
+Büyük tablolar için tahmini satır sayısı.
+
+COUNT(*) milyonlarca satırda tüm indeksi tarar; istatistik tablolarından
+okunan değer sabit sürede döner. Veritabanı desteklemiyorsa None döner,
+çağıran tam sayıma geri düşer.
+"""
+import logging
+
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+
+def _mssql_estimate(cursor, table):
+    # Heap (0) veya clustered index (1) satır sayısı; partition'lar toplanır
+    cursor.execute(
+        'SELECT SUM(row_count) FROM sys.dm_db_partition_stats '
+        'WHERE object_id = OBJECT_ID(%s) AND index_id IN (0, 1)',
+        [table]
+    )
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _sqlite_estimate(cursor, table):
+    # ANALYZE çalıştırılmışsa sqlite_stat1'in (tablo ya da indeks satırı) ilk alanı satır sayısıdır
+    try:
+        cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [table])
+        row = cursor.fetchone()
+    except DatabaseError:
+        row = None
+    if row and row[0]:
+        return int(row[0].split()[0])
+
+    # İstatistik yoksa rowid aralığı; iki uç B-tree'den okunur, aradaki silinmiş satırlar kadar fazla sayar
+    cursor.execute(f'SELECT (SELECT MAX(rowid) FROM "{table}") - (SELECT MIN(rowid) FROM "{table}") + 1')
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+ESTIMATORS = {
+    'microsoft': _mssql_estimate,
+    'sqlite': _sqlite_estimate,
+}
+
+
+def estimated_row_count(model, using='default'):
+    """Modelin tablosu için tahmini satır sayısı; desteklenmiyorsa None"""
+    connection = connections[using]
+    estimator = ESTIMATORS.get(connection.vendor)
+    if estimator is None:
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            return estimator(cursor, model._meta.db_table)
+    except DatabaseError:
+        logger.warning('Tahmini satır sayısı okunamadı: %s', model._meta.db_table, exc_info=True)
+        return None
@@ -0,0 +1,238 @@
+# core/db/pool.py
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_OPTIONS = {
+    'SIZE': 5,             # process başına en fazla açık bağlantı
+    'TIMEOUT': 10,         # havuz doluyken bağlantı bekleme süresi (saniye)
+    'MAX_LIFETIME': 1800,  # bağlantının en uzun kullanım süresi (saniye)
+    'PRE_PING': True,      # boşta bekleyen bağlantıyı vermeden önce SELECT 1
+    'PING_AFTER': 5,       # en az bu kadar boşta kalan bağlantılar ping'lenir (saniye)
+}
+
+
+class PoolTimeout(Exception):
+    """Havuzda süresi içinde boş bağlantı bulunamadı"""
+
+
+class PooledConnection:
+    """Ham DB-API bağlantısı ve yaşam bilgisi"""
+    __slots__ = ('connection', 'created_at', 'returned_at')
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = self.returned_at = time.monotonic()
+
+
+class ConnectionPool:
+    """
+    Process içi, thread-safe bağlantı havuzu.
+
+    checkout(connect) boş bağlantı yoksa connect() ile yenisini açar. Boşta bekleyen
+    bağlantılar LIFO sırasıyla verilir, az kullanılanlar zamanla MAX_LIFETIME ile elenir.
+    İstatistikler stats() ile okunur (checkout, bekleme, hata sayıları).
+    """
+
+    def __init__(self, name, size=5, timeout=10, max_lifetime=1800, pre_ping=True, ping_after=5):
+        self.name = name
+        self.size = size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.pre_ping = pre_ping
+        self.ping_after = ping_after
+
+        self._condition = threading.Condition()
+        self._idle = []
+        self._checked_out = {}
+        self._open = 0
+        self._stats = {
+            'checkouts': 0,
+            'checkins': 0,
+            'created': 0,
+            'discarded': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'timeouts': 0,
+            'ping_failures': 0,
+            'connect_failures': 0,
+        }
+
+    @classmethod
+    def from_settings(cls, name, options):
+        options = {**DEFAULT_POOL_OPTIONS, **(options or {})}
+        return cls(
+            name,
+            size=int(options['SIZE']),
+            timeout=float(options['TIMEOUT']),
+            max_lifetime=float(options['MAX_LIFETIME']),
+            pre_ping=bool(options['PRE_PING']),
+            ping_after=float(options['PING_AFTER']),
+        )
+
+    def _expired(self, pooled, now):
+        return self.max_lifetime and now - pooled.created_at > self.max_lifetime
+
+    def _ping(self, connection):
+        cursor = connection.cursor()
+        try:
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _discard(self, pooled):
+        """Bağlantıyı kapatıp sayacı düşürür (kilit dışında çağrılır)"""
+        with self._condition:
+            self._open -= 1
+            self._stats['discarded'] += 1
+            self._condition.notify()
+        try:
+            pooled.connection.close()
+        except Exception:
+            pass
+
+    def checkout(self, connect):
+        """Havuzdan sağlıklı bir ham bağlantı döndürür, gerekirse connect() ile açar"""
+        while True:
+            pooled = None
+            with self._condition:
+                deadline = None
+                while not self._idle and self._open >= self.size:
+                    now = time.monotonic()
+                    if deadline is None:
+                        deadline = now + self.timeout
+                        self._stats['waits'] += 1
+                        wait_started = now
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeout(
+                            f"'{self.name}' bağlantı havuzu dolu ({self.size}), {self.timeout}s beklendi"
+                        )
+                    self._condition.wait(remaining)
+                if deadline is not None:
+                    self._stats['wait_seconds'] += time.monotonic() - wait_started
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    # Yer ayırıp bağlantıyı kilit dışında aç
+                    self._open += 1
+
+            if pooled is None:
+                try:
+                    pooled = PooledConnection(connect())
+                except Exception:
+                    with self._condition:
+                        self._open -= 1
+                        self._stats['connect_failures'] += 1
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self._stats['created'] += 1
+            else:
+                now = time.monotonic()
+                if self._expired(pooled, now):
+                    self._discard(pooled)
+                    continue
+                if self.pre_ping and now - pooled.returned_at >= self.ping_after:
+                    try:
+                        self._ping(pooled.connection)
+                    except Exception:
+                        logger.warning("'%s' havuzunda kopmuş bağlantı atıldı", self.name)
+                        with self._condition:
+                            self._stats['ping_failures'] += 1
+                        self._discard(pooled)
+                        continue
+
+            with self._condition:
+                self._checked_out[id(pooled.connection)] = pooled
+                self._stats['checkouts'] += 1
+            return pooled.connection
+
+    def checkin(self, connection, discard=False):
+        """Bağlantıyı havuza iade eder; açık transaction geri alınır"""
+        with self._condition:
+            pooled = self._checked_out.pop(id(connection), None)
+        if pooled is None:
+            # Bu havuza ait değil (ör. fork öncesi açılmış)
+            try:
+                connection.close()
+            except Exception:
+                pass
+            return
+
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+
+        if discard or self._expired(pooled, time.monotonic()):
+            self._discard(pooled)
+            return
+
+        pooled.returned_at = time.monotonic()
+        with self._condition:
+            self._idle.append(pooled)
+            self._stats['checkins'] += 1
+            self._condition.notify()
+
+    def close_idle(self):
+        """Boştaki tüm bağlantıları kapatır"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._discard(pooled)
+
+    def stats(self):
+        with self._condition:
+            return {
+                **self._stats,
+                'size': self.size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': len(self._checked_out),
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key, options):
+    """Anahtar (alias, veritabanı adı) için process'e ait havuzu döndürür"""
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = ConnectionPool.from_settings(f'{key[0]}:{key[1]}', options)
+    return pool
+
+
+def all_pool_stats():
+    """Bu process'teki tüm havuzların istatistikleri {'alias:db': {...}}"""
+    return {pool.name: pool.stats() for pool in list(_pools.values())}
+
+
+def close_idle_connections():
+    """Bu process'teki tüm havuzların boştaki bağlantılarını kapatır (fork öncesi)"""
+    for pool in list(_pools.values()):
+        pool.close_idle()
+
+
+def _reset_after_fork():
+    # Fork öncesi açılmış bağlantılar child process'te paylaşılmamalı;
+    # kapatmadan bırakılır (soket parent'a ait), havuzlar sıfırdan kurulur
+    global _pools_lock
+    _pools.clear()
+    _pools_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
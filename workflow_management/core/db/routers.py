@@ -0,0 +1,117 @@
+# core/db/routers.py
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import SimpleLazyObject, empty
+
+# Replikasyon gecikmesinden etkilenmemesi gereken uygulamalar her zaman primary'den okunur
+PRIMARY_ONLY_APPS = {'sessions'}
+
+
+class RoutingState:
+    """İstek boyunca okuma yönlendirmesini belirleyen durum"""
+    __slots__ = ('request', 'use_replica', 'wrote', 'sticky')
+
+    def __init__(self, request=None, use_replica=False):
+        self.request = request
+        self.use_replica = use_replica
+        self.wrote = False
+        self.sticky = None
+
+
+_state = ContextVar('replica_routing_state', default=None)
+
+
+def replica_alias():
+    """Tanımlıysa replica veritabanı alias'ı, yoksa None"""
+    alias = getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica')
+    return alias if alias in settings.DATABASES else None
+
+
+def _sticky_key(user_id):
+    return f'replica_sticky:{user_id}'
+
+
+def mark_sticky(user_id):
+    """Kullanıcının okumaları bir süre primary'den yapılır (read-your-writes)"""
+    cache.set(_sticky_key(user_id), 1, settings.REPLICA_STICKY_SECONDS)
+
+
+def is_sticky(user_id):
+    return cache.get(_sticky_key(user_id)) is not None
+
+
+def begin_request(request, use_replica):
+    return _state.set(RoutingState(request, use_replica))
+
+
+def end_request(token):
+    state = _state.get()
+    _state.reset(token)
+    return state
+
+
+@contextmanager
+def use_primary():
+    """Blok içindeki okumaları primary'ye yönlendirir"""
+    token = _state.set(RoutingState(use_replica=False))
+    try:
+        yield
+    finally:
+        _state.reset(token)
+
+
+def request_user_id(request, resolve=True):
+    user = getattr(request, 'user', None)
+    # Oturum kullanıcısı tembel yüklenir; router içinden çözülürse kendi sorgusu
+    # yeniden router'a girer (sonsuz özyineleme). Çözülene kadar bilinmiyor sayılır.
+    if not resolve and isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return None
+    if user is not None and user.is_authenticated:
+        return user.pk
+    return None
+
+
+class ReplicaRouter:
+    """
+    Güvenli (GET/HEAD) isteklerdeki okumaları replica'ya, diğer her şeyi primary'ye yönlendirir.
+    - Replica tanımlı değilse tüm sorgular primary'ye gider.
+    - İstek dışı (yönetim komutları, shell) okumalar primary'den yapılır.
+    - Yazma yapan kullanıcı REPLICA_STICKY_SECONDS boyunca primary'den okur.
+    - Primary'de açık bir transaction varsa okumalar da primary'den yapılır.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote:
+            return None
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+
+        alias = replica_alias()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+
+        if state.sticky is None and state.request is not None:
+            # Kullanıcı kimliği view içinde doğrulanır; belli olunca bir kez kontrol edilir
+            user_id = request_user_id(state.request, resolve=False)
+            if user_id is not None:
+                state.sticky = is_sticky(user_id)
+        if state.sticky:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
@@ -0,0 +1,197 @@
+# core/db/slow_queries.py
+"""
+Yavaş sorgu kaydı.
+
+RequestTimings (core/timing.py) her sorgunun süresini ölçer; view'a ait eşiği
+aşan sorgular istek boyunca biriktirilir ve yanıt döndükten sonra
+'core.slow_queries' logger'ına tek satırlık JSON olarak yazılır. Plan (EXPLAIN)
+istek bittikten sonra alınır, böylece açık cursor'lar ve transaction etkilenmez.
+
+Rapor: manage.py slow_query_report
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import traceback
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+
+from django.conf import settings
+
+logger = logging.getLogger('core.slow_queries')
+
+# Yığın izinde gösterilmeyecek dosyalar (kütüphaneler ve ölçüm katmanı)
+_SKIPPED_PATHS = ('site-packages', 'dist-packages', 'core/db/', 'core/timing.py', 'core/middleware.py')
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+MAX_STACK_FRAMES = 8
+MAX_PARAMS = 50
+
+
+def normalize_sql(sql):
+    """Literal'leri ve IN listelerini yer tutucuya indirger; aynı şekildeki sorgular aynı metni verir"""
+    normalized = _STRING_LITERAL.sub('?', sql)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = normalized.replace('%s', '?')
+    normalized = _PLACEHOLDER_LIST.sub('(...)', normalized)
+    return _WHITESPACE.sub(' ', normalized).strip()
+
+
+def fingerprint(normalized_sql):
+    return hashlib.sha1(normalized_sql.encode('utf-8')).hexdigest()[:16]
+
+
+def _redact(value):
+    # Sayı, tarih ve boolean değerler kimlik/filtre bilgisidir, metinler kişisel veri içerebilir
+    if value is None or isinstance(value, (bool, int, float, Decimal)):
+        return value
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return f'<redacted len={len(value)}>'
+    return f'<{type(value).__name__}>'
+
+
+def redact_params(params, many=False):
+    if params is None:
+        return None
+    if many:
+        # executemany: yalnızca satır sayısı ve ilk satır
+        params = list(params)
+        return {'rows': len(params), 'first': redact_params(params[0]) if params else None}
+    if isinstance(params, dict):
+        return {key: _redact(value) for key, value in list(params.items())[:MAX_PARAMS]}
+    return [_redact(value) for value in list(params)[:MAX_PARAMS]]
+
+
+def capture_stack():
+    """Proje koduna ait son çağrı çerçeveleri (view, serializer, yetki katmanı)"""
+    frames = []
+    for frame in traceback.extract_stack()[:-2]:
+        filename = frame.filename
+        if not filename.startswith(str(settings.BASE_DIR)) or any(path in filename for path in _SKIPPED_PATHS):
+            continue
+        frames.append(f'{os.path.relpath(filename, settings.BASE_DIR)}:{frame.lineno} {frame.name}')
+    return frames[-MAX_STACK_FRAMES:]
+
+
+def threshold_for(view_name):
+    """View'a özel eşik (saniye); tanımlı değilse SLOW_QUERY_THRESHOLD_MS. Kayıt kapalıysa None"""
+    if not settings.SLOW_QUERY_LOG_ENABLED:
+        return None
+    milliseconds = settings.SLOW_QUERY_THRESHOLDS.get(view_name, settings.SLOW_QUERY_THRESHOLD_MS)
+    return milliseconds / 1000
+
+
+class SlowQuery:
+    """İstek içinde eşiği aşan bir sorgu"""
+    __slots__ = ('sql', 'params', 'many', 'duration', 'alias', 'vendor', 'stack')
+
+    def __init__(self, sql, params, many, duration, connection):
+        self.sql = sql
+        self.params = params
+        self.many = many
+        self.duration = duration
+        self.alias = connection.alias
+        self.vendor = connection.vendor
+        self.stack = capture_stack()
+
+
+# Plan sorgusu önekleri; SQL Server SHOWPLAN_TEXT oturum ayarı ile ayrıca ele alınır
+_EXPLAIN_PREFIXES = {
+    'sqlite': 'EXPLAIN QUERY PLAN',
+    'postgresql': 'EXPLAIN',
+    'mysql': 'EXPLAIN',
+}
+
+
+def _plan_lines(cursor):
+    return [' '.join(str(column) for column in row if column is not None) for row in cursor.fetchall()]
+
+
+def _discard_connection(connection):
+    """Oturum ayarı geri alınamayan bağlantıyı havuza iade etmeden kapatır"""
+    discard = getattr(connection, 'discard', None)
+    try:
+        if discard is not None:
+            discard()
+        else:
+            connection.close()
+    except Exception:
+        logger.exception("'%s' bağlantısı kapatılamadı", connection.alias)
+
+
+def explain(slow_query):
+    """Sorgunun çalıştırma planını metin satırları olarak döndürür; yalnızca SELECT'ler için"""
+    from django.db import connections
+
+    if slow_query.many or not slow_query.sql.lstrip().upper().startswith('SELECT'):
+        return None
+    showplan = slow_query.vendor == 'microsoft'
+    if not showplan and slow_query.vendor not in _EXPLAIN_PREFIXES:
+        return None
+
+    connection = connections[slow_query.alias]
+    if connection.connection is None:
+        return None
+
+    # Backend cursor'ı: execute_wrapper'lardan geçmez, ölçümlere karışmaz
+    cursor = connection.create_cursor()
+    showplan_on = reset_failed = False
+    try:
+        if not showplan:
+            cursor.execute(f'{_EXPLAIN_PREFIXES[slow_query.vendor]} {slow_query.sql}', slow_query.params)
+            return _plan_lines(cursor)
+
+        # SHOWPLAN_TEXT açıkken sorgu çalışmaz; ilk sonuç kümesi sorgu metni, ikincisi plandır
+        cursor.execute('SET SHOWPLAN_TEXT ON')
+        showplan_on = True
+        cursor.execute(slow_query.sql, slow_query.params)
+        if not cursor.nextset():
+            return []
+        return _plan_lines(cursor)
+    except Exception as exc:
+        return [f'plan alınamadı: {exc}']
+    finally:
+        if showplan_on:
+            # Ayar geri alınmazsa bağlantıdaki sonraki her sorgu satır yerine plan döndürür
+            try:
+                cursor.execute('SET SHOWPLAN_TEXT OFF')
+            except Exception:
+                logger.exception("'%s' bağlantısında SHOWPLAN_TEXT kapatılamadı", slow_query.alias)
+                reset_failed = True
+        try:
+            cursor.close()
+        except Exception:
+            reset_failed = reset_failed or showplan_on
+        if reset_failed:
+            _discard_connection(connection)
+
+
+def flush(slow_queries, request, view_name):
+    """Biriken yavaş sorguları log'a yazar (istek sonunda çağrılır)"""
+    explain_limit = settings.SLOW_QUERY_EXPLAIN_LIMIT if settings.SLOW_QUERY_EXPLAIN else 0
+    # En yavaş sorgular önce; plan yalnızca ilk birkaçı için alınır
+    for index, slow_query in enumerate(sorted(slow_queries, key=lambda q: q.duration, reverse=True)):
+        normalized = normalize_sql(slow_query.sql)
+        record = {
+            'fingerprint': fingerprint(normalized),
+            'duration_ms': round(slow_query.duration * 1000, 1),
+            'view': view_name,
+            'method': request.method,
+            'path': request.path,
+            'request_id': getattr(request, 'request_id', None),
+            'alias': slow_query.alias,
+            'sql': normalized,
+            'params': redact_params(slow_query.params, slow_query.many),
+            'stack': slow_query.stack,
+        }
+        if index < explain_limit:
+            record['plan'] = explain(slow_query)
+        logger.warning(json.dumps(record, default=str, ensure_ascii=False))
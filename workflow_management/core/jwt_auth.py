@@ -1,7 +1,68 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
 from rest_framework import exceptions
 
+from core import metrics
+
+
+# Cache'e yalnızca yetki kontrolü için gereken alanlar yazılır; parola hash'i cache'e girmez.
+# Sıra modeldeki alan sırasıdır (Model.from_db değerleri bu sırada bekler).
+CACHED_USER_FIELDS = tuple(
+    field.attname for field in User._meta.concrete_fields
+    if field.attname in {'id', 'username', 'is_active', 'is_superuser', 'is_staff'}
+)
+
+
+def _user_version_key(user_id):
+    return f'auth_user:{user_id}:version'
+
+
+def _user_cache_key(user_id, version):
+    return f'auth_user:{user_id}:v{version}:fields'
+
+
+def get_user_cache_version(user_id):
+    """Kullanıcının cache sürümü; kullanıcı değiştikçe invalidate_cached_user ile artar"""
+    return cache.get(_user_version_key(user_id), 0)
+
+
+def get_cached_user(user_id, version):
+    """
+    Cache'teki alanlardan kullanıcıyı oluşturur, yoksa None.
+    Diğer alanlar (ad, e-posta, parola...) ertelenmiştir, erişildiğinde veritabanından okunur.
+    """
+    values = cache.get(_user_cache_key(user_id, version))
+    metrics.record_cache('auth_user', values is not None)
+    if values is None:
+        return None
+    return User.from_db(router.db_for_read(User), CACHED_USER_FIELDS, values)
+
+
+def cache_user(user, version):
+    """
+    Doğrulanmış kullanıcının CACHED_USER_FIELDS alanlarını kısa süreliğine cache'e yazar.
+    version veritabanından okumadan önce alınmalıdır: okuma sırasında kullanıcı
+    değişirse eski veri eski sürüme yazılır ve bir sonraki istekte okunmaz.
+    """
+    user_id = getattr(user, api_settings.USER_ID_FIELD)
+    values = tuple(getattr(user, field) for field in CACHED_USER_FIELDS)
+    cache.set(_user_cache_key(user_id, version), values, settings.AUTH_USER_CACHE_TIMEOUT)
+
+
+def invalidate_cached_user(user_id):
+    """Kullanıcı sürümünü artırarak eski cache kayıtlarını geçersiz kılar"""
+    try:
+        cache.incr(_user_version_key(user_id))
+    except ValueError:
+        cache.set(_user_version_key(user_id), 1, None)
+
 
 class CustomJWTAuthentication(JWTAuthentication):
     """JWT Authentication with Turkish error messages"""
@@ -11,7 +72,8 @@ class CustomJWTAuthentication(JWTAuthentication):
         'invalid': ('Geçersiz token. Lütfen tekrar giriş yapın.', 'invalid_token'),
         'not found': ('Token bulunamadı. Lütfen giriş yapın.', 'token_not_found'),
         'default': ('Kimlik doğrulama başarısız. Lütfen tekrar giriş yapın.', 'authentication_failed'),
-        'format': ('Geçersiz token formatı.', 'invalid_token_format')
+        'format': ('Geçersiz token formatı.', 'invalid_token_format'),
+        'revoked': ('Token iptal edilmiş. Lütfen tekrar giriş yapın.', 'token_revoked')
     }
     
     def authenticate(self, request):
@@ -32,4 +94,47 @@ class CustomJWTAuthentication(JWTAuthentication):
             
         except TokenError:
             message, code = self.ERROR_MESSAGES['format']
-            raise exceptions.AuthenticationFailed(detail=message, code=code)
\ No newline at end of file
+            raise exceptions.AuthenticationFailed(detail=message, code=code)
+    
+    def get_validated_token(self, raw_token):
+        """İptal edilmiş token'ları bellekteki liste üzerinden reddeder"""
+        from authentication.revocation import revocation_list
+        
+        validated_token = super().get_validated_token(raw_token)
+        if revocation_list.is_revoked(validated_token.get(api_settings.JTI_CLAIM)):
+            message, code = self.ERROR_MESSAGES['revoked']
+            raise exceptions.AuthenticationFailed(detail=message, code=code)
+        return validated_token
+    
+    def get_user(self, validated_token):
+        """Kullanıcıyı her istekte veritabanından çekmek yerine cache'ten okur"""
+        from permissions.claims import apply_permission_claims
+        
+        user = self._get_user(validated_token)
+        apply_permission_claims(user, validated_token)
+        return user
+    
+    def _get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        
+        version = get_user_cache_version(user_id)
+        user = get_cached_user(user_id, version)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache_user(user, version)
+            return user
+        
+        # Cache'ten gelen kullanıcı için simplejwt ile aynı kontroller
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Parola cache'lenmez; bu kontrol açıksa ertelenmiş alan veritabanından okunur
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise exceptions.AuthenticationFailed(
+                    _("The user's password has been changed."), code='password_changed'
+                )
+        
+        return user
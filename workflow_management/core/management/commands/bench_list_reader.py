@@ -0,0 +1,64 @@
+# core/management/commands/bench_list_reader.py
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from workflows.models import Work
+from workflows.readers import work_list_reader
+from workflows.serializer import WorkflowSerializer
+from workflows.views import WORK_RELATED_FIELDS
+
+
+class Command(BaseCommand):
+    help = (
+        'İş listesinde WorkflowSerializer ile values_list() tabanlı WorkListReader yolunu karşılaştırır. '
+        'Mevcut kayıtları kullanır (generate_synthetic_data); önce çıktıların aynı olduğu doğrulanır.'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Listedeki iş sayısı')
+        parser.add_argument('--repeat', type=int, default=5, help='Tekrar sayısı')
+    
+    def timeit(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        return timings[len(timings) // 2], timings[0]
+    
+    def handle(self, *args, **options):
+        rows = options['rows']
+        models = lambda: list(Work.objects.select_related(*WORK_RELATED_FIELDS)[:rows])
+        tuples = lambda: list(work_list_reader.queryset(Work.objects.all())[:rows])
+        
+        instances, values = models(), tuples()
+        if not instances:
+            raise CommandError('Ölçüm için iş kaydı yok (generate_synthetic_data çalıştırın)')
+        expected = WorkflowSerializer(instances, many=True).data
+        if json.dumps(work_list_reader.serialize(values)) != json.dumps(expected):
+            raise CommandError('Çıktılar aynı değil')
+        
+        phases = {
+            'serileştirme': (
+                lambda: WorkflowSerializer(instances, many=True).data,
+                lambda: work_list_reader.serialize(values),
+            ),
+            'sorgu+serileştirme': (
+                lambda: WorkflowSerializer(models(), many=True).data,
+                lambda: work_list_reader.serialize(tuples()),
+            ),
+        }
+        for name, (baseline, fast) in phases.items():
+            base_median, base_best = self.timeit(baseline, options['repeat'])
+            fast_median, fast_best = self.timeit(fast, options['repeat'])
+            self.stdout.write(
+                f'{name:<20} {len(instances):>6} satır  '
+                f'serializer: {base_median * 1000:8.1f} ms (en iyi {base_best * 1000:.1f})  '
+                f'reader: {fast_median * 1000:8.1f} ms (en iyi {fast_best * 1000:.1f})  '
+                f'x{base_median / fast_median:.1f}'
+            )
+        
+        self.stdout.write(self.style.SUCCESS('Çıktılar aynı'))
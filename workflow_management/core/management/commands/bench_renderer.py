@@ -0,0 +1,107 @@
+# core/management/commands/bench_renderer.py
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.renderers import CustomJSONRenderer, FastCustomJSONRenderer
+
+
+class FixedResponse:
+    """Renderer context için sahte response"""
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class Command(BaseCommand):
+    help = 'CustomJSONRenderer ile FastCustomJSONRenderer performansını karşılaştırır'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Listedeki iş sayısı')
+        parser.add_argument('--repeat', type=int, default=20, help='Tekrar sayısı')
+        parser.add_argument('--seed', type=int, default=42)
+    
+    def build_rows(self, count, seed):
+        """WorkflowSerializer çıktısına benzeyen sentetik satırlar"""
+        rnd = random.Random(seed)
+        start = date(2024, 1, 1)
+        rows = []
+        for i in range(1, count + 1):
+            day = (start + timedelta(days=rnd.randint(0, 500))).isoformat()
+            rows.append({
+                'id': i,
+                'name': f'İş {i} – Özel baskı çalışması',
+                'category': rnd.randint(1, 20),
+                'price': round(rnd.uniform(10, 10000), 2),
+                'type': rnd.randint(1, 10),
+                'sales_channel': rnd.randint(1, 5),
+                'designer': rnd.randint(1, 200),
+                'designer_text': None,
+                'design_start_date': day,
+                'design_end_date': None,
+                'confirmations': [{'date': day, 'text': 'Onaylandı', 'added_by': 'Ayşe Şahin (3)'}],
+                'material_info': 'Kuşe kağıt, 350 gr',
+                'printing_locations': [{'location': 'Hat 1', 'added_at': f'{day}T10:00:00+03:00'}],
+                'printing_confirm': rnd.random() < 0.5,
+                'printing_control': False,
+                'links': [{'url': f'https://example.com/is/{i}', 'title': 'Dosya'}],
+                'note': None,
+                'priority': i,
+                'created': f'{day}T09:30:00.123456+03:00',
+                'status_code': 'waiting',
+                'status_text': 'Beklemede',
+                'status_color': '#6c757d',
+                'category_detail': {'id': 1, 'name': 'Kartvizit'},
+                'designer_detail': {'id': 3, 'username': 'ayse', 'full_name': 'Ayşe Şahin', 'email': 'a@b.c'},
+                'category_name': 'Kartvizit',
+                'designer_name': 'Ayşe Şahin',
+                'confirm_date': day,
+            })
+        return rows
+    
+    def timeit(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        return timings[len(timings) // 2], timings[0]
+    
+    def handle(self, *args, **options):
+        rows = self.build_rows(options['rows'], options['seed'])
+        payloads = {
+            'list': rows,
+            'dict': {'message': 'Liste', 'results': rows},
+            'error': {'name': ['Bu alan zorunludur.'], 'detail': 'Hata'},
+        }
+        
+        baseline = CustomJSONRenderer()
+        fast = FastCustomJSONRenderer()
+        # Karşılaştırma için zaman damgası sabitlenir
+        baseline._get_timestamp = fast._get_timestamp = lambda: '2024-01-01T00:00:00.000000'
+        
+        for name, payload in payloads.items():
+            status_code = 400 if name == 'error' else 200
+            context = {'response': FixedResponse(status_code)}
+            
+            expected = baseline.render(payload, renderer_context=context)
+            actual = fast.render(payload, renderer_context=context)
+            streamed = b''.join(fast.iter_render(payload, renderer_context=context))
+            if not (expected == actual == streamed):
+                raise CommandError(f'{name}: çıktılar aynı değil')
+            
+            base_median, base_best = self.timeit(
+                lambda: baseline.render(payload, renderer_context=context), options['repeat'])
+            fast_median, fast_best = self.timeit(
+                lambda: fast.render(payload, renderer_context=context), options['repeat'])
+            
+            self.stdout.write(
+                f'{name:<6} {len(expected):>10} byte  '
+                f'mevcut: {base_median * 1000:8.2f} ms (en iyi {base_best * 1000:.2f})  '
+                f'hızlı: {fast_median * 1000:8.2f} ms (en iyi {fast_best * 1000:.2f})  '
+                f'x{base_median / fast_median:.1f}'
+            )
+        
+        self.stdout.write(self.style.SUCCESS('Çıktılar byte-byte aynı'))
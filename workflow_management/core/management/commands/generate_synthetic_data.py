@@ -0,0 +1,248 @@
+# core/management/commands/generate_synthetic_data.py
+import random
+import time
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from authentication.autocomplete import user_index
+from permissions.models import ColumnPermission, Role, SystemPermission, UserRole
+from permissions.sync import sync_role_permissions
+from workflows.lookups import MODEL_ID_MAPS
+from workflows.models import Category, Movement, SalesChannel, Work, WorkType
+
+PREFIX = 'synthetic'
+BASE_DATE = date(2024, 1, 1)
+
+FIRST_NAMES = ['Ahmet', 'Ayşe', 'Mehmet', 'Fatma', 'Mustafa', 'Zeynep', 'Emre', 'Elif', 'Can', 'Deniz', 'Burak', 'Selin']
+LAST_NAMES = ['Yılmaz', 'Kaya', 'Demir', 'Şahin', 'Çelik', 'Yıldız', 'Aydın', 'Öztürk', 'Arslan', 'Doğan']
+PRODUCTS = ['Kutu', 'Etiket', 'Broşür', 'Katalog', 'Afiş', 'Ambalaj', 'Kartvizit', 'Poşet', 'Menü', 'Davetiye']
+LOCATIONS = ['Ana Tesis', 'Depo 2', 'Fason A', 'Fason B', 'Ofset Hattı', 'Dijital Baskı']
+ACTIONS = ['create', 'update', 'update', 'update', 'update', 'delete']
+ACTION_VERBS = {'create': 'oluşturuldu', 'update': 'güncellendi', 'delete': 'silindi'}
+
+# Rol profilleri: kolon başına (none, read, write) ağırlıkları
+ROLE_PROFILES = {
+    'viewer': (2, 8, 0),
+    'editor': (1, 4, 5),
+    'restricted': (6, 4, 0),
+    'designer': (2, 5, 3),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Performans ölçümü için deterministik sentetik veri üretir (aynı --seed aynı içeriği verir): '
+        'JSON alt koleksiyonlu işler, hareket kayıtları, farklı kolon yetki matrisli roller ve kullanıcılar. '
+        'Örnek: manage.py generate_synthetic_data --works 100000 --movements 2000000'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--works', type=int, default=100_000)
+        parser.add_argument('--movements', type=int, default=2_000_000)
+        parser.add_argument('--users', type=int, default=300)
+        parser.add_argument('--roles', type=int, default=12)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--password', default='synthetic', help='Üretilen kullanıcıların şifresi')
+        parser.add_argument('--reset', action='store_true', help='Önceki sentetik verileri silip yeniden üretir')
+        parser.add_argument('--force', action='store_true', help='DEBUG kapalıyken de çalıştır')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError('DEBUG kapalı; production veritabanında çalıştırmamak için --force gerekir')
+
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        started = time.perf_counter()
+
+        if options['reset']:
+            self._reset()
+        elif User.objects.filter(username__startswith=f'{PREFIX}_').exists():
+            raise CommandError('Sentetik veri zaten var; yeniden üretmek için --reset kullanın')
+
+        dropdowns = self._create_dropdowns()
+        roles = self._create_roles(options['roles'])
+        users = self._create_users(options['users'], roles, options['password'])
+        work_ids = self._create_works(options['works'], dropdowns, users)
+        self._create_movements(options['movements'], work_ids, users)
+
+        # Toplu yazmalar sinyal tetiklemez; süreç içi haritalar ve arama indeksi yenilenir
+        for id_map in MODEL_ID_MAPS.values():
+            id_map.invalidate()
+        user_index.invalidate()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Tamamlandı ({time.perf_counter() - started:.1f}s). Yönetici: {PREFIX}_admin / {options["password"]}'
+        ))
+
+    def _reset(self):
+        self.stdout.write('Önceki sentetik veriler siliniyor...')
+        with transaction.atomic():
+            works = Work.objects.filter(name__startswith=f'{PREFIX.title()} ')
+            Movement.objects.filter(work__in=works).delete()
+            Movement.objects.filter(user__username__startswith=f'{PREFIX}_').delete()
+            works.delete()
+            User.objects.filter(username__startswith=f'{PREFIX}_').delete()
+            Role.objects.filter(name__startswith=f'{PREFIX.title()} ').delete()
+            for model in (Category, WorkType, SalesChannel):
+                model.objects.filter(name__startswith=f'{PREFIX.title()} ').delete()
+
+    def _create_dropdowns(self):
+        dropdowns = {}
+        for model, label, count in ((Category, 'Kategori', 15), (WorkType, 'Tip', 8), (SalesChannel, 'Kanal', 6)):
+            dropdowns[model] = [
+                model.objects.get_or_create(name=f'{PREFIX.title()} {label} {index:02d}', defaults={'order': index})[0]
+                for index in range(1, count + 1)
+            ]
+        return dropdowns
+
+    def _create_roles(self, count):
+        column_names = [choice[0] for choice in ColumnPermission.COLUMN_CHOICES]
+        permission_types = [choice[0] for choice in SystemPermission.PERMISSION_TYPE_CHOICES]
+        profiles = sorted(ROLE_PROFILES)
+
+        roles = []
+        for index in range(1, count + 1):
+            profile = profiles[(index - 1) % len(profiles)]
+            role = Role.objects.create(name=f'{PREFIX.title()} Rol {index:02d} ({profile})')
+            weights = ROLE_PROFILES[profile]
+            matrix = {
+                column: self.rng.choices(('none', 'read', 'write'), weights=weights)[0]
+                for column in column_names
+            }
+            sync_role_permissions(role, ColumnPermission, matrix, replace=True)
+            sync_role_permissions(role, SystemPermission, {
+                permission_type: profile == 'editor' or self.rng.random() < 0.3
+                for permission_type in permission_types
+            })
+            roles.append(role)
+        self.stdout.write(f'{len(roles)} rol')
+        return roles
+
+    def _create_users(self, count, roles, password):
+        # Hash bir kez hesaplanır; tüm kullanıcılar aynı şifreyi kullanır
+        password_hash = make_password(password)
+        users = [User(
+            username=f'{PREFIX}_admin', email=f'{PREFIX}_admin@example.com',
+            first_name='Sentetik', last_name='Yönetici',
+            is_staff=True, is_superuser=True, password=password_hash,
+        )]
+        for index in range(1, count + 1):
+            first_name = self.rng.choice(FIRST_NAMES)
+            last_name = self.rng.choice(LAST_NAMES)
+            users.append(User(
+                username=f'{PREFIX}_user_{index:05d}',
+                email=f'{PREFIX}_user_{index:05d}@example.com',
+                first_name=first_name,
+                last_name=last_name,
+                is_active=self.rng.random() > 0.05,
+                password=password_hash,
+            ))
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        users = list(User.objects.filter(username__startswith=f'{PREFIX}_user_').order_by('username'))
+
+        user_roles = []
+        for user in users:
+            for role in self.rng.sample(roles, self.rng.randint(1, min(3, len(roles)))):
+                user_roles.append(UserRole(user=user, role=role))
+        UserRole.objects.bulk_create(user_roles, batch_size=self.batch_size)
+        self.stdout.write(f'{len(users) + 1} kullanıcı, {len(user_roles)} rol ataması')
+        return users
+
+    def _random_date(self, max_days=700):
+        return BASE_DATE + timedelta(days=self.rng.randint(0, max_days))
+
+    def _build_work(self, index, dropdowns, users):
+        rng = self.rng
+        designer = rng.choice(users) if rng.random() < 0.7 else None
+        design_start = self._random_date()
+        printing_confirm = rng.random() < 0.6
+        stock_entry = printing_confirm and rng.random() < 0.5
+
+        confirmations = []
+        for offset in sorted(rng.sample(range(1, 60), rng.randint(0, 4))):
+            confirmations.append({
+                'date': (design_start + timedelta(days=offset)).isoformat(),
+                'text': rng.choice([None, 'Müşteri onayı', 'Renk onayı', 'Prova onayı']),
+                'added_by': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                'added_at': f'{(design_start + timedelta(days=offset)).isoformat()}T10:00:00',
+            })
+        links = [
+            {'url': f'https://files.example.com/{PREFIX}/{index}/{link}', 'title': f'Dosya {link + 1}', 'description': None}
+            for link in range(rng.randint(0, 3))
+        ]
+        printing_locations = [
+            {'location': location, 'description': None, 'added_by': 'Sentetik', 'added_at': f'{design_start.isoformat()}T09:00:00'}
+            for location in rng.sample(LOCATIONS, rng.randint(0, 2))
+        ]
+
+        work = Work(
+            name=f'{PREFIX.title()} {rng.choice(PRODUCTS)} {index:06d}',
+            category=rng.choice(dropdowns[Category]),
+            type=rng.choice(dropdowns[WorkType]) if rng.random() < 0.9 else None,
+            sales_channel=rng.choice(dropdowns[SalesChannel]) if rng.random() < 0.8 else None,
+            price=round(rng.uniform(50, 25000), 2),
+            designer=designer,
+            designer_text=None if designer else rng.choice([None, f'{rng.choice(FIRST_NAMES)} (dış)']),
+            design_start_date=design_start,
+            design_end_date=design_start + timedelta(days=rng.randint(1, 20)),
+            confirmations=confirmations,
+            priority=index,
+            material_info=rng.choice([None, '350gr kuşe', 'Kraft', 'Oluklu mukavva 3mm']),
+            printing_locations=printing_locations,
+            printing_confirm=printing_confirm,
+            printing_control=printing_confirm and rng.random() < 0.7,
+            printing_start_date=design_start + timedelta(days=rng.randint(5, 30)) if printing_confirm else None,
+            stock_entry=stock_entry,
+            shipping_date=design_start + timedelta(days=rng.randint(20, 60)) if stock_entry else None,
+            links=links,
+            note=rng.choice([None, None, 'Acil', 'Numune gönderilecek']),
+        )
+        # bulk_create save() çağırmaz
+        work.refresh_derived_fields()
+        return work
+
+    def _create_works(self, count, dropdowns, users):
+        # Öncelikler mevcut işlerin arkasına eklenir
+        offset = Work.objects.order_by('-priority').values_list('priority', flat=True).first() or 0
+        for start in range(0, count, self.batch_size):
+            batch = [
+                self._build_work(offset + index, dropdowns, users)
+                for index in range(start + 1, min(start + self.batch_size, count) + 1)
+            ]
+            with transaction.atomic():
+                Work.objects.bulk_create(batch)
+            self.stdout.write(f'  iş {start + len(batch)}/{count}', ending='\r')
+        self.stdout.write(f'{count} iş' + ' ' * 20)
+        return list(Work.objects.filter(name__startswith=f'{PREFIX.title()} ').values_list('id', 'name'))
+
+    def _create_movements(self, count, works, users):
+        rng = self.rng
+        for start in range(0, count, self.batch_size):
+            batch = []
+            for _ in range(min(self.batch_size, count - start)):
+                user = rng.choice(users)
+                work_id, work_name = rng.choice(works)
+                action = rng.choice(ACTIONS)
+                changes = None
+                if action == 'update':
+                    old_priority = rng.randint(1, len(works))
+                    changes = {'old': {'priority': str(old_priority)}, 'new': {'priority': str(old_priority + rng.randint(1, 50))}}
+                batch.append(Movement(
+                    user=user,
+                    user_fullname=f'{user.first_name} {user.last_name}',
+                    work_id=None if action == 'delete' else work_id,
+                    work_name=work_name,
+                    action=action,
+                    description=f'{work_name} isimli iş {ACTION_VERBS[action]}',
+                    changes=changes,
+                ))
+            with transaction.atomic():
+                Movement.objects.bulk_create(batch)
+            self.stdout.write(f'  hareket {start + len(batch)}/{count}', ending='\r')
+        self.stdout.write(f'{count} hareket' + ' ' * 20)
@@ -0,0 +1,88 @@
+# core/management/commands/load_test.py
+import http.client
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class Command(BaseCommand):
+    help = (
+        'Çalışan bir sunucuya eşzamanlı GET istekleri gönderir (WSGI ve ASGI kurulumlarını '
+        'karşılaştırmak için). Örnek: manage.py load_test http://127.0.0.1:8000 '
+        '--path /api/workflows/ --path /api/categories/ --concurrency 200 --requests 5000 --user admin'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('base_url', help='Sunucu adresi, örn. http://127.0.0.1:8000')
+        parser.add_argument('--path', action='append', dest='paths', help='İstek yolu (birden fazla verilebilir)')
+        parser.add_argument('--concurrency', type=int, default=50, help='Eşzamanlı bağlantı sayısı')
+        parser.add_argument('--requests', type=int, default=1000, help='Toplam istek sayısı')
+        parser.add_argument('--user', help='Token üretilecek kullanıcı adı')
+        parser.add_argument('--token', help='Hazır access token')
+        parser.add_argument('--timeout', type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        parts = urlsplit(options['base_url'])
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            raise CommandError('Geçersiz base_url')
+
+        token = options['token']
+        if not token and options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Kullanıcı bulunamadı: {options['user']}")
+            token = str(RefreshToken.for_user(user).access_token)
+
+        headers = {'Accept': 'application/json', 'Connection': 'keep-alive'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+
+        paths = options['paths'] or ['/api/workflows/']
+        total = options['requests']
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        local = threading.local()
+
+        def send(index):
+            # Her thread kendi keep-alive bağlantısını kullanır
+            connection = getattr(local, 'connection', None)
+            if connection is None:
+                connection = local.connection = connection_class(parts.netloc, timeout=options['timeout'])
+            path = paths[index % len(paths)]
+            started = time.perf_counter()
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                local.connection = None
+                status = 0
+            return path, status, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            results = list(executor.map(send, range(total)))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{total} istek, eşzamanlılık {options['concurrency']}, süre {elapsed:.2f}s, "
+            f"{total / elapsed:.1f} istek/s"
+        )
+        for path in paths:
+            latencies = sorted(duration for p, _, duration in results if p == path)
+            errors = sum(1 for p, status, _ in results if p == path and not 200 <= status < 300)
+            if not latencies:
+                continue
+            quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            self.stdout.write(
+                f"{path}: p50 {quantiles[49] * 1000:.1f}ms, p95 {quantiles[94] * 1000:.1f}ms, "
+                f"p99 {quantiles[98] * 1000:.1f}ms, max {latencies[-1] * 1000:.1f}ms, hata {errors}"
+            )
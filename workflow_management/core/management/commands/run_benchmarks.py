@@ -0,0 +1,107 @@
+# core/management/commands/run_benchmarks.py
+import json
+import platform
+import subprocess
+from datetime import datetime
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.benchmarks import SCENARIOS, BenchmarkContext, run_scenario
+from workflows.models import Movement, Work
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Sık kullanılan uç noktaları süreç içinde ölçer; gecikme yüzdelikleri, sorgu sayıları ve tepe '
+        'bellek kullanımını JSON olarak yazar. Yazma senaryoları veriyi değiştirir, sentetik veritabanında '
+        'çalıştırın. Örnek: manage.py run_benchmarks --output bench.json --compare onceki.json'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenario', action='append', dest='scenarios', choices=sorted(SCENARIOS))
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--heavy-iterations', type=int, default=5, help='Tüm tabloyu dönen senaryolar için')
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--user', default='synthetic_admin', help='İstekleri yapan kullanıcı')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--host', default='localhost', help='ALLOWED_HOSTS içinde olmalı')
+        parser.add_argument('--output', help='JSON sonuç dosyası (verilmezse stdout)')
+        parser.add_argument('--compare', help='Önceki bir sonuç dosyası; p50/p95 ve sorgu farkları yazdırılır')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"Kullanıcı bulunamadı: {options['user']}")
+
+        try:
+            ctx = BenchmarkContext(user, seed=options['seed'], host=options['host'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        results = {
+            'meta': {
+                'commit': _git_commit(),
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'user': user.username,
+                'is_superuser': user.is_superuser,
+                'dataset': {
+                    'works': Work.objects.count(),
+                    'movements': Movement.objects.count(),
+                    'users': User.objects.count(),
+                },
+            },
+            'scenarios': {},
+        }
+
+        for name in options['scenarios'] or list(SCENARIOS):
+            heavy = SCENARIOS[name][1]
+            iterations = options['heavy_iterations'] if heavy else options['iterations']
+            self.stderr.write(f'{name} ({iterations} tekrar)...')
+            results['scenarios'][name] = run_scenario(ctx, name, iterations, warmup=options['warmup'])
+
+        output = json.dumps(results, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                handle.write(output)
+        else:
+            self.stdout.write(output)
+
+        if options['compare']:
+            self._compare(options['compare'], results)
+
+    def _compare(self, path, results):
+        with open(path, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+
+        self.stderr.write(f"Karşılaştırma: {baseline['meta'].get('commit')} -> {results['meta'].get('commit')}")
+        for name, current in results['scenarios'].items():
+            previous = baseline['scenarios'].get(name)
+            if previous is None:
+                continue
+            parts = []
+            for key in ('p50', 'p95'):
+                before, after = previous['latency_ms'][key], current['latency_ms'][key]
+                change = (after - before) / before * 100 if before else 0
+                parts.append(f'{key} {before:.1f} -> {after:.1f}ms ({change:+.0f}%)')
+            before_queries, after_queries = previous['queries']['max'], current['queries']['max']
+            parts.append(f'sorgu {before_queries} -> {after_queries}')
+            line = f"  {name}: {', '.join(parts)}"
+            self.stderr.write(self.style.ERROR(line) if after_queries > before_queries else line)
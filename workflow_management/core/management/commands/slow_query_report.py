@@ -0,0 +1,113 @@
+# core/management/commands/slow_query_report.py
+import glob
+import json
+import os
+import statistics
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+SORT_KEYS = {
+    'total': lambda group: group['total_ms'],
+    'count': lambda group: group['count'],
+    'max': lambda group: group['max_ms'],
+    'p95': lambda group: group['p95_ms'],
+}
+
+
+def _percentile(values, percent):
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[percent - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        'Yavaş sorgu log\'unu (logs/slow_queries.log ve döndürülmüş kopyaları) sorgu parmak izine '
+        'göre gruplayıp en maliyetli sorguları listeler. Örnek: manage.py slow_query_report --top 10 --sort count'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--log', default=os.path.join(settings.BASE_DIR, 'logs', 'slow_queries.log'),
+            help='Log dosyası; .1, .2 ... uzantılı döndürülmüş dosyalar da okunur'
+        )
+        parser.add_argument('--top', type=int, default=20)
+        parser.add_argument('--sort', choices=sorted(SORT_KEYS), default='total')
+        parser.add_argument('--view', help='Yalnızca bu view (ör. WorkflowViewSet.list)')
+        parser.add_argument('--json', action='store_true', help='Sonucu JSON olarak yaz')
+
+    def handle(self, *args, **options):
+        paths = sorted(glob.glob(f"{glob.escape(options['log'])}*"))
+        if not paths:
+            raise CommandError(f"Log dosyası bulunamadı: {options['log']}")
+
+        groups = {}
+        for record in self._read_records(paths):
+            if options['view'] and record.get('view') != options['view']:
+                continue
+            group = groups.get(record['fingerprint'])
+            if group is None:
+                group = groups[record['fingerprint']] = {
+                    'fingerprint': record['fingerprint'],
+                    'sql': record['sql'],
+                    'durations': [],
+                    'views': {},
+                    'stack': record.get('stack'),
+                    'plan': None,
+                }
+            group['durations'].append(record['duration_ms'])
+            view = record.get('view') or '-'
+            group['views'][view] = group['views'].get(view, 0) + 1
+            if record.get('plan'):
+                group['plan'] = record['plan']
+
+        report = []
+        for group in groups.values():
+            durations = sorted(group.pop('durations'))
+            group.update({
+                'count': len(durations),
+                'total_ms': round(sum(durations), 1),
+                'p95_ms': round(_percentile(durations, 95), 1),
+                'max_ms': durations[-1],
+            })
+            report.append(group)
+        report.sort(key=SORT_KEYS[options['sort']], reverse=True)
+        report = report[:options['top']]
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+            return
+
+        if not report:
+            self.stdout.write('Kayıt yok')
+            return
+        for rank, group in enumerate(report, 1):
+            views = ', '.join(f'{view} ({count})' for view, count in sorted(
+                group['views'].items(), key=lambda item: item[1], reverse=True
+            ))
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{rank}. {group['fingerprint']}  adet={group['count']}  toplam={group['total_ms']}ms  "
+                f"p95={group['p95_ms']}ms  max={group['max_ms']}ms"
+            ))
+            self.stdout.write(f'   view: {views}')
+            self.stdout.write(f"   sql: {group['sql'][:500]}")
+            if group['stack']:
+                self.stdout.write(f"   çağıran: {group['stack'][-1]}")
+            if group['plan']:
+                for line in group['plan'][:10]:
+                    self.stdout.write(f'   plan: {line}')
+
+    def _read_records(self, paths):
+        for path in paths:
+            with open(path, encoding='utf-8', errors='replace') as handle:
+                for line in handle:
+                    start = line.find('{')
+                    if start == -1:
+                        continue
+                    try:
+                        record = json.loads(line[start:])
+                    except ValueError:
+                        continue
+                    if 'fingerprint' in record:
+                        yield record
@@ -0,0 +1,222 @@
+# core/metrics.py
+"""
+Prometheus metin formatında metrikler.
+
+Her process metriklerini bellekte toplar. METRICS_DIR tanımlıysa (çok process'li
+gunicorn kurulumu) en geç METRICS_FLUSH_INTERVAL saniyede bir process'e özel bir
+JSON dosyasına yazar; /metrics isteği dizindeki tüm dosyaları toplayarak döner.
+Kapanan worker'ların dosyaları silinmez, sayaçlar geriye düşmez. Dizin gunicorn
+başlarken (gunicorn.conf.py on_starting) clear_metrics_dir() ile temizlenir.
+"""
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HELP = {
+    'http_request_duration_seconds': ('histogram', 'İstek süresi (view/action bazında)'),
+    'http_requests_total': ('counter', 'Tamamlanan istek sayısı'),
+    'http_request_errors_total': ('counter', 'Hata yanıtları (CustomJSONRenderer.ERROR_CODES)'),
+    'db_queries_total': ('counter', 'Çalıştırılan SQL sorgusu sayısı'),
+    'db_query_seconds_total': ('counter', 'SQL sorgularında geçen toplam süre'),
+    'cache_requests_total': ('counter', 'Cache okumaları (result=hit/miss)'),
+    'movements_created_total': ('counter', 'Yazılan Movement kayıtları'),
+    'db_pool_events_total': ('counter', 'Bağlantı havuzu olayları (checkout, wait, timeout, hata)'),
+}
+
+
+def _labels_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+class MetricsRegistry:
+    """Process içi sayaç ve histogramlar"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._histograms = {}
+        self._last_flush = 0.0
+        # pid yalnızca dosyayı process'e özgü kılar; metrik etiketlerine girmez
+        self._file_name = f'metrics_{os.getpid()}_{int(time.time() * 1000)}.json'
+
+    def inc(self, name, labels, value=1):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] += value
+
+    def observe(self, name, labels, value, buckets=LATENCY_BUCKETS):
+        key = (name, _labels_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'buckets': [0] * len(buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram['buckets'][index] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            counters = [[name, dict(labels), value] for (name, labels), value in self._counters.items()]
+            histograms = [
+                [name, dict(labels), list(h['buckets']), h['sum'], h['count']]
+                for (name, labels), h in self._histograms.items()
+            ]
+        counters.extend(_pool_counters())
+        return {'counters': counters, 'histograms': histograms}
+
+    def maybe_flush(self, force=False):
+        """Çok process'li modda snapshot'ı process dosyasına yazar"""
+        directory = settings.METRICS_DIR
+        if not directory:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < settings.METRICS_FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self._file_name)
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w') as handle:
+            json.dump(self.snapshot(), handle)
+        os.replace(temp_path, path)
+
+    def reset_after_fork(self):
+        # Fork öncesi toplanan değerler parent'ta kalır
+        self.__init__()
+
+
+registry = MetricsRegistry()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=registry.reset_after_fork)
+
+
+def inc(name, value=1, **labels):
+    registry.inc(name, labels, value)
+
+
+def observe(name, value, **labels):
+    registry.observe(name, labels, value)
+
+
+def record_cache(cache_name, hit, count=1):
+    """Uygulama cache'lerinde isabet oranı için"""
+    if count:
+        registry.inc('cache_requests_total', {'cache': cache_name, 'result': 'hit' if hit else 'miss'}, count)
+
+
+POOL_EVENTS = ('checkouts', 'waits', 'timeouts', 'ping_failures', 'connect_failures', 'discarded')
+
+
+def _pool_counters():
+    """
+    Bu process'teki bağlantı havuzu istatistikleri. Etiketlerde process bilgisi yoktur;
+    _merge her process dosyasındaki değerleri havuz ve olay bazında toplar.
+    """
+    from core.db.pool import all_pool_stats
+
+    return [
+        ['db_pool_events_total', {'pool': pool_name, 'event': event}, stats[event]]
+        for pool_name, stats in all_pool_stats().items()
+        for event in POOL_EVENTS
+    ]
+
+
+def _merge(snapshots):
+    counters = defaultdict(float)
+    histograms = {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get('counters', []):
+            counters[(name, _labels_key(labels))] += value
+        for name, labels, buckets, total, count in snapshot.get('histograms', []):
+            key = (name, _labels_key(labels))
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = [list(buckets), total, count]
+            else:
+                merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+                merged[1] += total
+                merged[2] += count
+    return counters, histograms
+
+
+def clear_metrics_dir():
+    """Önceki çalıştırmalardan kalan process dosyalarını siler (worker'lar başlamadan önce)"""
+    directory = settings.METRICS_DIR
+    if not directory:
+        return
+    for path in glob.glob(os.path.join(directory, 'metrics_*.json*')):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def collect():
+    """Tüm process'lerin (ya da yalnızca bu process'in) metriklerini birleştirir"""
+    directory = settings.METRICS_DIR
+    if not directory:
+        return _merge([registry.snapshot()])
+
+    registry.maybe_flush(force=True)
+    snapshots = []
+    for path in glob.glob(os.path.join(directory, 'metrics_*.json')):
+        try:
+            with open(path) as handle:
+                snapshots.append(json.load(handle))
+        except (OSError, ValueError):
+            continue
+    return _merge(snapshots)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + list((extra or {}).items())
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in items) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus():
+    """Prometheus text exposition formatı (0.0.4)"""
+    counters, histograms = collect()
+
+    lines = []
+    by_name = defaultdict(list)
+    for (name, labels), value in counters.items():
+        by_name[name].append((labels, value))
+    for (name, labels), value in histograms.items():
+        by_name[name].append((labels, value))
+
+    for name in sorted(by_name):
+        metric_type, help_text = HELP.get(name, ('untyped', name))
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        for labels, value in sorted(by_name[name], key=lambda item: item[0]):
+            if metric_type == 'histogram':
+                buckets, total, count = value
+                for bound, bucket_count in zip(LATENCY_BUCKETS, buckets):
+                    lines.append(f'{name}_bucket{_format_labels(labels, {"le": bound})} {bucket_count}')
+                lines.append(f'{name}_bucket{_format_labels(labels, {"le": "+Inf"})} {count}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(total)}')
+                lines.append(f'{name}_count{_format_labels(labels)} {count}')
+            else:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
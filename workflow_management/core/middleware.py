@@ -0,0 +1,246 @@
+# core/middleware.py
+import json
+import logging
+import re
+import time
+import uuid
+from contextlib import ExitStack
+from functools import partial
+
+from django.conf import settings
+from django.db import connections
+
+from core import metrics, profiling, timing
+from core.async_views import _authenticate
+from core.db import routers, slow_queries
+from core.renderers import CustomJSONRenderer
+from authentication.permissions import IsSuperUser
+
+timing_logger = logging.getLogger('core.timing')
+
+# Dışarıdan gelen istek kimliği yalnızca güvenli karakterlerle kabul edilir
+REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Güvenli isteklerde okumaların replica'ya gitmesine izin verir.
+    İstek içinde yazma yapan kullanıcı sticky olarak işaretlenir; sonraki
+    isteklerinde okumalar replikasyon gecikmesi süresince primary'den yapılır.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replica = request.method in SAFE_METHODS and routers.replica_alias() is not None
+        token = routers.begin_request(request, use_replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            state = routers.end_request(token)
+
+        if state.wrote:
+            user_id = routers.request_user_id(request)
+            if user_id is not None:
+                routers.mark_sticky(user_id)
+        return response
+
+
+class MeasuredStream:
+    """
+    Akışlı yanıt gövdesi sarmalayıcısı. Her parça üretilirken istek ölçümü yeniden
+    etkinleşir (sorgular, serializer/yetki/render fazları) ve byte'lar sayılır.
+    Gövde bittiğinde ya da sunucu yanıtı kapattığında finish(byte sayısı) bir kez çağrılır.
+    """
+
+    def __init__(self, content, timings, finish):
+        self._content = content
+        self._timings = timings
+        self._finish = finish
+        self.size = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        token = timing.resume(self._timings)
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(self._timings))
+                chunk = next(self._content, None)
+        finally:
+            timing.stop(token)
+        if chunk is None:
+            self.close()
+            raise StopIteration
+        self.size += len(chunk)
+        return chunk
+
+    def close(self):
+        finish, self._finish = self._finish, None
+        if finish is not None:
+            finish(self.size)
+
+
+class RequestTimingMiddleware:
+    """
+    Her istek için DB sorgu sayısı/süresi, serializer, yetki ve render sürelerini ölçer.
+    Sonuçları Server-Timing başlığı ve istek kimlikli tek satırlık JSON log olarak yazar.
+    View'ın eşiğini aşan sorgular yanıttan sonra yavaş sorgu log'una yazılır.
+    Akışlı yanıtlarda (core.streaming) ölçüm gövde üretilirken sürer; log gövde bitince yazılır.
+    En dışta çalışması için MIDDLEWARE listesinin başında yer almalıdır.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REQUEST_TIMING_ENABLED:
+            return self.get_response(request)
+
+        request_id = request.headers.get('X-Request-ID', '')
+        if not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+
+        timings, token = timing.start(slow_queries.threshold_for(None))
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(timings))
+                response = self.get_response(request)
+        finally:
+            timing.stop(token)
+
+        response['X-Request-ID'] = request_id
+        response['Server-Timing'] = timing.server_timing_header(timings, timings.elapsed())
+        if response.streaming:
+            # Gövde yanıt döndükten sonra üretilir: başlık ilk byte'a kadarki ölçümü taşır,
+            # log kaydı gövde bittiğinde (ya da bağlantı kapandığında) tam ölçümle yazılır
+            response.streaming_content = MeasuredStream(
+                response.streaming_content, timings,
+                partial(self._finish, request, request_id, response.status_code, timings)
+            )
+        else:
+            self._finish(request, request_id, response.status_code, timings, len(response.content))
+        return response
+
+    def _finish(self, request, request_id, status, timings, size):
+        total = timings.elapsed()
+        if timings.slow_queries:
+            slow_queries.flush(timings.slow_queries, request, resolve_view_name(request))
+
+        timing_logger.info(json.dumps({
+            'request_id': request_id,
+            'method': request.method,
+            'path': request.path,
+            'status': status,
+            'user_id': routers.request_user_id(request),
+            'duration_ms': round(total * 1000, 1),
+            'db_queries': timings.db_queries,
+            'db_ms': round(timings.db_time * 1000, 1),
+            'serializer_ms': round(timings.phases['serializer'] * 1000, 1),
+            'permissions_ms': round(timings.phases['permissions'] * 1000, 1),
+            'render_ms': round(timings.phases['render'] * 1000, 1),
+            'response_bytes': size,
+        }))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # View belli olduğunda ona özel yavaş sorgu eşiği uygulanır
+        timings = timing.current()
+        if timings is not None and timings.slow_threshold is not None:
+            timings.slow_threshold = slow_queries.threshold_for(resolve_view_name(request))
+
+
+def resolve_view_name(request):
+    """
+    Metrik etiketi için view adı: viewset'lerde 'WorkflowViewSet.set_priority',
+    APIView/api_view'larda sınıf ya da fonksiyon adı. Eşleşmeyen yollar 'unmatched'.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+
+    func = match.func
+    view_class = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    if view_class is None:
+        return getattr(func, '__name__', match.view_name or 'unknown')
+
+    actions = getattr(func, 'actions', None)
+    if actions:
+        action = actions.get(request.method.lower())
+        if action is None and request.method == 'HEAD':
+            action = actions.get('get')
+        return f'{view_class.__name__}.{action or request.method.lower()}'
+    return view_class.__name__
+
+
+class MetricsMiddleware:
+    """
+    İstek süresi, durum kodu, hata kodu ve DB süresi metriklerini toplar (core/metrics.py).
+    DB ölçümleri için RequestTimingMiddleware'in içinde (ondan sonra) yer almalıdır.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        view = resolve_view_name(request)
+        method = request.method
+        status = response.status_code
+        metrics.observe('http_request_duration_seconds', duration, view=view, method=method)
+        metrics.inc('http_requests_total', view=view, method=method, status=str(status))
+        if status >= 400:
+            error_code = CustomJSONRenderer.ERROR_CODES.get(status, 'UNKNOWN_ERROR')
+            metrics.inc('http_request_errors_total', view=view, error_code=error_code)
+
+        timings = timing.current()
+        if timings is not None:
+            metrics.inc('db_queries_total', timings.db_queries, view=view)
+            metrics.inc('db_query_seconds_total', timings.db_time, view=view)
+
+        metrics.registry.maybe_flush()
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Superuser'ın açıkça istediği ('X-Profile: 1' / '?_profile=1') ya da PROFILE_SAMPLE_RATES
+    ile örneklenen istekleri cProfile altında çalıştırır (core/profiling.py).
+    View'ı kendisi çağırdığından diğer middleware'lerin process_view'ları (CSRF vb.)
+    önce çalışsın diye MIDDLEWARE listesinin sonunda yer almalıdır.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not settings.PROFILING_ENABLED or not profiling.can_profile(view_func):
+            return None
+
+        view_name = resolve_view_name(request)
+        if profiling.explicitly_requested(request):
+            # Yetkisiz kullanıcılar için işaret yok sayılır, istek normal işlenir
+            if _authenticate(request, IsSuperUser) is None:
+                return None
+            mode = 'explicit'
+        elif profiling.is_sampled(view_name):
+            mode = 'sampled'
+        else:
+            return None
+
+        return profiling.profile_view(request, view_func, view_args, view_kwargs, view_name, mode)
@@ -0,0 +1,195 @@
+# core/profiling.py
+"""
+İstek profilleme (cProfile).
+
+İki şekilde tetiklenir:
+- Açık: superuser 'X-Profile: 1' başlığı ya da '?_profile=1' ile istek atar.
+  Yanıta 'X-Profile-ID' eklenir; profil /api/profiles/<id>/ adresinden indirilir.
+- Örnekleme: PROFILE_SAMPLE_RATES içindeki view'lara gelen her N istekten biri
+  kullanıcıdan bağımsız olarak profillenir.
+
+Profil view çağrısını ve DRF yanıtının render edilmesini kapsar; middleware ve
+kimlik doğrulama dahil değildir. Her profil PROFILE_DIR altına .prof (pstats) ve
+aynı adlı .json (istek bilgisi, DB süresi, en maliyetli fonksiyonlar) olarak yazılır.
+"""
+import io
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+
+from core import timing
+
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+TOP_FUNCTIONS = 30
+
+_counters = {}
+_counters_lock = threading.Lock()
+
+
+def explicitly_requested(request):
+    return request.headers.get('X-Profile') == '1' or request.GET.get('_profile') == '1'
+
+
+def is_sampled(view_name):
+    """View için tanımlı oranda (1/N) True döner; sayaç process'e özeldir"""
+    rate = settings.PROFILE_SAMPLE_RATES.get(view_name)
+    if not rate:
+        return False
+    with _counters_lock:
+        counter = _counters.get(view_name)
+        if counter is None:
+            counter = _counters[view_name] = itertools.count(1)
+        return next(counter) % rate == 0
+
+
+def can_profile(view_func):
+    # Async view'lar event loop üzerinde çalışır, cProfile ile ölçülemez
+    return not iscoroutinefunction(view_func)
+
+
+def _profile_path(profile_id, extension):
+    return os.path.join(settings.PROFILE_DIR, f'{profile_id}.{extension}')
+
+
+def _function_label(filename, line, name):
+    base_dir = str(settings.BASE_DIR)
+    if filename.startswith(base_dir):
+        filename = os.path.relpath(filename, base_dir)
+    return f'{filename}:{line}({name})'
+
+
+def _summary(profiler):
+    import pstats
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    rows = []
+    for function in stats.fcn_list[:TOP_FUNCTIONS]:
+        _, total_calls, own_time, cumulative_time, _ = stats.stats[function]
+        rows.append({
+            'function': _function_label(*function),
+            'calls': total_calls,
+            'own_ms': round(own_time * 1000, 2),
+            'cumulative_ms': round(cumulative_time * 1000, 2),
+        })
+    return rows
+
+
+def _prune():
+    """PROFILE_MAX_FILES'tan fazla profil varsa en eskileri siler"""
+    profiles = sorted(
+        (entry for entry in os.scandir(settings.PROFILE_DIR) if entry.name.endswith('.json')),
+        key=lambda entry: entry.stat().st_mtime
+    )
+    for entry in profiles[:max(len(profiles) - settings.PROFILE_MAX_FILES, 0)]:
+        profile_id = entry.name[:-len('.json')]
+        for extension in ('json', 'prof'):
+            try:
+                os.remove(_profile_path(profile_id, extension))
+            except FileNotFoundError:
+                pass
+
+
+def profile_view(request, view_func, view_args, view_kwargs, view_name, mode):
+    """View'ı profiler altında çalıştırır, profili kaydeder ve yanıtı döndürür"""
+    # cProfile/pstats yalnızca profil alınırken gerekir; preload'da warmup önceden import eder
+    import cProfile
+
+    timings = timing.current()
+    queries_before = timings.db_queries if timings else 0
+    db_time_before = timings.db_time if timings else 0.0
+
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Aynı thread'de başka bir profiler aktif
+        return view_func(request, *view_args, **view_kwargs)
+    try:
+        response = view_func(request, *view_args, **view_kwargs)
+        if hasattr(response, 'render') and callable(response.render):
+            response = response.render()
+    finally:
+        profiler.disable()
+    duration = time.perf_counter() - started
+
+    profile_id = uuid.uuid4().hex
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    profiler.dump_stats(_profile_path(profile_id, 'prof'))
+
+    user = getattr(request, 'user', None)
+    metadata = {
+        'id': profile_id,
+        'mode': mode,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'view': view_name,
+        'method': request.method,
+        'path': request.get_full_path(),
+        'request_id': getattr(request, 'request_id', None),
+        'user_id': user.pk if user is not None and user.is_authenticated else None,
+        'status': response.status_code,
+        'duration_ms': round(duration * 1000, 1),
+        'db_queries': timings.db_queries - queries_before if timings else None,
+        'db_ms': round((timings.db_time - db_time_before) * 1000, 1) if timings else None,
+        'functions': _summary(profiler),
+    }
+    with open(_profile_path(profile_id, 'json'), 'w', encoding='utf-8') as handle:
+        json.dump(metadata, handle, ensure_ascii=False)
+    _prune()
+
+    if mode == 'explicit':
+        response['X-Profile-ID'] = profile_id
+    return response
+
+
+def list_profiles():
+    """Kayıtlı profillerin özet bilgileri (yeniden eskiye)"""
+    if not os.path.isdir(settings.PROFILE_DIR):
+        return []
+    profiles = []
+    for entry in os.scandir(settings.PROFILE_DIR):
+        if not entry.name.endswith('.json'):
+            continue
+        try:
+            with open(entry.path, encoding='utf-8') as handle:
+                metadata = json.load(handle)
+        except (OSError, ValueError):
+            continue
+        metadata.pop('functions', None)
+        profiles.append(metadata)
+    profiles.sort(key=lambda item: item['created'], reverse=True)
+    return profiles
+
+
+def load_profile(profile_id):
+    """Profil bilgisini döndürür; geçersiz ya da olmayan id için None"""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    try:
+        with open(_profile_path(profile_id, 'json'), encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def profile_file(profile_id):
+    return _profile_path(profile_id, 'prof')
+
+
+def profile_text(profile_id, sort='cumulative', limit=100):
+    """pstats çıktısı (indirilebilir metin rapor)"""
+    import pstats
+
+    output = io.StringIO()
+    stats = pstats.Stats(profile_file(profile_id), stream=output)
+    stats.sort_stats(sort).print_stats(limit)
+    return output.getvalue()
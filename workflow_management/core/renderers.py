@@ -1,6 +1,15 @@
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import json as drf_json
 from datetime import datetime
 import json
+import re
+
+from core.timing import timed, timed_phase
+
+try:
+    import orjson
+except ImportError:  # orjson opsiyonel - yoksa stdlib encoder kullanılır
+    orjson = None
 
 
 class CustomJSONRenderer(JSONRenderer):
@@ -27,6 +36,7 @@ class CustomJSONRenderer(JSONRenderer):
         500: 'INTERNAL_SERVER_ERROR'
     }
     
+    @timed_phase('render')
     def render(self, data, accepted_media_type=None, renderer_context=None):
         response = renderer_context.get('response') if renderer_context else None
         status_code = response.status_code if response else 200
@@ -37,12 +47,15 @@ class CustomJSONRenderer(JSONRenderer):
             'message': self._get_message(data, status_code),
             'data': self._get_data(data, success),
             'errors': self._get_errors(data, status_code, success),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._get_timestamp(),
             'status_code': status_code
         }
         
         return super().render(formatted_response, accepted_media_type, renderer_context)
     
+    def _get_timestamp(self):
+        return datetime.now().isoformat()
+    
     def _get_message(self, data, status_code):
         """Duruma göre mesaj döndür"""
         if isinstance(data, dict):
@@ -92,4 +105,177 @@ class CustomJSONRenderer(JSONRenderer):
             if non_field_errors:
                 errors['non_field_errors'] = non_field_errors
         
-        return errors
\ No newline at end of file
+        return errors
+
+
+class ChunkedList:
+    """
+    Parça parça üretilen liste verisi (her parça bir list). iter_render parçaları
+    üretildikçe kodlar; tüm liste hiçbir zaman bellekte birlikte tutulmaz (bkz. core.streaming).
+    """
+    __slots__ = ('chunks',)
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+
+class FastCustomJSONRenderer(CustomJSONRenderer):
+    """
+    CustomJSONRenderer ile byte-byte aynı çıktıyı üreten hızlı renderer.
+    - orjson varsa onu kullanır, yoksa stdlib encoder'a düşer
+    - Zarf dict'i oluşturmaz, parçaları doğrudan byte olarak birleştirir
+    - Başarılı dict verilerini gereksiz yere kopyalamaz
+    - Liste verileri iter_render ile parça parça üretilebilir
+    """
+    
+    CHUNK_SIZE = 500
+    EXCLUDED_DATA_KEYS = frozenset(['message', 'detail', 'errors', 'non_field_errors'])
+    
+    # orjson float'ları stdlib'den farklı yazar (1e16 / 1e+16, 0.00001 / 1e-05).
+    # Sayı içinde bu kalıplardan biri görülürse çıktı stdlib ile yeniden üretilir.
+    _EXPONENT = re.compile(rb'e[-0-9]')
+    _NUMBER_CHARS = frozenset(b'0123456789.-')
+    _VALUE_STARTS = frozenset(b':,[')
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson else 0
+    )
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._default = self.encoder_class().default
+        self._use_orjson = orjson is not None and self.compact and not self.ensure_ascii
+    
+    def _stdlib_dumps(self, obj):
+        ret = drf_json.dumps(
+            obj, cls=self.encoder_class,
+            ensure_ascii=self.ensure_ascii, allow_nan=not self.strict,
+            separators=(',', ':') if self.compact else (', ', ': ')
+        )
+        return ret.encode()
+    
+    def _is_number_end(self, ret, end):
+        """ret[:end] bir JSON sayı değeriyle mi bitiyor?"""
+        start = end
+        while start > 0 and ret[start - 1] in self._NUMBER_CHARS:
+            start -= 1
+        return start < end and (start == 0 or ret[start - 1] in self._VALUE_STARTS)
+    
+    def _has_float_mismatch(self, ret):
+        for match in self._EXPONENT.finditer(ret):
+            if self._is_number_end(ret, match.start()):
+                return True
+        
+        index = ret.find(b'0.0000')
+        while index != -1:
+            if self._is_number_end(ret, index + 6):
+                return True
+            index = ret.find(b'0.0000', index + 1)
+        return False
+    
+    def _dumps(self, obj):
+        """Tek bir değeri JSONRenderer ile aynı byte'lara çevirir"""
+        ret = None
+        if self._use_orjson:
+            try:
+                ret = orjson.dumps(obj, default=self._default, option=self._ORJSON_OPTIONS)
+            except (TypeError, orjson.JSONEncodeError):
+                ret = None
+            if ret is not None and self._has_float_mismatch(ret):
+                ret = None
+        if ret is None:
+            ret = self._stdlib_dumps(obj)
+        
+        # JSONRenderer ile aynı şekilde \u2028 ve \u2029 kaçışlanır
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+        return ret
+    
+    def _get_data(self, data, success):
+        """Hata alanı yoksa veriyi kopyalamadan döndür"""
+        if success and isinstance(data, dict) and self.EXCLUDED_DATA_KEYS.isdisjoint(data):
+            return data
+        return super()._get_data(data, success)
+    
+    def _envelope(self, data, renderer_context):
+        """Zarfın veri öncesi ve sonrası byte parçalarını ve veriyi döndürür"""
+        response = renderer_context.get('response') if renderer_context else None
+        status_code = response.status_code if response else 200
+        success = 200 <= status_code < 400
+        
+        head = b''.join((
+            b'{"success":', b'true' if success else b'false',
+            b',"message":', self._dumps(self._get_message(data, status_code)),
+            b',"data":',
+        ))
+        body = self._get_data(data, success)
+        tail = b''.join((
+            b',"errors":', self._dumps(self._get_errors(data, status_code, success)),
+            b',"timestamp":', self._dumps(self._get_timestamp()),
+            b',"status_code":', self._dumps(status_code),
+            b'}',
+        ))
+        return head, body, tail
+    
+    @timed_phase('render')
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            # Girintili çıktı istenirse standart yol
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        head, body, tail = self._envelope(data, renderer_context)
+        return b''.join((head, self._dumps(body), tail))
+    
+    def _split_dict(self, body):
+        """
+        Bir değeri ChunkedList olan dict'i (liste öncesi byte'lar, ChunkedList, liste sonrası byte'lar)
+        olarak ayırır; böyle bir değer yoksa None. Anahtar sırası ve ayraçlar _dumps ile aynıdır.
+        """
+        keys = list(body)
+        index = next((i for i, key in enumerate(keys) if isinstance(body[key], ChunkedList)), None)
+        if index is None:
+            return None
+        
+        separator, colon = (b',', b':') if self.compact else (b', ', b': ')
+        before = {key: body[key] for key in keys[:index]}
+        after = {key: body[key] for key in keys[index + 1:]}
+        head = self._dumps(before)[:-1] + separator if before else b'{'
+        tail = separator + self._dumps(after)[1:] if after else b'}'
+        return head + self._dumps(keys[index]) + colon, body[keys[index]], tail
+    
+    def iter_render(self, data, renderer_context=None):
+        """
+        Zarfı parça parça üretir; StreamingHttpResponse gövdesi olarak kullanılır.
+        Liste verileri CHUNK_SIZE'lık gruplar, ChunkedList verileri (doğrudan ya da
+        dict içinde bir değer olarak) kendi parçaları halinde kodlanır. Parçaların
+        birleşimi render() çıktısıyla aynıdır (girintisiz).
+        Kodlama süresi her parçada 'render' fazına eklenir.
+        """
+        with timed('render'):
+            head, body, tail = self._envelope(data, renderer_context)
+            split = self._split_dict(body) if isinstance(body, dict) else None
+        
+        if split is not None:
+            body_head, body, body_tail = split
+            head, tail = head + body_head, body_tail + tail
+        
+        if isinstance(body, ChunkedList):
+            chunks = body.chunks
+        elif isinstance(body, list):
+            chunks = (body[start:start + self.CHUNK_SIZE] for start in range(0, len(body), self.CHUNK_SIZE))
+        else:
+            with timed('render'):
+                yield b''.join((head, self._dumps(body), tail))
+            return
+        
+        separator = b',' if self.compact else b', '
+        prefix = head + b'['
+        for chunk in chunks:
+            if not chunk:
+                continue
+            with timed('render'):
+                encoded = self._dumps(chunk)
+            yield prefix + encoded[1:-1]
+            prefix = separator
+        # Hiç parça yoksa prefix hâlâ zarf başıdır: boş liste
+        yield (b'' if prefix is separator else prefix) + b']' + tail
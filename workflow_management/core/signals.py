@@ -0,0 +1,19 @@
+# core/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+from .jwt_auth import invalidate_cached_user
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    Kullanıcı güncellendiğinde veya silindiğinde kimlik doğrulama cache'ini temizle
+    (user_detail PATCH/DELETE, is_active/is_superuser ve şifre değişiklikleri)
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    
+    invalidate_cached_user(instance.pk)
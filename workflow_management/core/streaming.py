@@ -0,0 +1,63 @@
+# core/streaming.py
+"""
+Büyük liste yanıtlarının akıtılması.
+
+Satırlar view içinde okunur; sorgu, replica yönlendirmesi ve yavaş sorgu kaydı
+istek içinde kalır ve akış sırasında açık cursor bulunmaz. Serileştirme, yetki
+filtresi ve JSON kodlama ise yanıt gönderilirken CHUNK_SIZE'lık gruplar halinde
+yapılır. Böylece tüm listenin dict'leri ve gövde byte'ları aynı anda bellekte
+tutulmaz, ilk byte liste bitmeden gider. Gövde render() çıktısıyla byte-byte aynıdır.
+Ölçümler (render süresi, yanıt boyutu) RequestTimingMiddleware tarafından gövde
+bittiğinde tamamlanır.
+
+stream_response ise satırları üretildikçe okuyan ChunkedList'ler içindir (ör. yetki
+matrisi); sorgu gövde üretilirken çalışır, ölçümler yine MeasuredStream ile toplanır.
+"""
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from core.renderers import ChunkedList
+
+
+def can_stream(request):
+    """Müzakere edilen renderer parça parça üretebiliyor ve girinti istenmemiş mi"""
+    renderer = getattr(request, 'accepted_renderer', None)
+    return (
+        settings.STREAM_LIST_RESPONSES
+        and hasattr(renderer, 'iter_render')
+        and renderer.get_indent(request.accepted_media_type, {}) is None
+    )
+
+
+def _serialized_chunks(rows, serialize, size):
+    for start in range(0, len(rows), size):
+        yield serialize(rows[start:start + size])
+
+
+def stream_response(request, data, view=None):
+    """
+    data'yı (ChunkedList ya da ChunkedList değeri taşıyan dict) akışlı yanıt olarak döndürür.
+    Akıtılamayan isteklerde None; view veriyi listeye çevirip normal Response döner.
+    """
+    if not can_stream(request):
+        return None
+    renderer = request.accepted_renderer
+    media_type = request.accepted_media_type
+    content_type = f'{media_type}; charset={renderer.charset}' if renderer.charset else media_type
+    response = StreamingHttpResponse(content_type=content_type)
+    context = {'view': view, 'request': request, 'response': response}
+    response.streaming_content = renderer.iter_render(data, context)
+    return response
+
+
+def stream_list_response(request, rows, serialize, view=None):
+    """
+    rows: okunmuş satırlar (list); serialize(parça) parçanın yanıt verisini (list) döndürür.
+    Tek parçaya sığan listeler ve akıtılamayan istekler için None; view normal Response döner.
+    """
+    if not can_stream(request):
+        return None
+    size = request.accepted_renderer.CHUNK_SIZE
+    if len(rows) <= size:
+        return None
+    return stream_response(request, ChunkedList(_serialized_chunks(rows, serialize, size)), view)
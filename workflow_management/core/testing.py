@@ -0,0 +1,138 @@
+# core/testing.py
+"""Testlerde ortak yardımcılar (sorgu sayısı sabitleme, async/senkron yanıt karşılaştırma)"""
+import asyncio
+from contextlib import ExitStack
+from types import ModuleType
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connections
+from django.test import AsyncClient, override_settings
+from django.urls import include, path
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.benchmarks import QueryCounter
+from core.renderers import CustomJSONRenderer
+
+
+def reset_caches():
+    """Paylaşılan cache ile süreç içi haritaları, arama indeksini ve iptal listesini sıfırlar"""
+    from authentication.autocomplete import user_index
+    from authentication.revocation import revocation_list
+    from workflows.lookups import MODEL_ID_MAPS
+
+    cache.clear()
+    for id_map in MODEL_ID_MAPS.values():
+        id_map.invalidate()
+    user_index.reset()
+    revocation_list.invalidate()
+
+
+def _authorization(user):
+    from permissions.claims import add_permission_claims
+
+    token = add_permission_claims(RefreshToken.for_user(user).access_token, user)
+    return f'Bearer {token}'
+
+
+def client_for(user):
+    """Girişteki gibi yetki claim'li access token taşıyan istemci"""
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=_authorization(user))
+    return client
+
+
+def async_urlconf():
+    """
+    ASYNC_READ_VIEWS=True iken kurulan URL düzeni; ROOT_URLCONF olarak verilir.
+    Ayar URL modülleri import edilirken okunduğu için async eşlemeler burada öne eklenir.
+    """
+    from authentication import async_views as auth_async_views
+    from workflow_management.urls import urlpatterns
+    from workflows import async_views as work_async_views
+
+    urlconf = ModuleType('async_urlconf')
+    urlconf.urlpatterns = [
+        path('api/', include(work_async_views.urlpatterns)),
+        path('api/auth/', include(auth_async_views.urlpatterns)),
+        *urlpatterns,
+    ]
+    return urlconf
+
+
+def auth_headers(user):
+    """
+    AsyncClient istekleri için Authorization başlığı (user None ise boş).
+    AsyncClient(headers=...) varsayılanları ASGI başlıklarına taşımadığından istek başına verilir.
+    """
+    return {'Authorization': _authorization(user)} if user is not None else {}
+
+
+class AsyncParityMixin:
+    """
+    Async okuma view'ları (ASYNC_READ_VIEWS=True) senkron view'larla aynı yanıtı vermelidir:
+    durum kodu, gövde (byte-byte) ve başlıklar. Hata yanıtları da karşılaştırılır.
+    """
+
+    def setUp(self):
+        super().setUp()
+        reset_caches()
+        self.async_urlconf = async_urlconf()
+        # Zarftaki zaman damgası iki yolda aynı olsun
+        patcher = mock.patch.object(CustomJSONRenderer, '_get_timestamp', return_value='2024-01-01T00:00:00')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertSameResponse(self, user, url, params=None, headers=None, status_code=200):
+        sync_client = client_for(user) if user is not None else APIClient()
+        sync_response = sync_client.get(url, params, headers=headers)
+        with override_settings(ROOT_URLCONF=self.async_urlconf):
+            async_response = async_to_sync(AsyncClient().get)(
+                url, params, headers={**auth_headers(user), **(headers or {})}
+            )
+            # resolver_match tembel çözülür, async URL düzeni etkinken okunmalı
+            self.assertTrue(
+                asyncio.iscoroutinefunction(async_response.resolver_match.func),
+                f'{url} async view ile karşılanmadı'
+            )
+
+        self.assertEqual(sync_response.status_code, status_code, sync_response.content)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.content, sync_response.content)
+        for header in ('Content-Type', 'Allow', 'Vary', 'WWW-Authenticate'):
+            self.assertEqual(async_response.get(header), sync_response.get(header), header)
+        return async_response
+
+
+class QueryCountTestMixin:
+    """
+    Uç noktaların sorgu sayısını veri boyutundan bağımsız ve sabit tutar.
+    Ölçüm cache'ler ısındıktan sonra yapılır (ilk istek ayrıca gönderilir);
+    böylece kalıcı maliyet ölçülür, cache doldurma sorguları sayılmaz.
+    """
+
+    def count_queries(self, send):
+        counter = QueryCounter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(counter))
+            response = send()
+        return response, counter.count
+
+    def assertConstantQueries(self, seed, send, expected, sizes=(3, 12)):
+        """
+        seed(size) veriyi verilen boyuta getirir; her boyutta send() ile ölçülen
+        sorgu sayısı expected'e eşit olmalıdır (N'e bağlı artış = N+1 regresyonu).
+        """
+        counts = {}
+        for size in sizes:
+            seed(size)
+            send()
+            response, counts[size] = self.count_queries(send)
+            self.assertLess(response.status_code, 400, getattr(response, 'data', response))
+        self.assertEqual(
+            set(counts.values()), {expected},
+            f'Veri boyutuna göre sorgu sayıları {counts}, beklenen her boyutta {expected}'
+        )
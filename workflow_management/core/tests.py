@@ -1,3 +1,1035 @@
-from django.test import TestCase
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, connections, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core import metrics, warmup
+from core.benchmarks import BenchmarkContext, run_scenario
+from core.db import pool as pool_module, routers, slow_queries
+from core.db.backends.sqlite3.base import DatabaseWrapper as PooledSQLiteWrapper
+from core.db.pool import ConnectionPool, PoolTimeout
+from core.jwt_auth import (
+    CACHED_USER_FIELDS, CustomJWTAuthentication, get_user_cache_version, invalidate_cached_user
+)
+from core.middleware import ReplicaRoutingMiddleware
+from core.renderers import ChunkedList, CustomJSONRenderer, FastCustomJSONRenderer
+from core.testing import client_for, reset_caches
+
+
+class ReplicaRouterTests(TransactionTestCase):
+    """Testlerde primary ve replica ayrı SQLite veritabanlarıdır, replikasyon yoktur"""
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user('writer')
+
+    def _request(self, method='get', user=None):
+        request = getattr(self.factory, method)('/api/workflows/')
+        request.user = user or AnonymousUser()
+        return request
+
+    def _exists_in_read_db(self):
+        return User.objects.filter(username='writer').exists()
+
+    def test_reads_outside_request_use_primary(self):
+        self.assertTrue(self._exists_in_read_db())
+
+    def test_safe_request_reads_from_replica(self):
+        token = routers.begin_request(self._request(), use_replica=True)
+        try:
+            self.assertEqual(User.objects.all().db, 'replica')
+            self.assertFalse(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    def test_unsafe_request_reads_from_primary(self):
+        token = routers.begin_request(self._request('post'), use_replica=False)
+        try:
+            self.assertTrue(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    def test_reads_after_write_in_same_request_use_primary(self):
+        token = routers.begin_request(self._request(), use_replica=True)
+        try:
+            User.objects.create_user('another')
+            self.assertTrue(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    def test_sticky_user_reads_from_primary(self):
+        routers.mark_sticky(self.user.pk)
+        token = routers.begin_request(self._request(user=self.user), use_replica=True)
+        try:
+            self.assertTrue(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    def test_reads_inside_atomic_block_use_primary(self):
+        token = routers.begin_request(self._request(), use_replica=True)
+        try:
+            with transaction.atomic():
+                self.assertTrue(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    def test_use_primary_context(self):
+        token = routers.begin_request(self._request(), use_replica=True)
+        try:
+            with routers.use_primary():
+                self.assertTrue(self._exists_in_read_db())
+            self.assertFalse(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    @override_settings(DATABASE_REPLICA_ALIAS='missing')
+    def test_falls_back_to_primary_without_replica(self):
+        token = routers.begin_request(self._request(), use_replica=True)
+        try:
+            self.assertTrue(self._exists_in_read_db())
+        finally:
+            routers.end_request(token)
+
+    def test_router_does_not_resolve_lazy_session_user(self):
+        request = self.factory.get('/admin/')
+        request.user = SimpleLazyObject(lambda: User.objects.get(username='writer'))
+        token = routers.begin_request(request, use_replica=True)
+        try:
+            self.assertFalse(self._exists_in_read_db())
+            self.assertIs(request.user._wrapped, empty)
+        finally:
+            routers.end_request(token)
+
+    def test_admin_pages_render_under_router(self):
+        # Oturum kullanıcısı tembel yüklenir ve replica'dan okunur; testte replikasyon olmadığı için elle kopyalanır
+        admin = User.objects.create_superuser('yonetici', password='gizli-sifre')
+        admin.save(using='replica')
+        self.client.force_login(admin)
+
+        for url in ('/admin/', '/admin/workflows/work/', '/admin/auth/user/'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_middleware_marks_writer_sticky(self):
+        def view(request):
+            request.user = self.user
+            User.objects.filter(pk=self.user.pk).update(first_name='Ayşe')
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(self._request('post'))
+        self.assertTrue(routers.is_sticky(self.user.pk))
+
+    def test_middleware_routes_safe_reads_to_replica(self):
+        seen = {}
+
+        def view(request):
+            seen['exists'] = self._exists_in_read_db()
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(self._request())
+        self.assertFalse(seen['exists'])
+        self.assertFalse(routers.is_sticky(self.user.pk))
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class LatencyBudgetTests(TestCase):
+    """
+    Sentetik veri üzerinde senaryoların p95 gecikmesi bütçeyi aşmamalıdır.
+    Bütçeler yavaş CI makineleri için cömerttir; LATENCY_BUDGET_SCALE ile ölçeklenir.
+    """
+    BUDGETS_MS = {
+        'list': 750,
+        'retrieve': 250,
+        'update': 400,
+        'set_priority': 600,
+        'movements': 1000,
+        'my_permissions': 250,
+        'roles': 250,
+    }
+    ITERATIONS = 20
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            'generate_synthetic_data', works=200, movements=500, users=20, roles=4,
+            force=True, stdout=StringIO(), stderr=StringIO()
+        )
+
+    def setUp(self):
+        reset_caches()
+        self.ctx = BenchmarkContext(User.objects.get(username='synthetic_admin'), sample_size=50)
+
+    def test_p95_within_budget(self):
+        scale = float(os.environ.get('LATENCY_BUDGET_SCALE', '1'))
+        for name, budget in self.BUDGETS_MS.items():
+            with self.subTest(scenario=name):
+                result = run_scenario(self.ctx, name, self.ITERATIONS, memory_iterations=0)
+                self.assertEqual(set(result['status_codes']), {'200'}, result['status_codes'])
+                self.assertLessEqual(result['latency_ms']['p95'], budget * scale, result['latency_ms'])
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class WarmupTests(TestCase):
+    """Test veritabanı bağlantısı kapatılamayacağı için close_databases devre dışı bırakılır"""
+
+    def setUp(self):
+        self.initial_state = dict(warmup.state)
+        self.addCleanup(warmup.state.update, self.initial_state)
+        warmup.state.update(status='pending', started_at=None, duration_ms=None, steps={}, failed_steps=[])
+        patcher = mock.patch.object(warmup, 'close_databases')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ready_only_after_warmup(self):
+        response = self.client.get('/ready')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['warmup']['status'], 'pending')
+
+        state = warmup.run()
+        self.assertEqual(state['status'], 'ready', state['failed_steps'])
+        self.assertEqual(set(state['steps']), {name for name, _ in warmup.STEPS})
+
+        response = self.client.get('/ready')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['database'])
+
+    def test_failed_step_does_not_stop_others(self):
+        with mock.patch.object(warmup, 'STEPS', (('broken', mock.Mock(side_effect=RuntimeError)), ('ok', mock.Mock()))):
+            with self.assertLogs('core.warmup', 'ERROR'):
+                state = warmup.run()
+        self.assertEqual(state['status'], 'failed')
+        self.assertEqual(state['failed_steps'], ['broken'])
+        self.assertIn('ok', state['steps'])
+        self.assertEqual(self.client.get('/ready').status_code, 503)
+
+        with override_settings(READY_REQUIRES_WARMUP=False):
+            self.assertEqual(self.client.get('/ready').status_code, 200)
+
+    @override_settings(WARMUP_ENABLED=False)
+    def test_ready_without_warmup_when_disabled(self):
+        self.assertEqual(self.client.get('/ready').status_code, 200)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class AuthUserCacheTests(TestCase):
+    """Kimlik doğrulamada kullanıcı cache'i değişikliklerden sonra eski veri vermemelidir"""
+
+    def setUp(self):
+        reset_caches()
+        self.user = User.objects.create_user('okuyan')
+        self.auth = CustomJWTAuthentication()
+        self.token = self.auth.get_validated_token(str(AccessToken.for_user(self.user)))
+
+    def test_cached_user_until_changed(self):
+        self.auth.get_user(self.token)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.auth.get_user(self.token).pk, self.user.pk)
+
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+    def test_cache_holds_only_auth_fields(self):
+        self.user.first_name, self.user.last_name, self.user.is_staff = 'Ayşe', 'Kaya', True
+        self.user.set_password('gizli-parola')
+        self.user.save()
+        self.token = self.auth.get_validated_token(str(AccessToken.for_user(self.user)))
+        self.auth.get_user(self.token)
+
+        version = get_user_cache_version(self.user.pk)
+        cached = cache.get(f'auth_user:{self.user.pk}:v{version}:fields')
+        self.assertEqual(dict(zip(CACHED_USER_FIELDS, cached)), {
+            'id': self.user.pk, 'username': 'okuyan', 'is_active': True, 'is_superuser': False, 'is_staff': True,
+        })
+        self.assertNotIn(self.user.password.encode(), pickle.dumps(cached))
+
+        with self.assertNumQueries(0):
+            user = self.auth.get_user(self.token)
+            self.assertEqual(
+                (user.pk, user.username, user.is_active, user.is_superuser, user.is_staff),
+                (self.user.pk, 'okuyan', True, False, True),
+            )
+        # Diğer alanlar ertelenmiştir; erişildiğinde okunur
+        self.assertEqual(user.get_deferred_fields(), {'password', 'last_login', 'first_name', 'last_name',
+                                                      'email', 'date_joined'})
+        self.assertEqual(user.get_full_name(), 'Ayşe Kaya')
+
+    def test_change_during_fetch_is_not_cached(self):
+        fetch = JWTAuthentication.get_user
+
+        def racing_fetch(auth, validated_token):
+            # Satır okunduktan sonra, cache'e yazılmadan önce başka bir istek kullanıcıyı pasifleştirir
+            stale = fetch(auth, validated_token)
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+            invalidate_cached_user(self.user.pk)
+            return stale
+
+        with mock.patch.object(JWTAuthentication, 'get_user', racing_fetch):
+            self.auth.get_user(self.token)
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+
+class FixedResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FastRendererTests(SimpleTestCase):
+    """FastCustomJSONRenderer, CustomJSONRenderer ile byte-byte aynı çıktı vermelidir"""
+
+    def setUp(self):
+        self.baseline = CustomJSONRenderer()
+        self.fast = FastCustomJSONRenderer()
+        # Zaman damgası iki renderer'da aynı olsun
+        self.baseline._get_timestamp = self.fast._get_timestamp = lambda: '2024-01-01T00:00:00.000000'
+
+    def assertSameBytes(self, data, status_code=200, accepted_media_type=None):
+        context = {'response': FixedResponse(status_code)}
+        self.assertEqual(
+            self.fast.render(data, accepted_media_type, context),
+            self.baseline.render(data, accepted_media_type, context),
+        )
+
+    def test_floats(self):
+        self.assertSameBytes({'values': [1e16, 1e-05, 0.00001234, 1.5, -0.0, 123456789.125, 2.0, 1e300]})
+        self.assertSameBytes([{'price': 0.1 + 0.2, 'note': 'fiyat 1e5 TL, oran 0.00001'}])
+
+    def test_line_separators(self):
+        self.assertSameBytes({'name': 'satır\u2028ayraç\u2029paragraf', 'items': ['\u2028']})
+
+    def test_error_envelope(self):
+        self.assertSameBytes({'name': ['Bu alan zorunludur.'], 'detail': 'Hata'}, status_code=400)
+        self.assertSameBytes({'non_field_errors': ['Geçersiz.'], 'priority': 'Sayı olmalı'}, status_code=400)
+        self.assertSameBytes({'detail': 'Bulunamadı.'}, status_code=404)
+        self.assertSameBytes(None, status_code=500)
+
+    def test_success_envelope(self):
+        self.assertSameBytes({'message': 'Tamam', 'results': [{'id': 1, 'name': 'İş'}]})
+        self.assertSameBytes({'results': []}, status_code=201)
+        self.assertSameBytes([])
+        self.assertSameBytes({'id': 1}, accepted_media_type='application/json; indent=2')
+
+    def test_iter_render(self):
+        context = {'response': FixedResponse(200)}
+        rows = [{'id': index, 'price': index / 3, 'name': f'İş {index}'} for index in range(7)]
+        expected = self.baseline.render(rows, None, context)
+        with mock.patch.object(FastCustomJSONRenderer, 'CHUNK_SIZE', 3):
+            chunks = list(self.fast.iter_render(rows, context))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(b''.join(chunks), expected)
+
+        # Parçalar üretildikçe kodlanır; boş parçalar atlanır
+        chunked = ChunkedList(iter([rows[:2], [], rows[2:]]))
+        self.assertEqual(b''.join(self.fast.iter_render(chunked, context)), expected)
+        self.assertEqual(
+            b''.join(self.fast.iter_render(ChunkedList(iter([[], []])), context)),
+            self.baseline.render([], None, context),
+        )
+        for data, status_code in (([], 200), ({'message': 'Tamam', 'id': 1}, 200), ({'detail': 'Yok'}, 404)):
+            context = {'response': FixedResponse(status_code)}
+            self.assertEqual(b''.join(self.fast.iter_render(data, context)), self.baseline.render(data, None, context))
+
+    def test_iter_render_dict_with_chunked_value(self):
+        # Dict içindeki ChunkedList akıtılır; öncesindeki/sonrasındaki anahtarlar ve mesaj korunur
+        context = {'response': FixedResponse(200)}
+        rows = [{'id': index, 'name': f'Kullanıcı {index}'} for index in range(5)]
+        for data in (
+            {'message': 'Matris', 'columns': ['a', 'b'], 'users': rows, 'total': 5},
+            {'users': rows},
+            {'users': []},
+        ):
+            with self.subTest(keys=list(data)):
+                chunked = {
+                    key: ChunkedList(iter([value[:2], value[2:]])) if key == 'users' else value
+                    for key, value in data.items()
+                }
+                self.assertEqual(
+                    b''.join(self.fast.iter_render(chunked, context)), self.baseline.render(data, None, context)
+                )
+
+    def test_float_mismatch_detection(self):
+        # orjson 1e16 yazar, stdlib 1e+16; string içindeki benzer metin sayı sayılmaz
+        self.assertTrue(self.fast._has_float_mismatch(b'{"a":1e16}'))
+        self.assertTrue(self.fast._has_float_mismatch(b'[1,0.00001]'))
+        self.assertFalse(self.fast._has_float_mismatch(b'{"a":"1e5 0.00001"}'))
+        self.assertFalse(self.fast._has_float_mismatch(b'{"a":1.5}'))
+
+
+class SlowQueryHelperTests(SimpleTestCase):
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            slow_queries.normalize_sql("SELECT *  FROM t\n WHERE name = 'O''Brien' AND id = 42 AND x > 1.5"),
+            'SELECT * FROM t WHERE name = ? AND id = ? AND x > ?',
+        )
+        # IN listesinin uzunluğu parmak izini değiştirmez
+        self.assertEqual(
+            slow_queries.normalize_sql('SELECT a FROM t WHERE id IN (%s, %s, %s)'),
+            slow_queries.normalize_sql('SELECT a FROM t WHERE id IN (%s)'),
+        )
+        self.assertEqual(slow_queries.normalize_sql('SELECT a FROM t WHERE id IN (?, ?)'), 'SELECT a FROM t WHERE id IN (...)')
+        # Tablo/kolon adlarındaki rakamlar korunur
+        self.assertEqual(slow_queries.normalize_sql('SELECT col1 FROM t2'), 'SELECT col1 FROM t2')
+
+    def test_fingerprint(self):
+        first = slow_queries.fingerprint(slow_queries.normalize_sql('SELECT a FROM t WHERE id = 1'))
+        second = slow_queries.fingerprint(slow_queries.normalize_sql('SELECT a  FROM t WHERE id = 2'))
+        other = slow_queries.fingerprint(slow_queries.normalize_sql('SELECT b FROM t WHERE id = 1'))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(len(first), 16)
+
+    def test_redact_params(self):
+        self.assertEqual(
+            slow_queries.redact_params([1, 2.5, Decimal('3'), True, None, date(2024, 1, 2), 'gizli', b'ab', object()]),
+            [1, 2.5, Decimal('3'), True, None, '2024-01-02', '<redacted len=5>', '<redacted len=2>', '<object>'],
+        )
+        self.assertEqual(slow_queries.redact_params({'id': 5, 'email': 'a@b.c'}), {'id': 5, 'email': '<redacted len=5>'})
+        self.assertIsNone(slow_queries.redact_params(None))
+        self.assertEqual(len(slow_queries.redact_params(range(100))), slow_queries.MAX_PARAMS)
+        self.assertEqual(
+            slow_queries.redact_params([('ad', 1), ('soyad', 2)], many=True),
+            {'rows': 2, 'first': ['<redacted len=2>', 1]},
+        )
+        self.assertEqual(slow_queries.redact_params([], many=True), {'rows': 0, 'first': None})
+
+
+class StubShowplanCursor:
+    """SQL Server SHOWPLAN_TEXT davranışı: ilk sonuç kümesi sorgu metni, ikincisi plan"""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = fail_on
+        self.executed = []
+        self.result_sets = []
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+        if sql in self.fail_on:
+            raise RuntimeError(f'{sql} başarısız')
+        if sql.startswith('SELECT'):
+            self.result_sets = [[(sql,)], [('|--Clustered Index Scan(OBJECT:([t]))',)]]
+
+    def fetchall(self):
+        return self.result_sets[0]
+
+    def nextset(self):
+        self.result_sets = self.result_sets[1:]
+        return True if self.result_sets else None
+
+    def close(self):
+        self.closed = True
+
+
+class StubMssqlConnection:
+    vendor = 'microsoft'
+    alias = 'default'
+
+    def __init__(self, cursor):
+        self.connection = object()
+        self.cursor = cursor
+        self.discarded = False
+
+    def create_cursor(self):
+        return self.cursor
+
+    def discard(self):
+        self.discarded = True
+
+
+class ExplainTests(SimpleTestCase):
+    databases = {'default'}
+
+    def _explain(self, stub, sql='SELECT a FROM t WHERE id = %s'):
+        slow_query = slow_queries.SlowQuery(sql, (1,), False, 1.0, stub)
+        with mock.patch('django.db.connections', {'default': stub}):
+            return slow_queries.explain(slow_query)
+
+    def test_showplan_reads_second_result_set(self):
+        cursor = StubShowplanCursor()
+        stub = StubMssqlConnection(cursor)
+        self.assertEqual(self._explain(stub), ['|--Clustered Index Scan(OBJECT:([t]))'])
+        self.assertEqual(cursor.executed[0], 'SET SHOWPLAN_TEXT ON')
+        self.assertEqual(cursor.executed[-1], 'SET SHOWPLAN_TEXT OFF')
+        self.assertTrue(cursor.closed)
+        self.assertFalse(stub.discarded)
+
+    def test_showplan_reset_after_query_error(self):
+        cursor = StubShowplanCursor(fail_on=('SELECT a FROM t WHERE id = %s',))
+        stub = StubMssqlConnection(cursor)
+        plan = self._explain(stub)
+        self.assertTrue(plan[0].startswith('plan alınamadı'))
+        self.assertEqual(cursor.executed[-1], 'SET SHOWPLAN_TEXT OFF')
+        self.assertFalse(stub.discarded)
+
+    def test_connection_discarded_when_reset_fails(self):
+        cursor = StubShowplanCursor(fail_on=('SELECT a FROM t WHERE id = %s', 'SET SHOWPLAN_TEXT OFF'))
+        stub = StubMssqlConnection(cursor)
+        with self.assertLogs('core.slow_queries', 'ERROR'):
+            self._explain(stub)
+        self.assertTrue(cursor.closed)
+        self.assertTrue(stub.discarded)
+
+    def test_showplan_not_enabled_when_on_fails(self):
+        cursor = StubShowplanCursor(fail_on=('SET SHOWPLAN_TEXT ON',))
+        stub = StubMssqlConnection(cursor)
+        self._explain(stub)
+        self.assertEqual(cursor.executed, ['SET SHOWPLAN_TEXT ON'])
+        self.assertFalse(stub.discarded)
+
+    def test_only_select_is_explained(self):
+        cursor = StubShowplanCursor()
+        stub = StubMssqlConnection(cursor)
+        self.assertIsNone(self._explain(stub, sql="UPDATE t SET a = 1"))
+        self.assertEqual(cursor.executed, [])
+
+
+class SqliteExplainTests(TestCase):
+
+    def test_query_plan(self):
+        connection.ensure_connection()
+        slow_query = slow_queries.SlowQuery(
+            'SELECT id FROM auth_user WHERE username = %s', ('admin',), False, 1.0, connection
+        )
+        plan = slow_queries.explain(slow_query)
+        self.assertTrue(plan)
+        self.assertFalse(plan[0].startswith('plan alınamadı'))
+
+
+class SlowQueryReportTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.log = os.path.join(directory.name, 'slow_queries.log')
+
+    def _write(self, path, records):
+        with open(path, 'w', encoding='utf-8') as handle:
+            for record in records:
+                # Log formatı satır başına önek ekler; rapor '{' ile başlayan kısmı okur
+                handle.write(f'WARNING core.slow_queries {json.dumps(record)}\n')
+            handle.write('bozuk satır {\n')
+
+    def _record(self, key, duration, view='WorkflowViewSet.list', plan=None):
+        return {'fingerprint': key, 'sql': f'SELECT {key}', 'duration_ms': duration, 'view': view,
+                'stack': [f'workflows/views.py:1 {key}'], 'plan': plan}
+
+    def _report(self, *args):
+        out = StringIO()
+        call_command('slow_query_report', '--log', self.log, '--json', *args, stdout=out)
+        return json.loads(out.getvalue())
+
+    def test_groups_across_rotated_files(self):
+        self._write(self.log, [self._record('a', 10), self._record('b', 300)])
+        self._write(f'{self.log}.1', [
+            self._record('a', 30, view='UserViewSet.list', plan=['SCAN t']), self._record('a', 20),
+        ])
+
+        report = self._report()
+        self.assertEqual([group['fingerprint'] for group in report], ['b', 'a'])
+        group = report[1]
+        self.assertEqual(group['count'], 3)
+        self.assertEqual(group['total_ms'], 60)
+        self.assertEqual(group['max_ms'], 30)
+        self.assertEqual(group['views'], {'WorkflowViewSet.list': 2, 'UserViewSet.list': 1})
+        self.assertEqual(group['plan'], ['SCAN t'])
+
+        self.assertEqual([group['fingerprint'] for group in self._report('--sort', 'count')], ['a', 'b'])
+        self.assertEqual([group['fingerprint'] for group in self._report('--top', '1')], ['b'])
+        filtered = self._report('--view', 'UserViewSet.list')
+        self.assertEqual([(group['fingerprint'], group['count']) for group in filtered], [('a', 1)])
+
+    def test_text_output(self):
+        self._write(self.log, [self._record('a', 10, plan=['SCAN t'])])
+        out = StringIO()
+        call_command('slow_query_report', '--log', self.log, stdout=out)
+        self.assertIn('adet=1', out.getvalue())
+        self.assertIn('plan: SCAN t', out.getvalue())
+
+    def test_missing_log(self):
+        with self.assertRaises(CommandError):
+            call_command('slow_query_report', '--log', self.log, stdout=StringIO())
+
+
+class FakeConnection:
+    """Ham DB-API bağlantısı yerine; ping ve rollback hataları ayarlanabilir"""
+
+    def __init__(self):
+        self.ping_fails = False
+        self.rollback_fails = False
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql):
+        if self.ping_fails:
+            raise RuntimeError('bağlantı koptu')
+
+    def fetchall(self):
+        return [(1,)]
+
+    def rollback(self):
+        if self.rollback_fails:
+            raise RuntimeError('rollback başarısız')
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class ConnectionPoolTests(SimpleTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(pool_module, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.opened = []
+
+    def connect(self):
+        connection = FakeConnection()
+        self.opened.append(connection)
+        return connection
+
+    def make_pool(self, **options):
+        return ConnectionPool('default:test', **{'size': 2, 'timeout': 0.05, **options})
+
+    def test_idle_connection_is_reused(self):
+        pool = self.make_pool()
+        first = pool.checkout(self.connect)
+        pool.checkin(first)
+        self.assertIs(pool.checkout(self.connect), first)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_pre_ping_failure_reconnects(self):
+        pool = self.make_pool(ping_after=5)
+        first = pool.checkout(self.connect)
+        pool.checkin(first)
+        first.ping_fails = True
+
+        # Kısa süre boşta kalan bağlantı ping'lenmez
+        self.clock.now += 1
+        self.assertIs(pool.checkout(self.connect), first)
+        pool.checkin(first)
+
+        self.clock.now += 10
+        with self.assertLogs('core.db.pool', 'WARNING'):
+            second = pool.checkout(self.connect)
+        self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+        stats = pool.stats()
+        self.assertEqual((stats['ping_failures'], stats['discarded'], stats['created']), (1, 1, 2))
+        self.assertEqual((stats['open'], stats['in_use'], stats['idle']), (1, 1, 0))
+
+    def test_max_lifetime_expiry(self):
+        pool = self.make_pool(max_lifetime=60, pre_ping=False)
+        first = pool.checkout(self.connect)
+        pool.checkin(first)
+
+        # Boşta süresi dolan bağlantı checkout'ta atılır
+        self.clock.now += 61
+        second = pool.checkout(self.connect)
+        self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+
+        # Kullanımdayken süresi dolan bağlantı iadede atılır
+        self.clock.now += 61
+        pool.checkin(second)
+        self.assertTrue(second.closed)
+        self.assertEqual(pool.stats()['idle'], 0)
+        self.assertEqual(pool.stats()['discarded'], 2)
+
+    def test_timeout_when_exhausted(self):
+        pool = self.make_pool(size=1)
+        pool.checkout(self.connect)
+        # Bekleme süresi gerçek saatle ölçülür
+        started = time.monotonic()
+        with mock.patch.object(pool_module, 'time', time), self.assertRaises(PoolTimeout):
+            pool.checkout(self.connect)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        stats = pool.stats()
+        self.assertEqual((stats['waits'], stats['timeouts'], stats['open']), (1, 1, 1))
+
+    def test_waiter_gets_returned_connection(self):
+        pool = self.make_pool(size=1, timeout=5)
+        with mock.patch.object(pool_module, 'time', time):
+            first = pool.checkout(self.connect)
+            timer = threading.Timer(0.05, pool.checkin, (first,))
+            timer.start()
+            self.assertIs(pool.checkout(self.connect), first)
+        timer.join()
+        stats = pool.stats()
+        self.assertEqual((stats['waits'], stats['timeouts'], stats['created']), (1, 0, 1))
+        self.assertGreater(stats['wait_seconds'], 0)
+
+    def test_discard_and_failed_rollback(self):
+        pool = self.make_pool()
+        first = pool.checkout(self.connect)
+        pool.checkin(first, discard=True)
+        self.assertTrue(first.closed)
+
+        second = pool.checkout(self.connect)
+        second.rollback_fails = True
+        pool.checkin(second)
+        self.assertTrue(second.closed)
+        self.assertEqual(pool.stats()['discarded'], 2)
+        self.assertEqual(pool.stats()['open'], 0)
+
+    def test_connect_failure_releases_slot(self):
+        pool = self.make_pool(size=1)
+
+        def failing_connect():
+            raise RuntimeError('sunucuya ulaşılamadı')
+
+        with self.assertRaises(RuntimeError):
+            pool.checkout(failing_connect)
+        self.assertEqual(pool.stats()['connect_failures'], 1)
+        self.assertEqual(pool.stats()['open'], 0)
+        pool.checkout(self.connect)
+
+    def test_foreign_connection_is_closed(self):
+        pool = self.make_pool()
+        foreign = FakeConnection()
+        pool.checkin(foreign)
+        self.assertTrue(foreign.closed)
+        self.assertEqual(pool.stats()['checkins'], 0)
+
+
+class PoolRegistryTests(SimpleTestCase):
+
+    def setUp(self):
+        # Modül düzeyindeki havuzlar test boyunca boş başlar, sonra geri yüklenir
+        patcher = mock.patch.dict(pool_module._pools, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_all_pool_stats(self):
+        default = pool_module.get_pool(('default', 'db'), {'SIZE': 3, 'PRE_PING': False})
+        self.assertIs(pool_module.get_pool(('default', 'db'), None), default)
+        replica = pool_module.get_pool(('replica', 'db'), None)
+
+        first = default.checkout(FakeConnection)
+        second = default.checkout(FakeConnection)
+        default.checkin(first)
+        replica.checkin(replica.checkout(FakeConnection), discard=True)
+
+        stats = pool_module.all_pool_stats()
+        self.assertEqual(set(stats), {'default:db', 'replica:db'})
+        expected = {'size': 3, 'open': 2, 'idle': 1, 'in_use': 1, 'checkouts': 2, 'checkins': 1, 'created': 2}
+        self.assertEqual({key: stats['default:db'][key] for key in expected}, expected)
+        self.assertEqual(stats['replica:db']['discarded'], 1)
+        self.assertEqual(stats['replica:db']['size'], pool_module.DEFAULT_POOL_OPTIONS['SIZE'])
+        default.checkin(second)
+
+    def test_reset_after_fork(self):
+        parent_pool = pool_module.get_pool(('default', 'db'), None)
+        inherited = parent_pool.checkout(FakeConnection)
+
+        with mock.patch.object(pool_module, '_pools_lock', pool_module._pools_lock):
+            pool_module._reset_after_fork()
+            self.assertEqual(pool_module.all_pool_stats(), {})
+            child_pool = pool_module.get_pool(('default', 'db'), None)
+            self.assertIsNot(child_pool, parent_pool)
+
+            # Fork öncesi alınmış bağlantı yeni havuza ait değildir; iade edilince kapatılır
+            child_pool.checkin(inherited)
+            self.assertTrue(inherited.closed)
+            self.assertEqual(child_pool.stats()['idle'], 0)
+
+
+
+@override_settings(METRICS_DIR='')
+class MetricsTests(SimpleTestCase):
+    """Prometheus çıktısı ve çok process'li modda process dosyalarının birleştirilmesi"""
+
+    def setUp(self):
+        self.registry = metrics.MetricsRegistry()
+        for patcher in (
+            mock.patch.object(metrics, 'registry', self.registry),
+            mock.patch.dict(pool_module._pools, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def lines(self, name):
+        return [line for line in metrics.render_prometheus().splitlines() if line.split('{')[0].split(' ')[0] == name]
+
+    def test_prometheus_exposition(self):
+        metrics.inc('http_requests_total', view='WorkflowViewSet.list', method='GET', status='200')
+        metrics.inc('http_requests_total', 2, view='WorkflowViewSet.list', method='GET', status='200')
+        metrics.inc('db_query_seconds_total', 0.25, view='a"b')
+        metrics.observe('http_request_duration_seconds', 0.03, view='list', method='GET')
+        metrics.observe('http_request_duration_seconds', 20, view='list', method='GET')
+
+        output = metrics.render_prometheus()
+        self.assertIn(
+            '# HELP http_requests_total Tamamlanan istek sayısı\n'
+            '# TYPE http_requests_total counter\n'
+            'http_requests_total{method="GET",status="200",view="WorkflowViewSet.list"} 3\n',
+            output,
+        )
+        self.assertIn('db_query_seconds_total{view="a\\"b"} 0.25\n', output)
+
+        self.assertIn('# TYPE http_request_duration_seconds histogram', output)
+        buckets = [line for line in output.splitlines() if line.startswith('http_request_duration_seconds_bucket')]
+        self.assertEqual(len(buckets), len(metrics.LATENCY_BUCKETS) + 1)
+        # Kovalar birikimlidir; 20 sn hiçbir sınıra girmez, yalnızca +Inf'te sayılır
+        self.assertEqual(buckets[0], 'http_request_duration_seconds_bucket{method="GET",view="list",le="0.005"} 0')
+        self.assertEqual(buckets[3], 'http_request_duration_seconds_bucket{method="GET",view="list",le="0.05"} 1')
+        self.assertEqual(buckets[-2], 'http_request_duration_seconds_bucket{method="GET",view="list",le="10.0"} 1')
+        self.assertEqual(buckets[-1], 'http_request_duration_seconds_bucket{method="GET",view="list",le="+Inf"} 2')
+        self.assertIn('http_request_duration_seconds_sum{method="GET",view="list"} 20.03\n', output)
+        self.assertIn('http_request_duration_seconds_count{method="GET",view="list"} 2\n', output)
+        self.assertTrue(output.endswith('\n'))
+
+    def test_pool_counters_have_no_process_label(self):
+        pool = pool_module.get_pool(('default', 'db'), {'SIZE': 2, 'PRE_PING': False})
+        pool.checkin(pool.checkout(FakeConnection))
+
+        self.assertIn('db_pool_events_total{event="checkouts",pool="default:db"} 1', self.lines('db_pool_events_total'))
+        self.assertEqual(len(self.lines('db_pool_events_total')), len(metrics.POOL_EVENTS))
+
+    def test_merges_process_files(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        directory = temp_dir.name
+        # Diğer worker'ların (biri kapanmış olabilir) dosyaları
+        for worker, (requests, checkouts, duration) in enumerate(((4, 10, 0.02), (6, 5, 0.4))):
+            path = os.path.join(directory, f'metrics_{1000 + worker}_0.json')
+            with open(path, 'w') as handle:
+                json.dump({
+                    'counters': [
+                        ['http_requests_total', {'view': 'list', 'method': 'GET', 'status': '200'}, requests],
+                        ['db_pool_events_total', {'pool': 'default:db', 'event': 'checkouts'}, checkouts],
+                    ],
+                    'histograms': [
+                        ['http_request_duration_seconds', {'view': 'list', 'method': 'GET'},
+                         [int(duration <= bound) for bound in metrics.LATENCY_BUCKETS], duration, 1],
+                    ],
+                }, handle)
+        # Yarım kalmış ya da bozuk dosyalar atlanır
+        with open(os.path.join(directory, 'metrics_1002_0.json'), 'w') as handle:
+            handle.write('{"counters": [')
+
+        pool = pool_module.get_pool(('default', 'db'), {'SIZE': 2, 'PRE_PING': False})
+        pool.checkin(pool.checkout(FakeConnection))
+        metrics.inc('http_requests_total', view='list', method='GET', status='200')
+
+        with override_settings(METRICS_DIR=directory):
+            output = metrics.render_prometheus()
+            # Bu process'in dosyası da yazılmıştır
+            self.assertEqual(len(os.listdir(directory)), 4)
+
+        self.assertIn('http_requests_total{method="GET",status="200",view="list"} 11\n', output)
+        self.assertIn('db_pool_events_total{event="checkouts",pool="default:db"} 16\n', output)
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",view="list",le="0.025"} 1\n', output)
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",view="list",le="+Inf"} 2\n', output)
+        self.assertIn('http_request_duration_seconds_count{method="GET",view="list"} 2\n', output)
+        self.assertNotIn('pid=', output)
+
+        with override_settings(METRICS_DIR=directory):
+            metrics.clear_metrics_dir()
+        self.assertEqual(os.listdir(directory), [])
+
+class PooledBackendTests(SimpleTestCase):
+    """Havuzlu SQLite backend'i: kapatma havuza iade, bozuk durumdaki bağlantı atılır"""
+
+    def setUp(self):
+        patcher = mock.patch.dict(pool_module._pools, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.raw_connections = []
+        real_connect = SQLiteDatabaseWrapper.get_new_connection
+
+        def counting_connect(wrapper, conn_params):
+            raw = real_connect(wrapper, conn_params)
+            self.raw_connections.append(raw)
+            return raw
+
+        patcher = mock.patch.object(SQLiteDatabaseWrapper, 'get_new_connection', counting_connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Bellek içi SQLite bağlantısını Django hiç kapatmaz; havuz dosya veritabanıyla denenir
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.name = os.path.join(directory.name, 'pool.sqlite3')
+        settings_dict = {**connections['default'].settings_dict, 'NAME': self.name, 'POOL': {'SIZE': 2}}
+        self.wrapper = PooledSQLiteWrapper(settings_dict, alias='pooltest')
+        self.addCleanup(self.close_all)
+
+    def close_all(self):
+        self.wrapper.in_atomic_block = False
+        self.wrapper.close()
+        pool_module.close_idle_connections()
+
+    def pool_stats(self):
+        return pool_module.all_pool_stats()[f'pooltest:{self.name}']
+
+    def test_close_returns_connection(self):
+        self.wrapper.ensure_connection()
+        raw = self.wrapper.connection
+        self.wrapper.close()
+        self.assertEqual(self.pool_stats()['idle'], 1)
+
+        self.wrapper.ensure_connection()
+        self.assertIs(self.wrapper.connection, raw)
+        self.assertEqual(len(self.raw_connections), 1)
+
+    def test_close_in_atomic_block_discards(self):
+        connections['pooltest'] = self.wrapper
+        self.addCleanup(connections.__delitem__, 'pooltest')
+        with self.assertRaises(RuntimeError), transaction.atomic(using='pooltest'):
+            self.wrapper.close()
+            raise RuntimeError('transaction ortasında kapatıldı')
+        stats = self.pool_stats()
+        self.assertEqual((stats['discarded'], stats['idle'], stats['open']), (1, 0, 0))
+
+    def test_errors_occurred_discards_unusable(self):
+        self.wrapper.ensure_connection()
+        self.wrapper.errors_occurred = True
+        with mock.patch.object(PooledSQLiteWrapper, 'is_usable', return_value=False):
+            self.wrapper.close()
+        self.assertEqual(self.pool_stats()['discarded'], 1)
+
+        # Hata alıp hâlâ kullanılabilir bağlantı havuza döner
+        self.wrapper.ensure_connection()
+        self.wrapper.errors_occurred = True
+        self.wrapper.close()
+        self.assertEqual(self.pool_stats()['idle'], 1)
+
+    def test_discard(self):
+        self.wrapper.ensure_connection()
+        self.wrapper.discard()
+        self.assertIsNone(self.wrapper.connection)
+        self.assertEqual(self.pool_stats()['discarded'], 1)
+        self.wrapper.ensure_connection()
+        self.wrapper.close()
+        self.assertEqual(self.pool_stats()['idle'], 1)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None, REQUEST_TIMING_ENABLED=True)
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class RequestTimingTests(TestCase):
+    """Server-Timing başlığı ve istek başına tek satırlık JSON log kaydı"""
+
+    URL = '/api/categories/'
+
+    def setUp(self):
+        reset_caches()
+        self.user = User.objects.create_user('olculen')
+        self.client = client_for(self.user)
+
+    def test_server_timing_header_and_log_record(self):
+        with self.assertLogs('core.timing', 'INFO') as logs:
+            response = self.client.get(self.URL, HTTP_X_REQUEST_ID='istek-42')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Request-ID'], 'istek-42')
+
+        entries = {}
+        for part in response['Server-Timing'].split(', '):
+            name, _, params = part.partition(';')
+            entries[name] = dict(param.split('=', 1) for param in params.split(';'))
+        self.assertEqual(list(entries), ['db', 'ser', 'perm', 'render', 'total'])
+        for values in entries.values():
+            self.assertGreaterEqual(float(values['dur']), 0)
+        self.assertGreaterEqual(float(entries['total']['dur']), float(entries['db']['dur']))
+
+        self.assertEqual(len(logs.records), 1)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(set(record), {
+            'request_id', 'method', 'path', 'status', 'user_id', 'duration_ms', 'db_queries', 'db_ms',
+            'serializer_ms', 'permissions_ms', 'render_ms', 'response_bytes',
+        })
+        self.assertEqual(
+            {key: record[key] for key in ('request_id', 'method', 'path', 'status', 'user_id', 'response_bytes')},
+            {'request_id': 'istek-42', 'method': 'GET', 'path': self.URL, 'status': 200,
+             'user_id': self.user.pk, 'response_bytes': len(response.content)},
+        )
+        self.assertEqual(entries['db']['desc'], f'"{record["db_queries"]} queries"')
+
+    def test_unsafe_request_id_is_replaced(self):
+        with self.assertLogs('core.timing', 'INFO') as logs:
+            response = self.client.get(self.URL, HTTP_X_REQUEST_ID='kötü id\n')
+        self.assertRegex(response['X-Request-ID'], r'^[0-9a-f]{32}$')
+        self.assertEqual(json.loads(logs.records[0].getMessage())['request_id'], response['X-Request-ID'])
+
+    def test_timing_log_not_sent_to_console(self):
+        timing_logger = logging.getLogger('core.timing')
+        self.assertFalse(timing_logger.propagate)
+        self.assertFalse(any(
+            type(handler) is logging.StreamHandler for handler in timing_logger.handlers
+        ))
+
+
+class StreamedRequestTimingTests(TestCase):
+    """Akışlı yanıtlarda log kaydı gövde bittiğinde gönderilen byte'lar ve render süresiyle yazılır"""
+
+    def setUp(self):
+        reset_caches()
+        from workflows.models import Work
+
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        for index in range(5):
+            Work.objects.create(name=f'İş {index}')
+        patcher = mock.patch.object(FastCustomJSONRenderer, 'CHUNK_SIZE', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_log_written_after_body(self):
+        client = client_for(self.admin)
+        with self.assertLogs('core.timing', 'INFO') as logs:
+            response = client.get('/api/workflows/', HTTP_X_REQUEST_ID='akis-1')
+            self.assertTrue(response.streaming)
+            self.assertIn('total;dur=', response['Server-Timing'])
+            self.assertEqual(logs.records, [])
+
+            # Kodlama yalnızca gövde üretilirken yavaşlatılır; süre render fazına eklenmeli
+            dumps = FastCustomJSONRenderer._dumps
+
+            def slow_dumps(renderer, obj):
+                time.sleep(0.002)
+                return dumps(renderer, obj)
+
+            with mock.patch.object(FastCustomJSONRenderer, '_dumps', slow_dumps):
+                body = b''.join(response.streaming_content)
+
+        self.assertEqual(len(logs.records), 1)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['request_id'], 'akis-1')
+        self.assertEqual(record['status'], 200)
+        self.assertEqual(record['response_bytes'], len(body))
+        self.assertGreaterEqual(record['render_ms'], 2)
+        self.assertGreaterEqual(record['db_queries'], 1)
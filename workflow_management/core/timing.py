@@ -0,0 +1,122 @@
+# core/timing.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from core.db.slow_queries import SlowQuery
+
+# Server-Timing başlığındaki kısa adlar
+PHASES = {
+    'serializer': 'ser',
+    'permissions': 'perm',
+    'render': 'render',
+}
+
+
+class RequestTimings:
+    """Bir isteğin süre ve sorgu ölçümleri"""
+    __slots__ = ('started', 'db_queries', 'db_time', 'phases', 'slow_threshold', 'slow_queries', '_active')
+
+    def __init__(self, slow_threshold=None):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        # Bu süreyi (saniye) aşan sorgular core.db.slow_queries ile log'a yazılır
+        self.slow_threshold = slow_threshold
+        self.slow_queries = []
+        self._active = set()
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper olarak kullanılır
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.db_time += duration
+            self.db_queries += 1
+            if self.slow_threshold is not None and duration >= self.slow_threshold:
+                self.slow_queries.append(SlowQuery(sql, params, many, duration, context['connection']))
+
+
+_current = ContextVar('request_timings', default=None)
+
+
+def start(slow_threshold=None):
+    timings = RequestTimings(slow_threshold)
+    return timings, _current.set(timings)
+
+
+def resume(timings):
+    """Yanıt döndükten sonra (akışlı gövde üretilirken) ölçümü yeniden etkinleştirir"""
+    return _current.set(timings)
+
+
+def stop(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def timed(phase):
+    """
+    Blok süresini aktif isteğin ilgili fazına ekler.
+    İç içe çağrılarda yalnızca en dıştaki ölçülür; istek dışında maliyetsizdir.
+    """
+    timings = _current.get()
+    if timings is None or phase in timings._active:
+        yield
+        return
+
+    timings._active.add(phase)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.phases[phase] += time.perf_counter() - started
+        timings._active.discard(phase)
+
+
+def timed_phase(phase):
+    """timed() için decorator"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_serializers():
+    """
+    DRF serializer'larının to_representation çağrılarını 'serializer' fazına bağlar.
+    Liste serializer'ı dıştaki çağrı olduğundan eleman başına ek maliyet yoktur.
+    """
+    from rest_framework import serializers
+
+    for serializer_class in (serializers.Serializer, serializers.ListSerializer):
+        method = serializer_class.to_representation
+        if getattr(method, '_timed', False):
+            continue
+        wrapped = timed_phase('serializer')(method)
+        wrapped._timed = True
+        serializer_class.to_representation = wrapped
+
+
+def server_timing_header(timings, total):
+    parts = [
+        f'db;dur={timings.db_time * 1000:.1f};desc="{timings.db_queries} queries"',
+    ]
+    for phase, short_name in PHASES.items():
+        parts.append(f'{short_name};dur={timings.phases[phase] * 1000:.1f}')
+    parts.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(parts)
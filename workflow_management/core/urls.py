@@ -0,0 +1,9 @@
+# core/urls.py
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('', views.profile_list, name='profile-list'),
+    path('<str:profile_id>/', views.profile_detail, name='profile-detail'),
+]
@@ -1,3 +1,95 @@
-from django.shortcuts import render
+# core/views.py
+import hmac
 
-# Create your views here.
+from django.conf import settings
+from django.db import connections
+from django.http import FileResponse, HttpResponse, HttpResponseForbidden, HttpResponseNotFound, JsonResponse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from authentication.permissions import IsSuperUser
+from core import metrics, profiling, warmup
+
+LOCAL_ADDRESSES = {'127.0.0.1', '::1'}
+
+
+def _metrics_allowed(request):
+    """METRICS_TOKEN tanımlıysa Bearer token, değilse yalnızca yerel adresler"""
+    token = settings.METRICS_TOKEN
+    if token:
+        header = request.headers.get('Authorization', '')
+        return hmac.compare_digest(header, f'Bearer {token}')
+    return request.META.get('REMOTE_ADDR') in LOCAL_ADDRESSES
+
+
+def metrics_view(request):
+    """Prometheus scrape uç noktası (text exposition formatı)"""
+    if not settings.METRICS_ENABLED:
+        return HttpResponseNotFound()
+    if not _metrics_allowed(request):
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        metrics.render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
+
+def ready_view(request):
+    """
+    Yük dengeleyici hazır olma kontrolü: ısınma tamamlanmış ve veritabanı erişilebilir olmalı.
+    Kimlik doğrulama gerektirmez; yalnızca durum ve adım süreleri döner.
+    """
+    database_ok = True
+    try:
+        connections['default'].ensure_connection()
+    except Exception:
+        database_ok = False
+
+    ready = database_ok and warmup.is_ready()
+    return JsonResponse(
+        {
+            'status': 'ready' if ready else 'not_ready',
+            'database': database_ok,
+            'warmup': {
+                'status': warmup.state['status'],
+                'duration_ms': warmup.state['duration_ms'],
+                'steps': warmup.state['steps'],
+                'failed_steps': warmup.state['failed_steps'],
+            },
+        },
+        status=200 if ready else 503
+    )
+
+
+@api_view(['GET'])
+@permission_classes([IsSuperUser])
+def profile_list(request):
+    """Kayıtlı istek profilleri (yeniden eskiye)"""
+    return Response(profiling.list_profiles())
+
+
+@api_view(['GET'])
+@permission_classes([IsSuperUser])
+def profile_detail(request, profile_id):
+    """
+    Profil özeti (DB süresi ve en maliyetli fonksiyonlar).
+    ?download=prof pstats dosyasını (snakeviz vb. için), ?download=txt metin raporu indirir.
+    """
+    metadata = profiling.load_profile(profile_id)
+    if metadata is None:
+        return Response({'message': 'Profil bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
+
+    download = request.query_params.get('download')
+    if download == 'prof':
+        return FileResponse(
+            open(profiling.profile_file(profile_id), 'rb'),
+            as_attachment=True,
+            filename=f'{profile_id}.prof'
+        )
+    if download == 'txt':
+        response = HttpResponse(profiling.profile_text(profile_id), content_type='text/plain; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{profile_id}.txt"'
+        return response
+    return Response(metadata)
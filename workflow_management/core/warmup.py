@@ -0,0 +1,197 @@
+# core/warmup.py
+"""
+Worker'lar fork edilmeden önce ilk istek maliyetlerinin ödenmesi (gunicorn.conf.py).
+
+preload_app ile uygulama master process'te bir kez yüklenir; run() burada
+URL çözücü regex'lerini, model _meta cache'lerini, serializer alanlarını,
+doğrulayıcı regex'lerini, süreç içi id haritaları ile kullanıcı arama indeksini
+ve ertelenmiş import'ları hazırlar. Worker'lar bu belleği copy-on-write ile
+paylaşır. Veritabanı bağlantıları fork'tan önce kapatılır; her worker kendi
+bağlantısını açar (connect_databases). Durum /ready uç noktasından okunur.
+"""
+import importlib
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# İstek sırasında ilk kullanımda import edilen modüller (bkz. core.profiling)
+DEFERRED_IMPORTS = ('cProfile', 'pstats')
+
+SERIALIZERS = (
+    'workflows.serializer.WorkflowSerializer',
+    'workflows.serializer.MovementSerializer',
+    'workflows.serializer.CategorySerializer',
+    'workflows.serializer.WorkTypeSerializer',
+    'workflows.serializer.SalesChannelSerializer',
+    'permissions.serializers.RoleSerializer',
+    'permissions.serializers.UserRoleSerializer',
+    'authentication.serializers.LoginSerializer',
+    'authentication.serializers.UserSerializer',
+)
+
+# Uygulama süreci içinde durum; fork ile worker'lara kopyalanır
+state = {
+    'status': 'pending',  # pending | running | ready | failed
+    'started_at': None,
+    'duration_ms': None,
+    'steps': {},
+    'failed_steps': [],
+}
+
+
+def _import_string(path):
+    module_name, _, name = path.rpartition('.')
+    return getattr(importlib.import_module(module_name), name)
+
+
+def import_deferred_modules():
+    for module_name in DEFERRED_IMPORTS:
+        importlib.import_module(module_name)
+
+
+def load_framework_classes():
+    """DRF, simplejwt ve Django auth backend sınıfları ilk erişimde import edilir"""
+    from django.contrib.auth import get_backends
+    from rest_framework.settings import IMPORT_STRINGS, api_settings
+    from rest_framework_simplejwt.settings import IMPORT_STRINGS as JWT_IMPORT_STRINGS
+    from rest_framework_simplejwt.settings import api_settings as jwt_settings
+    from rest_framework_simplejwt.state import token_backend
+
+    for name in IMPORT_STRINGS:
+        getattr(api_settings, name)
+    for name in JWT_IMPORT_STRINGS:
+        getattr(jwt_settings, name)
+    token_backend.get_verifying_key(None)
+    get_backends()
+
+
+def compile_url_patterns():
+    """URLconf import edilir, tüm desenlerin regex'leri derlenir ve reverse sözlüğü kurulur"""
+    from django.urls import URLResolver, get_resolver
+
+    def walk(resolver):
+        for pattern in resolver.url_patterns:
+            pattern.pattern.regex
+            if isinstance(pattern, URLResolver):
+                walk(pattern)
+
+    resolver = get_resolver()
+    walk(resolver)
+    resolver.reverse_dict
+
+
+def populate_model_meta():
+    """Model _meta cache'leri (alan haritaları, ilişkiler) ilk erişimde kurulur"""
+    from django.apps import apps
+
+    for model in apps.get_models():
+        model._meta.get_fields()
+        model._meta._forward_fields_map
+        model._meta.fields_map
+
+
+def build_serializers():
+    """Serializer alanları, liste okuma planı ve doğrulayıcılar (URLValidator regex'i dahil) bir kez kurulur"""
+    from django.core.validators import EmailValidator, URLValidator
+    from workflows.readers import work_list_reader
+
+    for path in SERIALIZERS:
+        serializer = _import_string(path)()
+        for field in serializer.fields.values():
+            field.validators
+
+    work_list_reader.compile()
+    URLValidator()('https://example.com/warmup')
+    EmailValidator()('warmup@example.com')
+
+
+def prime_lookup_maps():
+    """FK doğrulamasında kullanılan id haritaları ve kullanıcı arama indeksi"""
+    from authentication.autocomplete import user_index
+    from workflows.lookups import MODEL_ID_MAPS
+
+    for id_map in MODEL_ID_MAPS.values():
+        id_map.prime(())
+    user_index.search('', 1)
+
+
+def prime_role_masks():
+    """Rol yetki maskeleri paylaşılan cache'e yazılır"""
+    from permissions.bitmask import get_role_masks
+    from permissions.models import Role
+
+    get_role_masks(list(Role.objects.values_list('id', flat=True)))
+
+
+STEPS = (
+    ('imports', import_deferred_modules),
+    ('framework', load_framework_classes),
+    ('urls', compile_url_patterns),
+    ('model_meta', populate_model_meta),
+    ('serializers', build_serializers),
+    ('lookup_maps', prime_lookup_maps),
+    ('role_masks', prime_role_masks),
+)
+
+
+def close_databases():
+    """Fork öncesi açık bağlantı bırakılmaz (soketler worker'lar arasında paylaşılmamalı)"""
+    from core.db.pool import close_idle_connections
+
+    connections.close_all()
+    close_idle_connections()
+
+
+def run():
+    """
+    Isınma adımlarını çalıştırır. Bir adımın hatası diğerlerini durdurmaz;
+    hatalı adımlar loglanır ve durum 'failed' olur (READY_REQUIRES_WARMUP ile /ready 503 döner).
+    """
+    if not settings.WARMUP_ENABLED or state['status'] in ('running', 'ready'):
+        return state
+
+    state.update(status='running', started_at=time.time(), steps={}, failed_steps=[])
+    started = time.perf_counter()
+    for name, step in STEPS:
+        step_started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.exception('Isınma adımı başarısız: %s', name)
+            state['failed_steps'].append(name)
+        state['steps'][name] = round((time.perf_counter() - step_started) * 1000, 1)
+
+    close_databases()
+    state['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    state['status'] = 'failed' if state['failed_steps'] else 'ready'
+    logger.info('Isınma tamamlandı (%s ms): %s', state['duration_ms'], state['steps'])
+    return state
+
+
+def connect_databases():
+    """
+    Worker başlarken bağlantıları açar; ilk istek bağlantı kurma süresini ödemez.
+    Havuzlu bağlantı havuza boşta bağlantı olarak iade edilir (thread'li worker'larda
+    ana thread bir havuz yerini tutmasın), diğerleri CONN_MAX_AGE boyunca açık kalır.
+    """
+    from core.db.backends.pooled import PooledDatabaseWrapperMixin
+
+    for alias in connections:
+        connection = connections[alias]
+        try:
+            connection.ensure_connection()
+        except Exception:
+            logger.warning('Veritabanı bağlantısı açılamadı: %s', alias, exc_info=True)
+            continue
+        if isinstance(connection, PooledDatabaseWrapperMixin):
+            connection.close()
+
+
+def is_ready():
+    if not settings.WARMUP_ENABLED:
+        return True
+    return state['status'] == 'ready' or (state['status'] == 'failed' and not settings.READY_REQUIRES_WARMUP)
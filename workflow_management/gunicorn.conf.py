@@ -0,0 +1,64 @@
+# gunicorn.conf.py
+"""
+Production gunicorn ayarları.
+
+    gunicorn workflow_management.wsgi:application   (bu dizinden; dosya otomatik okunur)
+
+preload_app ile uygulama master'da bir kez yüklenir ve worker'lar fork edilmeden önce
+core.warmup çalışır. GC fork öncesi dondurulur; master'da oluşan nesneler worker'larda
+GC taramasına girmez, bellek sayfaları copy-on-write ile paylaşılmaya devam eder.
+"""
+import gc
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workflow_management.settings')
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', '3'))
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '0'))
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG') or None
+errorlog = os.environ.get('GUNICORN_ERROR_LOG', '-')
+
+# Python belgelerindeki fork önerisi: master'da GC kapalı, fork öncesi freeze, worker'da açık.
+# Yükleme sırasında GC çalışıp serbest bıraktığı alanlara yeni nesneler yerleştirmez.
+if preload_app:
+    gc.disable()
+
+
+def on_starting(server):
+    # Önceki çalıştırmadan kalan process'e özel metrik dosyaları silinir (yalnızca ayarları okur)
+    from core.metrics import clear_metrics_dir
+
+    clear_metrics_dir()
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+
+    from core import warmup
+
+    state = warmup.run()
+    server.log.info('Warmup %s (%s ms): %s', state['status'], state['duration_ms'], state['steps'])
+    gc.freeze()
+    server.log.info('GC donduruldu: %s nesne', gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    gc.enable()
+
+
+def post_worker_init(worker):
+    from core import warmup
+
+    # preload kapalıysa her worker kendi ısınmasını yapar; açıksa durum master'dan gelir
+    warmup.run()
+    warmup.connect_databases()
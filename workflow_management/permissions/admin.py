@@ -1,6 +1,6 @@
 # permissions/admin.py düzeltmesi
 from django.contrib import admin
-from .models import Role, UserRole, ColumnPermission, SystemPermission
+from .models import Role, UserRole, ColumnPermission, SystemPermission, PermissionVersion
 
 
 @admin.register(Role)
@@ -45,4 +45,11 @@ class SystemPermissionAdmin(admin.ModelAdmin):
         if hasattr(obj, 'user_role'):
             return f"{obj.user_role.user.username} - {obj.user_role.role.name}"
         return '-'
-    get_user_role.short_description = 'Kullanıcı - Rol'
\ No newline at end of file
+    get_user_role.short_description = 'Kullanıcı - Rol'
+
+
+@admin.register(PermissionVersion)
+class PermissionVersionAdmin(admin.ModelAdmin):
+    list_display = ('user', 'version', 'updated')
+    search_fields = ('user__username',)
+    readonly_fields = ('user', 'version', 'updated')
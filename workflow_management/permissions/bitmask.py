@@ -0,0 +1,166 @@
+# permissions/bitmask.py
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core import metrics
+
+from .models import ColumnPermission, UserRole
+
+# Her kolon COLUMN_CHOICES sırasına göre sabit bir bit alır.
+# Yetkiler (okuma maskesi, yazma maskesi) çifti olarak tutulur; yazma okumayı da kapsar.
+COLUMN_NAMES = tuple(choice[0] for choice in ColumnPermission.COLUMN_CHOICES)
+COLUMN_BITS = {name: 1 << index for index, name in enumerate(COLUMN_NAMES)}
+ALL_COLUMNS_MASK = (1 << len(COLUMN_NAMES)) - 1
+
+# Yetkiden bağımsız her zaman görünen alanlar
+ALWAYS_VISIBLE_FIELDS = frozenset([
+    'id', 'created', 'updated',
+    # Status alanları
+    'status_code', 'status_text', 'status_color',
+    # Detail alanları - read-only oldukları için
+    'category_detail', 'type_detail', 'sales_channel_detail',
+    'designer_detail', 'printing_controller_detail',
+    # Uyumluluk için eklenen name alanları
+    'category_name', 'type_name', 'sales_channel_name',
+    'designer_name', 'printing_controller_name',
+    # Diğer calculated/readonly alanlar
+    'designer_display', 'printing_controller_display',
+    'confirm_date',  # Legacy alan
+    'link', 'link_title'  # Legacy alanlar
+])
+
+# Read-only ve sistem alanları - yazma kontrolüne girmez
+READ_ONLY_FIELDS = frozenset([
+    'id', 'created', 'updated', 'printing_control_date',
+    'status_code', 'status_text', 'status_color',
+    'category_detail', 'type_detail', 'sales_channel_detail',
+    'designer_detail', 'printing_controller_detail',
+    'category_name', 'type_name', 'sales_channel_name',
+    'designer_name', 'printing_controller_name',
+    'designer_display', 'printing_controller_display',
+    'link', 'link_title', 'confirm_date'
+])
+
+_PERMISSION_CODES = {'r': 'read', 'w': 'write'}
+
+
+def _role_cache_key(role_id):
+    return f'role_permission_masks:{role_id}'
+
+
+def masks_from_permissions(permissions):
+    """{kolon: 'none'/'read'/'write'} sözlüğünü (okuma, yazma) maskelerine çevirir"""
+    read_mask = write_mask = 0
+    for column_name, permission in permissions.items():
+        bit = COLUMN_BITS.get(column_name)
+        if bit is None:
+            continue
+        if permission == 'write':
+            read_mask |= bit
+            write_mask |= bit
+        elif permission == 'read':
+            read_mask |= bit
+    return read_mask, write_mask
+
+
+def masks_from_codes(codes):
+    """Token claim'indeki n/r/w dizisini maskelere çevirir"""
+    return masks_from_permissions({
+        name: _PERMISSION_CODES[code]
+        for name, code in zip(COLUMN_NAMES, codes) if code in _PERMISSION_CODES
+    })
+
+
+def get_role_masks(role_ids):
+    """
+    Rollerin maskelerini {role_id: (okuma, yazma)} olarak döndürür.
+    Cache'te olmayanlar tek sorguda hesaplanıp cache'e yazılır.
+    """
+    role_ids = set(role_ids)
+    if not role_ids:
+        return {}
+
+    keys = {_role_cache_key(role_id): role_id for role_id in role_ids}
+    cached = cache.get_many(list(keys))
+    masks = {keys[key]: tuple(value) for key, value in cached.items()}
+
+    missing = role_ids - set(masks)
+    metrics.record_cache('role_masks', True, len(masks))
+    metrics.record_cache('role_masks', False, len(missing))
+    if missing:
+        computed = {role_id: [0, 0] for role_id in missing}
+        rows = ColumnPermission.objects.filter(
+            role_id__in=missing, permission__in=('read', 'write')
+        ).values_list('role_id', 'column_name', 'permission')
+        for role_id, column_name, permission in rows:
+            bit = COLUMN_BITS.get(column_name)
+            if bit is None:
+                continue
+            computed[role_id][0] |= bit
+            if permission == 'write':
+                computed[role_id][1] |= bit
+
+        cache.set_many(
+            {_role_cache_key(role_id): tuple(value) for role_id, value in computed.items()},
+            settings.PERMISSION_VERSION_CACHE_TIMEOUT
+        )
+        masks.update({role_id: tuple(value) for role_id, value in computed.items()})
+
+    return masks
+
+
+def invalidate_role_masks(role_ids):
+    """Yetkileri değişen rollerin maskelerini cache'ten siler"""
+    cache.delete_many([_role_cache_key(role_id) for role_id in set(role_ids)])
+
+
+def get_user_masks(user):
+    """
+    Kullanıcının rollerinin maskelerini bitwise OR ile birleştirir.
+    Sonuç kullanıcı nesnesinde saklanır; aynı istekte tekrar hesaplanmaz.
+    """
+    masks = getattr(user, '_column_permission_masks', None)
+    if masks is not None:
+        return masks
+
+    if user.is_superuser:
+        masks = (ALL_COLUMNS_MASK, ALL_COLUMNS_MASK)
+    else:
+        role_ids = UserRole.objects.filter(user=user).values_list('role_id', flat=True)
+        read_mask = write_mask = 0
+        for role_read, role_write in get_role_masks(role_ids).values():
+            read_mask |= role_read
+            write_mask |= role_write
+        masks = (read_mask, write_mask)
+
+    user._column_permission_masks = masks
+    return masks
+
+
+@lru_cache(maxsize=1024)
+def permissions_for_masks(read_mask, write_mask):
+    """Maskeleri {kolon: 'read'/'write'} sözlüğüne çevirir (yetkisiz kolonlar yer almaz)"""
+    permissions = {}
+    for name in COLUMN_NAMES:
+        bit = COLUMN_BITS[name]
+        if write_mask & bit:
+            permissions[name] = 'write'
+        elif read_mask & bit:
+            permissions[name] = 'read'
+    return permissions
+
+
+@lru_cache(maxsize=1024)
+def readable_fields(read_mask):
+    """Okuma maskesi için görünür alan kümesi"""
+    return ALWAYS_VISIBLE_FIELDS | frozenset(
+        name for name in COLUMN_NAMES if read_mask & COLUMN_BITS[name]
+    )
+
+
+@lru_cache(maxsize=1024)
+def writable_fields(write_mask):
+    """Yazma maskesi için yazılabilir alan kümesi"""
+    return frozenset(name for name in COLUMN_NAMES if write_mask & COLUMN_BITS[name])
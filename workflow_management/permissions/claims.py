@@ -0,0 +1,110 @@
+# permissions/claims.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import exceptions
+from core import metrics
+from .models import SystemPermission, UserRole, PermissionVersion
+from .bitmask import COLUMN_NAMES, masks_from_codes
+
+# Access token içindeki yetki claim'i:
+# {'v': sürüm, 'c': kolon başına n/r/w, 's': sistem izni başına 0/1}
+CLAIM_NAME = 'perm'
+
+SYSTEM_PERMISSION_TYPES = [choice[0] for choice in SystemPermission.PERMISSION_TYPE_CHOICES]
+
+_PERMISSION_TO_CODE = {'none': 'n', 'read': 'r', 'write': 'w'}
+
+
+def _version_cache_key(user_id):
+    return f'permission_version:{user_id}'
+
+
+def get_permission_version(user_id, use_cache=True):
+    """Kullanıcının güncel yetki sürümünü döndürür"""
+    key = _version_cache_key(user_id)
+    if use_cache:
+        version = cache.get(key)
+        metrics.record_cache('permission_version', version is not None)
+        if version is not None:
+            return version
+    
+    version = PermissionVersion.objects.filter(user_id=user_id).values_list('version', flat=True).first() or 0
+    cache.set(key, version, settings.PERMISSION_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def bump_permission_versions(user_ids):
+    """Kullanıcıların yetki sürümünü artırır, eski token'lar geçersiz olur"""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    
+    existing = set(PermissionVersion.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+    for user_id in user_ids - existing:
+        PermissionVersion.objects.get_or_create(user_id=user_id)
+    
+    PermissionVersion.objects.filter(user_id__in=user_ids).update(
+        version=F('version') + 1,
+        updated=timezone.now()
+    )
+    cache.delete_many([_version_cache_key(user_id) for user_id in user_ids])
+
+
+def bump_role_permission_versions(role_id):
+    """Rolü taşıyan tüm kullanıcıların yetki sürümünü artırır"""
+    user_ids = UserRole.objects.filter(role_id=role_id).values_list('user_id', flat=True)
+    bump_permission_versions(list(user_ids))
+
+
+def build_permission_claims(user):
+    """Kullanıcının birleştirilmiş yetkilerini kompakt claim'e çevirir"""
+    from .utils import PermissionChecker
+    
+    column_permissions = PermissionChecker.get_user_column_permissions(user)
+    system_permissions = PermissionChecker.get_user_system_permissions(user)
+    
+    return {
+        'v': get_permission_version(user.pk, use_cache=False),
+        'c': ''.join(_PERMISSION_TO_CODE[column_permissions.get(name, 'none')] for name in COLUMN_NAMES),
+        's': ''.join('1' if system_permissions.get(name) else '0' for name in SYSTEM_PERMISSION_TYPES),
+    }
+
+
+def add_permission_claims(token, user):
+    """Access token'a yetki claim'ini ekler"""
+    token[CLAIM_NAME] = build_permission_claims(user)
+    return token
+
+
+def apply_permission_claims(user, validated_token):
+    """
+    Token'daki yetki bilgilerini kullanıcı nesnesine bağlar.
+    PermissionChecker bu bilgiler varsa veritabanına gitmez.
+    Sürümü geride kalan token'lar reddedilir.
+    """
+    claims = validated_token.get(CLAIM_NAME)
+    if not isinstance(claims, dict):
+        return
+    
+    columns = claims.get('c', '')
+    system = claims.get('s', '')
+    if len(columns) != len(COLUMN_NAMES) or len(system) != len(SYSTEM_PERMISSION_TYPES):
+        # Kolon yapısı değişmiş, veritabanından hesaplanır
+        return
+    
+    token_version = claims.get('v', 0)
+    current_version = get_permission_version(user.pk)
+    if token_version > current_version:
+        # Bu worker'ın cache'i geride olabilir
+        current_version = get_permission_version(user.pk, use_cache=False)
+    if token_version < current_version:
+        raise exceptions.AuthenticationFailed(
+            'Yetkileriniz güncellendi. Lütfen tekrar giriş yapın.', code='permissions_changed'
+        )
+    
+    user._column_permission_masks = masks_from_codes(columns)
+    user._system_permission_claims = {
+        name: code == '1' for name, code in zip(SYSTEM_PERMISSION_TYPES, system)
+    }
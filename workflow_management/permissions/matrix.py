@@ -0,0 +1,199 @@
+# permissions/matrix.py
+import csv
+
+from django.contrib.auth.models import User
+from django.db import connections, router
+from django.db.models import Case, IntegerField, Max, Q, Value, When
+
+from .models import ColumnPermission, SystemPermission, UserRole
+
+COLUMN_NAMES = [choice[0] for choice in ColumnPermission.COLUMN_CHOICES]
+SYSTEM_PERMISSION_TYPES = [choice[0] for choice in SystemPermission.PERMISSION_TYPE_CHOICES]
+
+# none < read < write; roller arasında en yüksek seviye geçerli olur
+PERMISSION_LEVELS = {'none': 0, 'read': 1, 'write': 2}
+LEVEL_NAMES = {level: name for name, level in PERMISSION_LEVELS.items()}
+
+USER_FIELDS = ['id', 'username', 'first_name', 'last_name', 'is_active', 'is_superuser']
+
+_COLUMN_PATH = 'role__column_permissions__'
+_SYSTEM_PATH = 'role__system_permissions__'
+
+
+def _column_alias(column_name):
+    return f'c__{column_name}'
+
+
+def _system_alias(permission_type):
+    return f's__{permission_type}'
+
+
+def _column_level(column_name):
+    """Kolon için kullanıcının rollerindeki en yüksek yetki seviyesi"""
+    return Max(Case(
+        When(
+            Q(**{_COLUMN_PATH + 'column_name': column_name, _COLUMN_PATH + 'permission': 'write'}),
+            then=Value(2)
+        ),
+        When(
+            Q(**{_COLUMN_PATH + 'column_name': column_name, _COLUMN_PATH + 'permission': 'read'}),
+            then=Value(1)
+        ),
+        default=Value(0),
+        output_field=IntegerField(),
+    ))
+
+
+def _system_granted(permission_type):
+    """Rollerden herhangi biri sistem iznini veriyorsa 1"""
+    return Max(Case(
+        When(
+            Q(**{_SYSTEM_PATH + 'permission_type': permission_type, _SYSTEM_PATH + 'granted': True}),
+            then=Value(1)
+        ),
+        default=Value(0),
+        output_field=IntegerField(),
+    ))
+
+
+class MatrixQuery:
+    """
+    Yetki matrisi sorgusu. Kolon ve sistem yetkileri ayrı alt sorgularda kullanıcı
+    başına gruplanır, kullanıcılarla sonra birleştirilir; böylece roller x kolon
+    yetkileri x sistem yetkileri çarpımı oluşmaz. iterator() satırları dict olarak üretir.
+    """
+
+    def __init__(self, sql, params, using):
+        self.sql = sql
+        self.params = params
+        self.using = using
+
+    def iterator(self, chunk_size=500):
+        """Sorgu ilk satır istendiğinde çalışır; satırlar chunk_size'lık gruplar halinde okunur"""
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(self.sql, self.params)
+            names = [column[0] for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(names, row))
+
+
+def build_matrix_query(user_ids=None, role_id=None, is_active=None, column=None, permission=None):
+    """
+    Kullanıcı başına tek satır dönen sorgu:
+    kullanıcılar LEFT JOIN (kolon seviyeleri, user_id'ye göre gruplu)
+                 LEFT JOIN (sistem izinleri, user_id'ye göre gruplu).
+    Her kolon ve sistem izni kendi tarafında ayrı bir koşullu MAX olarak hesaplanır.
+    column/permission verilirse yalnızca o yetkiye sahip kullanıcılar döner.
+    """
+    users = User.objects.all()
+    if user_ids:
+        users = users.filter(id__in=user_ids)
+    if role_id:
+        # Rol filtresi ayrı bir alt sorgu ile yapılır, yetki gruplamasını daraltmaz
+        users = users.filter(id__in=User.objects.filter(user_roles__role_id=role_id).values('id'))
+    if is_active is not None:
+        users = users.filter(is_active=is_active)
+
+    user_roles = UserRole.objects.all()
+    if user_ids or role_id or is_active is not None:
+        # Gruplama yalnızca seçili kullanıcılar için yapılır
+        user_roles = user_roles.filter(user_id__in=users.values('id'))
+    column_levels = user_roles.values('user_id').annotate(
+        **{_column_alias(name): _column_level(name) for name in COLUMN_NAMES}
+    ).order_by()
+    system_grants = user_roles.values('user_id').annotate(
+        **{_system_alias(name): _system_granted(name) for name in SYSTEM_PERMISSION_TYPES}
+    ).order_by()
+
+    using = router.db_for_read(User)
+    connection = connections[using]
+    qn = connection.ops.quote_name
+
+    parts = []
+    params = []
+    for queryset in (users.values(*USER_FIELDS).order_by(), column_levels, system_grants):
+        sql, part_params = queryset.query.get_compiler(using=using).as_sql()
+        parts.append(sql)
+        params.extend(part_params)
+
+    select = [f'u.{qn(name)}' for name in USER_FIELDS]
+    select += [f'c.{qn(_column_alias(name))}' for name in COLUMN_NAMES]
+    select += [f's.{qn(_system_alias(name))}' for name in SYSTEM_PERMISSION_TYPES]
+    sql = (
+        f"SELECT {', '.join(select)} FROM ({parts[0]}) u "
+        f"LEFT JOIN ({parts[1]}) c ON c.{qn('user_id')} = u.{qn('id')} "
+        f"LEFT JOIN ({parts[2]}) s ON s.{qn('user_id')} = u.{qn('id')}"
+    )
+
+    if column:
+        level_column = f'c.{qn(_column_alias(column))}'
+        level = PERMISSION_LEVELS[permission]
+        if level:
+            # Superuser her kolona yazabilir
+            sql += f" WHERE (u.{qn('is_superuser')} = %s OR {level_column} >= %s)"
+            params.extend([True, level])
+        else:
+            # Rolü olmayan kullanıcıda seviye NULL, kolonu tanımlamayan rolde 0
+            sql += f" WHERE u.{qn('is_superuser')} = %s AND ({level_column} = 0 OR {level_column} IS NULL)"
+            params.append(False)
+
+    sql += f" ORDER BY u.{qn('username')}"
+    return MatrixQuery(sql, params, using)
+
+
+def matrix_row(row):
+    """Sorgu satırını API çıktısına çevirir"""
+    if row['is_superuser']:
+        columns = {name: 'write' for name in COLUMN_NAMES}
+        system = {name: True for name in SYSTEM_PERMISSION_TYPES}
+    else:
+        columns = {name: LEVEL_NAMES[row[_column_alias(name)] or 0] for name in COLUMN_NAMES}
+        system = {name: bool(row[_system_alias(name)]) for name in SYSTEM_PERMISSION_TYPES}
+
+    return {
+        'id': row['id'],
+        'username': row['username'],
+        'full_name': f"{row['first_name']} {row['last_name']}".strip() or row['username'],
+        # Ham sorgu satırı: SQLite boolean'ları 0/1 döner
+        'is_active': bool(row['is_active']),
+        'is_superuser': bool(row['is_superuser']),
+        'permissions': columns,
+        'system_permissions': system,
+    }
+
+
+class _Echo:
+    """csv.writer'ın yazdığı satırı olduğu gibi döndürür"""
+    def write(self, value):
+        return value
+
+
+def iter_matrix_chunks(query, chunk_size=500):
+    """Matris satırlarını chunk_size'lık listeler halinde üretir (JSON akışı için)"""
+    chunk = []
+    for row in query.iterator(chunk_size=chunk_size):
+        chunk.append(matrix_row(row))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_matrix_csv(query):
+    """Matrisi CSV satırları olarak üretir (StreamingHttpResponse için)"""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(
+        ['id', 'username', 'full_name', 'is_active', 'is_superuser'] + COLUMN_NAMES + SYSTEM_PERMISSION_TYPES
+    )
+    for row in query.iterator(chunk_size=500):
+        item = matrix_row(row)
+        yield writer.writerow(
+            [item['id'], item['username'], item['full_name'], item['is_active'], item['is_superuser']]
+            + [item['permissions'][name] for name in COLUMN_NAMES]
+            + [int(item['system_permissions'][name]) for name in SYSTEM_PERMISSION_TYPES]
+        )
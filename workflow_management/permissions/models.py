@@ -130,4 +130,28 @@ class SystemPermission(models.Model):
     class Meta:
         verbose_name = 'Sistem İzni'
         verbose_name_plural = 'Sistem İzinleri'
-        unique_together = ['role', 'permission_type']
\ No newline at end of file
+        unique_together = ['role', 'permission_type']
+
+
+class PermissionVersion(models.Model):
+    """
+    Kullanıcı yetkilerinin sürümü.
+    Access token'a gömülen yetki bilgileri bu sürümle birlikte taşınır;
+    sürüm ilerlediğinde eski token'lar reddedilir.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='permission_version',
+        verbose_name='Kullanıcı'
+    )
+    version = models.PositiveIntegerField(default=0, verbose_name='Sürüm')
+    updated = models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')
+    
+    def __str__(self):
+        return f"{self.user.username} - v{self.version}"
+    
+    class Meta:
+        verbose_name = 'Yetki Sürümü'
+        verbose_name_plural = 'Yetki Sürümleri'
@@ -2,6 +2,7 @@
 from rest_framework import serializers
 from .models import Role, ColumnPermission, UserRole, SystemPermission
 from django.contrib.auth.models import User
+from .sync import sync_role_permissions
 
 
 class ColumnPermissionSerializer(serializers.ModelSerializer):
@@ -43,34 +44,10 @@ class RoleSerializer(serializers.ModelSerializer):
         
         return role
     
-    def _handle_permissions(self, role, permissions_data, permission_model, choices_attr):
+    def _handle_permissions(self, role, permissions_data, permission_model, choices_attr, replace=False):
         """Handle both column and system permissions"""
-        if permission_model == ColumnPermission:
-            # Handle column permissions
-            valid_choices = [choice[0] for choice in getattr(permission_model, choices_attr)]
-            
-            for column_name, permission in permissions_data.items():
-                if column_name in valid_choices:
-                    permission_model.objects.update_or_create(
-                        role=role,
-                        column_name=column_name,
-                        defaults={'permission': permission}
-                    )
-        
-        elif permission_model == SystemPermission:
-            # Handle system permissions
-            print(f"Handling system permissions: {permissions_data}")  # Debug
-            valid_choices = [choice[0] for choice in getattr(permission_model, choices_attr)]
-            print(f"Valid choices: {valid_choices}")  # Debug
-            
-            for permission_type, granted in permissions_data.items():
-                if permission_type in valid_choices:
-                    obj, created = permission_model.objects.update_or_create(
-                        role=role,
-                        permission_type=permission_type,
-                        defaults={'granted': granted}
-                    )
-                    print(f"{'Created' if created else 'Updated'} {permission_type}: {granted}")  # Debug
+        if permissions_data:
+            sync_role_permissions(role, permission_model, permissions_data, replace=replace)
     
     def update(self, instance, validated_data):
         permissions_data = validated_data.pop('permissions', {})
@@ -83,11 +60,8 @@ class RoleSerializer(serializers.ModelSerializer):
         
         # Update column permissions
         if permissions_data:
-            # Clear existing permissions
-            ColumnPermission.objects.filter(role=instance).delete()
-            
-            # Create new permissions
-            self._handle_permissions(instance, permissions_data, ColumnPermission, 'COLUMN_CHOICES')
+            # Gönderilmeyen kolonlar silinir, diğerleri fark alınarak güncellenir
+            self._handle_permissions(instance, permissions_data, ColumnPermission, 'COLUMN_CHOICES', replace=True)
         
         # Update system permissions
         if system_permissions_data:
@@ -1,7 +1,17 @@
 # permissions/signals.py
-from django.db.models.signals import post_save
+import logging
+
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import Role, ColumnPermission
+from .models import Role, ColumnPermission, SystemPermission, UserRole
+from .claims import bump_permission_versions, bump_role_permission_versions
+from .sync import create_default_column_permissions, is_syncing
+from .bitmask import invalidate_role_masks
+
+logger = logging.getLogger(__name__)
+
 
 @receiver(post_save, sender=Role)
 def create_default_permissions(sender, instance, created, **kwargs):
@@ -9,12 +19,35 @@ def create_default_permissions(sender, instance, created, **kwargs):
     Yeni rol oluşturulduğunda tüm kolonlara otomatik olarak okuma yetkisi ver
     """
     if created:
-        # Tüm kolonlar için okuma yetkisi oluştur
-        for column_value, column_display in ColumnPermission.COLUMN_CHOICES:
-            ColumnPermission.objects.create(
-                role=instance,
-                column_name=column_value,
-                permission='read'  # Varsayılan olarak okuma yetkisi
-            )
+        # Tüm kolonlar için okuma yetkisi tek sorguda oluşturulur
+        create_default_column_permissions(instance, permission='read')
         
-        print(f"'{instance.name}' rolü için varsayılan okuma yetkileri oluşturuldu.")
\ No newline at end of file
+        logger.info("'%s' rolü için varsayılan okuma yetkileri oluşturuldu.", instance.name)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def bump_user_permission_version(sender, instance, **kwargs):
+    """
+    Kullanıcıya rol atandığında veya rol kaldırıldığında token yetkilerini eskit
+    """
+    origin = kwargs.get('origin')
+    if isinstance(origin, User) or (isinstance(origin, QuerySet) and origin.model is User):
+        # Kullanıcı siliniyor; sürüm satırı yeniden oluşturulursa silme FK hatasıyla düşer
+        return
+    bump_permission_versions([instance.user_id])
+
+
+@receiver(post_save, sender=ColumnPermission)
+@receiver(post_delete, sender=ColumnPermission)
+@receiver(post_save, sender=SystemPermission)
+@receiver(post_delete, sender=SystemPermission)
+def bump_role_permission_version(sender, instance, **kwargs):
+    """
+    Rolün yetkileri değiştiğinde rolü taşıyan kullanıcıların token yetkilerini eskit
+    """
+    if is_syncing():
+        # Toplu eşitleme sonunda tek seferde artırılır
+        return
+    invalidate_role_masks([instance.role_id])
+    bump_role_permission_versions(instance.role_id)
@@ -0,0 +1,81 @@
+# permissions/sync.py
+from contextvars import ContextVar
+
+from django.db import transaction
+from .models import ColumnPermission, SystemPermission
+from .claims import bump_role_permission_versions
+from .bitmask import invalidate_role_masks
+
+
+# model: (anahtar alanı, değer alanı, geçerli anahtarlar)
+SYNC_SPECS = {
+    ColumnPermission: ('column_name', 'permission', {choice[0] for choice in ColumnPermission.COLUMN_CHOICES}),
+    SystemPermission: ('permission_type', 'granted', {choice[0] for choice in SystemPermission.PERMISSION_TYPE_CHOICES}),
+}
+
+# Eşitleme sürerken satır bazlı sinyaller sürüm artırmaz, artırım sonda bir kez yapılır
+_syncing = ContextVar('permission_sync', default=False)
+
+
+def is_syncing():
+    return _syncing.get()
+
+
+def sync_role_permissions(role, permission_model, permissions_data, replace=False):
+    """
+    Rolün yetki satırlarını verilen sözlükle eşitler.
+    Mevcut satırlarla fark hesaplanır; yeni satırlar bulk_create, değişenler
+    bulk_update ile yazılır, replace=True ise sözlükte olmayanlar tek DELETE ile silinir.
+    Toplu işlemler sinyal tetiklemediği için token yetki sürümleri burada artırılır.
+    Sözlükteki geçerli anahtarlara karşılık gelen satırları döndürür.
+    """
+    key_field, value_field, valid_keys = SYNC_SPECS[permission_model]
+    desired = {key: value for key, value in permissions_data.items() if key in valid_keys}
+
+    with transaction.atomic():
+        existing = {
+            getattr(obj, key_field): obj
+            for obj in permission_model.objects.select_for_update().filter(role=role)
+        }
+
+        to_create = []
+        to_update = []
+        for key, value in desired.items():
+            obj = existing.get(key)
+            if obj is None:
+                to_create.append(permission_model(role=role, **{key_field: key, value_field: value}))
+            elif getattr(obj, value_field) != value:
+                setattr(obj, value_field, value)
+                to_update.append(obj)
+
+        stale_ids = [obj.pk for key, obj in existing.items() if key not in desired] if replace else []
+
+        if to_create:
+            permission_model.objects.bulk_create(to_create)
+        if to_update:
+            permission_model.objects.bulk_update(to_update, [value_field])
+        if stale_ids:
+            token = _syncing.set(True)
+            try:
+                permission_model.objects.filter(pk__in=stale_ids).delete()
+            finally:
+                _syncing.reset(token)
+
+        if to_create or to_update or stale_ids:
+            transaction.on_commit(lambda: _after_sync(role.pk))
+
+    created = {getattr(obj, key_field): obj for obj in to_create}
+    return [existing.get(key) or created[key] for key in desired]
+
+
+def _after_sync(role_id):
+    invalidate_role_masks([role_id])
+    bump_role_permission_versions(role_id)
+
+
+def create_default_column_permissions(role, permission='read'):
+    """Yeni rol için tüm kolonlara varsayılan yetkiyi tek INSERT ile oluşturur"""
+    ColumnPermission.objects.bulk_create([
+        ColumnPermission(role=role, column_name=column_name, permission=permission)
+        for column_name, _ in ColumnPermission.COLUMN_CHOICES
+    ])
@@ -1,3 +1,237 @@
-from django.test import TestCase
+import json
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.renderers import CustomJSONRenderer
+from core.testing import QueryCountTestMixin, client_for, reset_caches
+from permissions.bitmask import COLUMN_NAMES
+from permissions.claims import CLAIM_NAME, SYSTEM_PERMISSION_TYPES
+from permissions.models import ColumnPermission, PermissionVersion, Role, SystemPermission, UserRole
+from permissions.sync import sync_role_permissions
+from permissions.utils import PermissionChecker
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class PermissionQueryCountTests(QueryCountTestMixin, TestCase):
+    """Rol sayısı arttıkça rol listesi ve yetki özeti sorgu sayısı sabit kalmalıdır"""
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_user('staff', is_staff=True)
+
+    def seed(self, size):
+        for index in range(Role.objects.count(), size):
+            role = Role.objects.create(name=f'Rol {index}')
+            sync_role_permissions(role, ColumnPermission, {
+                column: ('write', 'read', 'none')[(index + position) % 3]
+                for position, (column, _) in enumerate(ColumnPermission.COLUMN_CHOICES)
+            }, replace=True)
+            sync_role_permissions(role, SystemPermission, {'work_create': index % 2 == 0})
+            UserRole.objects.create(user=self.admin, role=role)
+        # Rol ataması yetki sürümünü artırır; kullanıcı yeniden giriş yapmış gibi token yenilenir
+        self.api = client_for(self.admin)
+
+    def test_role_list(self):
+        self.assertConstantQueries(self.seed, lambda: self.api.get('/api/permissions/roles/'), expected=3)
+
+    def test_my_permissions(self):
+        self.assertConstantQueries(
+            self.seed, lambda: self.api.get('/api/permissions/user-roles/my_permissions/'), expected=1
+        )
+
+    def test_my_work_permissions(self):
+        self.assertConstantQueries(
+            self.seed, lambda: self.api.get('/api/permissions/my-work-permissions/'), expected=0
+        )
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class PermissionClaimTests(TestCase):
+    """Token'a gömülen yetkiler, sürüm kontrolü ve kullanıcı silme"""
+
+    def setUp(self):
+        reset_caches()
+        self.user = User.objects.create_user('yetkili', password='gizli-sifre')
+        self.role = Role.objects.create(name='Düzenleyici')
+        sync_role_permissions(self.role, ColumnPermission, {
+            COLUMN_NAMES[0]: 'write', COLUMN_NAMES[1]: 'read',
+        }, replace=True)
+        sync_role_permissions(self.role, SystemPermission, {SYSTEM_PERMISSION_TYPES[0]: True})
+        UserRole.objects.create(user=self.user, role=self.role)
+
+    def test_login_embeds_claims(self):
+        response = APIClient().post(
+            '/api/auth/login/', {'username': 'yetkili', 'password': 'gizli-sifre'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        claims = AccessToken(response.data['access_token'])[CLAIM_NAME]
+
+        self.assertEqual(claims['c'], 'wr' + 'n' * (len(COLUMN_NAMES) - 2))
+        self.assertEqual(claims['s'], '1' + '0' * (len(SYSTEM_PERMISSION_TYPES) - 1))
+        self.assertEqual(claims['v'], PermissionVersion.objects.get(user=self.user).version)
+
+    def test_stale_version_is_rejected(self):
+        api = client_for(self.user)
+        self.assertEqual(api.get('/api/permissions/my-work-permissions/').status_code, 200)
+
+        # Rol değişikliği sürümü artırır; eski token yetkileri geçersizdir
+        UserRole.objects.create(user=self.user, role=Role.objects.create(name='İzleyici'))
+        response = api.get('/api/permissions/my-work-permissions/')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data['detail'].code, 'permissions_changed')
+
+        self.assertEqual(client_for(self.user).get('/api/permissions/my-work-permissions/').status_code, 200)
+
+    def test_role_permission_change_bumps_version(self):
+        api = client_for(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            sync_role_permissions(self.role, ColumnPermission, {COLUMN_NAMES[0]: 'read'}, replace=True)
+        self.assertEqual(api.get('/api/permissions/my-work-permissions/').status_code, 401)
+
+    def test_new_role_gets_default_read_permissions(self):
+        with self.assertLogs('permissions.signals', 'INFO') as logs:
+            role = Role.objects.create(name='Yeni Rol')
+        self.assertEqual(
+            set(role.column_permissions.values_list('permission', flat=True)), {'read'}
+        )
+        self.assertEqual(role.column_permissions.count(), len(COLUMN_NAMES))
+        self.assertEqual(logs.records[0].getMessage(), "'Yeni Rol' rolü için varsayılan okuma yetkileri oluşturuldu.")
+
+    def test_user_delete_cascades_roles(self):
+        self.user.delete()
+        self.assertFalse(UserRole.objects.filter(role=self.role).exists())
+        self.assertFalse(PermissionVersion.objects.exists())
+
+    def test_user_queryset_delete(self):
+        User.objects.filter(pk=self.user.pk).delete()
+        self.assertFalse(User.objects.filter(username='yetkili').exists())
+        self.assertFalse(PermissionVersion.objects.exists())
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class PermissionMatrixTests(TestCase):
+    """Yetki matrisi rol bazlı hesaplamayla aynı sonucu vermeli, ters arama doğru kullanıcıları döndürmelidir"""
+
+    URL = '/api/permissions/user-roles/matrix/'
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.api = client_for(self.admin)
+        first, second, third = COLUMN_NAMES[:3]
+
+        self.role_a = Role.objects.create(name='A')
+        sync_role_permissions(self.role_a, ColumnPermission, {first: 'write', second: 'read'}, replace=True)
+        role_b = Role.objects.create(name='B')
+        sync_role_permissions(role_b, ColumnPermission, {first: 'read', second: 'write', third: 'read'}, replace=True)
+        sync_role_permissions(role_b, SystemPermission, {SYSTEM_PERMISSION_TYPES[0]: True})
+
+        self.single = User.objects.create_user('tek_rol')
+        UserRole.objects.create(user=self.single, role=self.role_a)
+        self.multi = User.objects.create_user('iki_rol')
+        UserRole.objects.create(user=self.multi, role=self.role_a)
+        UserRole.objects.create(user=self.multi, role=role_b)
+        self.no_role = User.objects.create_user('rolsuz')
+
+    def matrix(self, **params):
+        response = self.api.get(self.URL, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        body = json.loads(b''.join(response.streaming_content))
+        return {row['username']: row for row in body['data']['users']}
+
+    def usernames(self, **params):
+        return set(self.matrix(**params))
+
+    def test_aggregate_matches_role_based_permissions(self):
+        rows = self.matrix()
+        self.assertEqual(set(rows), {'admin', 'tek_rol', 'iki_rol', 'rolsuz'})
+
+        for user in (self.single, self.multi, self.no_role):
+            with self.subTest(user=user.username):
+                expected = PermissionChecker.get_user_column_permissions(user)
+                self.assertEqual(
+                    rows[user.username]['permissions'],
+                    {name: expected.get(name, 'none') for name in COLUMN_NAMES},
+                )
+                self.assertEqual(
+                    rows[user.username]['system_permissions'],
+                    PermissionChecker.get_user_system_permissions(user),
+                )
+
+        first, second, third = COLUMN_NAMES[:3]
+        # Birden fazla rolde en yüksek seviye geçerli
+        self.assertEqual(
+            [rows['iki_rol']['permissions'][name] for name in (first, second, third)], ['write', 'write', 'read']
+        )
+        self.assertTrue(rows['iki_rol']['system_permissions'][SYSTEM_PERMISSION_TYPES[0]])
+        self.assertEqual(set(rows['rolsuz']['permissions'].values()), {'none'})
+        self.assertEqual(set(rows['admin']['permissions'].values()), {'write'})
+        self.assertTrue(all(rows['admin']['system_permissions'].values()))
+
+    def test_reverse_lookup_by_column_and_permission(self):
+        first, second, third = COLUMN_NAMES[:3]
+        self.assertEqual(self.usernames(column=second, permission='write'), {'admin', 'iki_rol'})
+        self.assertEqual(self.usernames(column=second, permission='read'), {'admin', 'iki_rol', 'tek_rol'})
+        self.assertEqual(self.usernames(column=first, permission='write'), {'admin', 'iki_rol', 'tek_rol'})
+
+    def test_reverse_lookup_none(self):
+        # Rolü olmayan kullanıcıda seviye NULL, kolonu tanımlamayan rolde 0; superuser hiç dönmez
+        third = COLUMN_NAMES[2]
+        self.assertEqual(self.usernames(column=third, permission='none'), {'tek_rol', 'rolsuz'})
+        self.assertEqual(self.usernames(column=COLUMN_NAMES[0], permission='none'), {'rolsuz'})
+
+    def test_filters_and_invalid_params(self):
+        self.assertEqual(self.usernames(role=self.role_a.pk), {'tek_rol', 'iki_rol'})
+        self.assertEqual(self.usernames(user_id=f'{self.single.pk},{self.no_role.pk}'), {'tek_rol', 'rolsuz'})
+        self.assertEqual(
+            self.usernames(role=self.role_a.pk, column=COLUMN_NAMES[2], permission='read'), {'iki_rol'}
+        )
+
+        for params in ({'column': 'yok', 'permission': 'read'}, {'column': COLUMN_NAMES[0]},
+                       {'role': 'x'}, {'user_id': 'a,b'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.api.get(self.URL, params).status_code, 400)
+
+    def test_streamed_json_matches_rendered_response(self):
+        with mock.patch.object(CustomJSONRenderer, '_get_timestamp', return_value='2024-01-01T00:00:00'):
+            streamed = self.api.get(self.URL, {'role': self.role_a.pk})
+            # Gövde tembel üretilir; zaman damgası yamalıyken okunmalı
+            streamed_body = b''.join(streamed.streaming_content)
+            with override_settings(STREAM_LIST_RESPONSES=False):
+                rendered = self.api.get(self.URL, {'role': self.role_a.pk})
+        self.assertFalse(rendered.streaming)
+        self.assertEqual(streamed_body, rendered.content)
+        self.assertEqual(streamed['Content-Type'], rendered['Content-Type'])
+
+    def test_permission_sides_aggregated_separately(self):
+        # Tüm kolon ve sistem yetkilerini tanımlayan birden fazla rol: tek birleşimde satırlar çarpılırdı
+        user = User.objects.create_user('cok_rol')
+        for index, level in enumerate(('read', 'write', 'read')):
+            role = Role.objects.create(name=f'Tam {index}')
+            sync_role_permissions(role, ColumnPermission, dict.fromkeys(COLUMN_NAMES, level), replace=True)
+            sync_role_permissions(role, SystemPermission, dict.fromkeys(SYSTEM_PERMISSION_TYPES, index == 2))
+            UserRole.objects.create(user=user, role=role)
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.matrix(user_id=str(user.pk))
+        matrix_queries = [query['sql'] for query in queries if 'GROUP BY' in query['sql']]
+        self.assertEqual(len(matrix_queries), 1)
+        # Kolon ve sistem tarafı ayrı alt sorgularda kullanıcı başına gruplanır
+        self.assertEqual(matrix_queries[0].count('GROUP BY'), 2)
+
+        self.assertEqual(set(rows['cok_rol']['permissions'].values()), {'write'})
+        self.assertTrue(all(rows['cok_rol']['system_permissions'].values()))
+        self.assertEqual(rows['cok_rol']['system_permissions'], PermissionChecker.get_user_system_permissions(user))
+
+    def test_csv_output(self):
+        response = self.api.get(self.URL, {'output': 'csv', 'column': COLUMN_NAMES[1], 'permission': 'read'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(',')[:2], ['id', 'username'])
+        self.assertEqual({line.split(',')[1] for line in lines[1:]}, {'admin', 'iki_rol', 'tek_rol'})
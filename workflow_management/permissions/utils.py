@@ -1,10 +1,16 @@
 # permissions/utils.py
-from .models import UserRole, ColumnPermission, SystemPermission
+from core.timing import timed_phase
+from .models import SystemPermission
+from .bitmask import (
+    COLUMN_BITS, READ_ONLY_FIELDS, get_user_masks,
+    permissions_for_masks, readable_fields, writable_fields
+)
 
 class PermissionChecker:
     """Yetki kontrolü için yardımcı sınıf"""
     
     @staticmethod
+    @timed_phase('permissions')
     def get_user_column_permissions(user):
         """Kullanıcının kolon yetkilerini döndürür"""
         if user.is_superuser:
@@ -13,25 +19,8 @@ class PermissionChecker:
             all_fields = [f.name for f in Work._meta.get_fields() if not f.auto_created]
             return {field: 'write' for field in all_fields}
         
-        permissions = {}
-        
-        # Kullanıcının rollerini al
-        user_roles = UserRole.objects.filter(user=user).select_related('role')
-        
-        for user_role in user_roles:
-            # Her rol için kolon yetkilerini al
-            column_perms = ColumnPermission.objects.filter(role=user_role.role)
-            
-            for perm in column_perms:
-                # Daha yüksek yetki varsa onu kullan
-                current_perm = permissions.get(perm.column_name, 'none')
-                
-                if perm.permission == 'write':
-                    permissions[perm.column_name] = 'write'
-                elif perm.permission == 'read' and current_perm != 'write':
-                    permissions[perm.column_name] = 'read'
-        
-        return permissions
+        # Maskeler token'dan ya da rol cache'inden gelir
+        return dict(permissions_for_masks(*get_user_masks(user)))
     
     @staticmethod
     def can_read_column(user, column_name):
@@ -39,9 +28,8 @@ class PermissionChecker:
         if user.is_superuser:
             return True
         
-        permissions = PermissionChecker.get_user_column_permissions(user)
-        perm = permissions.get(column_name, 'none')
-        return perm in ['read', 'write']
+        read_mask, _ = get_user_masks(user)
+        return bool(read_mask & COLUMN_BITS.get(column_name, 0))
     
     @staticmethod
     def can_write_column(user, column_name):
@@ -49,90 +37,67 @@ class PermissionChecker:
         if user.is_superuser:
             return True
         
-        permissions = PermissionChecker.get_user_column_permissions(user)
-        return permissions.get(column_name) == 'write'
+        _, write_mask = get_user_masks(user)
+        return bool(write_mask & COLUMN_BITS.get(column_name, 0))
     
     @staticmethod
+    @timed_phase('permissions')
     def filter_readable_fields(user, data):
         """Kullanıcının okuma yetkisi olmadığı alanları filtreler"""
         if user.is_superuser:
             return data
         
+        # Görünür alan kümesi maskeye göre bir kez hesaplanır, tüm satırlarda kullanılır
+        allowed = readable_fields(get_user_masks(user)[0])
+        
         if isinstance(data, list):
-            return [PermissionChecker.filter_readable_fields(user, item) for item in data]
+            return [
+                {key: value for key, value in item.items() if key in allowed}
+                if isinstance(item, dict) else item
+                for item in data
+            ]
         
         if not isinstance(data, dict):
             return data
         
-        permissions = PermissionChecker.get_user_column_permissions(user)
-        filtered_data = {}
-        
-        # Her zaman görünmesi gereken alanlar
-        always_visible = [
-            'id', 'created', 'updated',
-            # Status alanları
-            'status_code', 'status_text', 'status_color',
-            # Detail alanları - read-only oldukları için
-            'category_detail', 'type_detail', 'sales_channel_detail',
-            'designer_detail', 'printing_controller_detail',
-            # Uyumluluk için eklenen name alanları
-            'category_name', 'type_name', 'sales_channel_name',
-            'designer_name', 'printing_controller_name',
-            # Diğer calculated/readonly alanlar
-            'designer_display', 'printing_controller_display',
-            'confirm_date',  # Legacy alan
-            'link', 'link_title'  # Legacy alanlar
-        ]
-        
-        for key, value in data.items():
-            # Her zaman görünür alanlar veya yetkili alanlar
-            if key in always_visible or permissions.get(key) in ['read', 'write']:
-                filtered_data[key] = value
-        
-        return filtered_data
+        return {key: value for key, value in data.items() if key in allowed}
     
     @staticmethod
+    @timed_phase('permissions')
     def validate_writable_fields(user, data):
         """Kullanıcının yazma yetkisi olmadığı alanları kontrol eder"""
         if user.is_superuser:
             return True, None
         
-        permissions = PermissionChecker.get_user_column_permissions(user)
-        
-        # Read-only ve sistem alanları - bunlar zaten değiştirilemez
-        read_only_fields = [
-            'id', 'created', 'updated', 'printing_control_date',
-            'status_code', 'status_text', 'status_color',
-            'category_detail', 'type_detail', 'sales_channel_detail',
-            'designer_detail', 'printing_controller_detail',
-            'category_name', 'type_name', 'sales_channel_name',
-            'designer_name', 'printing_controller_name',
-            'designer_display', 'printing_controller_display',
-            'link', 'link_title', 'confirm_date'
-        ]
+        writable = writable_fields(get_user_masks(user)[1])
         
         for field in data.keys():
-            if field not in read_only_fields:
+            if field not in READ_ONLY_FIELDS:
                 if field == "designer_text": field = "designer"
-                if permissions.get(field) != 'write':
+                if field not in writable:
                     return False, f"'{field}' alanına yazma yetkiniz yok"
         
         return True, None
     
     @staticmethod
+    @timed_phase('permissions')
     def get_user_system_permissions(user):
         """Kullanıcının sistem izinlerini döndürür"""
         if user.is_superuser:
             return {'work_create': True, 'work_delete': True, 'work_reorder': True}
         
+        claims = getattr(user, '_system_permission_claims', None)
+        if claims is not None:
+            return dict(claims)
+        
         permissions = {'work_create': False, 'work_delete': False, 'work_reorder': False}
         
-        user_roles = UserRole.objects.filter(user=user).select_related('role')
+        granted = SystemPermission.objects.filter(
+            role__role_users__user=user, granted=True
+        ).values_list('permission_type', flat=True)
         
-        for user_role in user_roles:
-            system_perms = SystemPermission.objects.filter(role=user_role.role, granted=True)
-            for perm in system_perms:
-                permissions[perm.permission_type] = True
+        for permission_type in granted:
+            permissions[permission_type] = True
         
         return permissions
     
@@ -9,6 +9,14 @@ from .serializers import (
     UserRoleSerializer, ColumnPermissionSerializer
 )
 from .utils import PermissionChecker
+from .sync import sync_role_permissions
+from .matrix import (
+    COLUMN_NAMES, SYSTEM_PERMISSION_TYPES, PERMISSION_LEVELS,
+    build_matrix_query, iter_matrix_chunks, iter_matrix_csv
+)
+from core.renderers import ChunkedList
+from core.streaming import stream_response
+from django.http import StreamingHttpResponse
 from django.contrib.auth.models import User
 
 from rest_framework.decorators import api_view, permission_classes
@@ -37,7 +45,8 @@ class RoleViewSet(viewsets.ModelViewSet):
     Rol yönetimi için ViewSet
     Sadece admin kullanıcılar erişebilir
     """
-    queryset = Role.objects.all()
+    # Yetkiler rol başına ayrı sorgu yerine toplu çekilir
+    queryset = Role.objects.prefetch_related('column_permissions', 'system_permissions')
     permission_classes = [IsAdminUser]
     
     def get_serializer_class(self):
@@ -75,21 +84,10 @@ class RoleViewSet(viewsets.ModelViewSet):
         role = self.get_object()
         permissions_data = request.data.get('permissions', {})
         
-        # Mevcut yetkileri sil
-        role.column_permissions.all().delete()
-        
-        # Yeni yetkileri oluştur
-        created_permissions = []
-        for column_name, permission in permissions_data.items():
-            if column_name in [choice[0] for choice in ColumnPermission.COLUMN_CHOICES]:
-                perm = ColumnPermission.objects.create(
-                    role=role,
-                    column_name=column_name,
-                    permission=permission
-                )
-                created_permissions.append(perm)
-        
-        serializer = ColumnPermissionSerializer(created_permissions, many=True)
+        # Mevcut satırlarla fark alınarak toplu güncellenir
+        updated_permissions = sync_role_permissions(role, ColumnPermission, permissions_data, replace=True)
+        
+        serializer = ColumnPermissionSerializer(updated_permissions, many=True)
         return Response({
             'message': 'Rol yetkileri güncellendi',
             'permissions': serializer.data
@@ -101,7 +99,7 @@ class UserRoleViewSet(viewsets.ModelViewSet):
     Kullanıcı-Rol atamaları için ViewSet
     Sadece admin kullanıcılar erişebilir
     """
-    queryset = UserRole.objects.all()
+    queryset = UserRole.objects.select_related('user', 'role')
     serializer_class = UserRoleSerializer
     permission_classes = [IsAdminUser]
     
@@ -139,6 +137,60 @@ class UserRoleViewSet(viewsets.ModelViewSet):
             'permissions': detailed_permissions
         })
     
+    @action(detail=False, methods=['get'])
+    def matrix(self, request):
+        """
+        Tüm kullanıcıların etkin kolon/sistem yetki matrisi (tek sorgu, JSON ve CSV akışlı)
+        Query params: user_id (virgülle ayrılmış), role, is_active,
+        column + permission (ters arama: kolonda bu yetkiye sahip kullanıcılar),
+        output=csv (CSV olarak akış)
+        """
+        params = request.query_params
+        
+        user_ids = None
+        if params.get('user_id'):
+            user_ids = [value for value in params['user_id'].split(',') if value.strip().isdigit()]
+            if not user_ids:
+                return Response({'message': 'Geçersiz user_id'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        role_id = params.get('role')
+        if role_id and not role_id.isdigit():
+            return Response({'message': 'Geçersiz rol'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        is_active = {'true': True, 'false': False}.get((params.get('is_active') or '').lower())
+        
+        column = params.get('column')
+        permission = params.get('permission')
+        if column or permission:
+            if column not in COLUMN_NAMES:
+                return Response({'message': 'Geçersiz kolon'}, status=status.HTTP_400_BAD_REQUEST)
+            if permission not in PERMISSION_LEVELS:
+                return Response({'message': 'permission none, read veya write olmalı'},
+                              status=status.HTTP_400_BAD_REQUEST)
+        
+        query = build_matrix_query(
+            user_ids=user_ids, role_id=role_id, is_active=is_active,
+            column=column, permission=permission
+        )
+        
+        if params.get('output') == 'csv':
+            response = StreamingHttpResponse(iter_matrix_csv(query), content_type='text/csv; charset=utf-8')
+            response['Content-Disposition'] = 'attachment; filename="permission_matrix.csv"'
+            return response
+        
+        data = {
+            'message': 'Yetki matrisi',
+            'columns': COLUMN_NAMES,
+            'system_permission_types': SYSTEM_PERMISSION_TYPES,
+            'users': ChunkedList(iter_matrix_chunks(query)),
+        }
+        response = stream_response(request, data, view=self)
+        if response is None:
+            # Girintili çıktı ya da akış kapalı: liste bellekte oluşturulur
+            data['users'] = [row for chunk in data['users'].chunks for row in chunk]
+            return Response(data)
+        return response
+    
     @action(detail=False, methods=['get'])
     def user_permissions(self, request):
         """
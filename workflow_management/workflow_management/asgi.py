@@ -5,6 +5,27 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+Çalışma modeli (ASYNC_READ_VIEWS=True):
+
+    ASYNC_READ_VIEWS=True gunicorn workflow_management.asgi:application \\
+        -k uvicorn.workers.UvicornWorker -w <CPU sayısı> --timeout 60
+
+- Her worker process tek bir event loop çalıştırır. İş listesi/detayı, hareketler,
+  dropdown'lar ve kullanıcı araması GET istekleri async view'lardır
+  (workflows/async_views.py, authentication/async_views.py); veritabanı okumaları
+  async ORM ile yapılır, yavaş bir MSSQL sorgusu worker'ı bloklamaz.
+- Senkron kısımlar (JWT doğrulama, serializer, yetki filtresi, yazma istekleri ve
+  diğer DRF view'ları) sync_to_async ile thread havuzunda çalışır. Django bir isteğin
+  senkron işlerini aynı thread'de tutar; veritabanı bağlantıları thread başınadır.
+- Eşzamanlı istek sayısı kadar thread ve veritabanı bağlantısı açılabilir; veritabanı
+  tarafındaki bağlantı limiti worker sayısı ile birlikte planlanmalıdır.
+- ASYNC_READ_VIEWS WSGI altında açılmamalıdır (her async view için event loop kurulur).
+
+WSGI ile karşılaştırma için aynı veri üzerinde:
+
+    python manage.py load_test http://127.0.0.1:8000 --path /api/workflows/ \\
+        --path /api/categories/ --concurrency 200 --requests 5000 --user admin
 """
 
 import os
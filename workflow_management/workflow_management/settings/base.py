@@ -30,6 +30,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestTimingMiddleware',
+    'core.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -38,10 +40,71 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
+    'core.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'workflow_management.urls'
 
+# İstek ölçümleri: Server-Timing başlığı ve 'core.timing' logger'ına JSON satırı
+REQUEST_TIMING_ENABLED = os.environ.get('REQUEST_TIMING_ENABLED', 'True').lower() == 'true'
+
+# Prometheus metrikleri (/metrics). Birden fazla gunicorn worker'ında METRICS_DIR
+# paylaşılan bir dizin olmalı; her worker kendi dosyasını yazar, scrape hepsini toplar.
+# METRICS_TOKEN verilmezse uç nokta yalnızca yerel adreslerden erişilebilir.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
+METRICS_DIR = os.environ.get('METRICS_DIR', '')
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', '1'))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Yavaş sorgu kaydı (core/db/slow_queries.py): eşiği aşan sorgular 'core.slow_queries'
+# logger'ına yazılır. REQUEST_TIMING_ENABLED açık olmalıdır.
+# View bazında eşik: SLOW_QUERY_THRESHOLDS="WorkflowViewSet.list=100,WorkflowViewSet.set_priority=50"
+SLOW_QUERY_LOG_ENABLED = os.environ.get('SLOW_QUERY_LOG_ENABLED', 'True').lower() == 'true'
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get('SLOW_QUERY_THRESHOLD_MS', '200'))
+SLOW_QUERY_THRESHOLDS = {
+    view_name.strip(): float(milliseconds)
+    for view_name, _, milliseconds in (
+        item.partition('=') for item in os.environ.get('SLOW_QUERY_THRESHOLDS', '').split(',') if '=' in item
+    )
+}
+# Planı alınacak en yavaş sorgu sayısı (istek başına); plan sorgusu ek yük getirir
+SLOW_QUERY_EXPLAIN = os.environ.get('SLOW_QUERY_EXPLAIN', 'False').lower() == 'true'
+SLOW_QUERY_EXPLAIN_LIMIT = int(os.environ.get('SLOW_QUERY_EXPLAIN_LIMIT', '3'))
+
+# İstek profilleme (core/profiling.py): superuser 'X-Profile: 1' ya da '?_profile=1' ile,
+# ayrıca PROFILE_SAMPLE_RATES="WorkflowViewSet.list=500" ile view başına 1/N örnekleme.
+# Profiller /api/profiles/ altından indirilir; en fazla PROFILE_MAX_FILES tutulur.
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'True').lower() == 'true'
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(BASE_DIR, 'logs', 'profiles'))
+PROFILE_SAMPLE_RATES = {
+    view_name.strip(): int(rate)
+    for view_name, _, rate in (
+        item.partition('=') for item in os.environ.get('PROFILE_SAMPLE_RATES', '').split(',') if '=' in item
+    )
+}
+PROFILE_MAX_FILES = int(os.environ.get('PROFILE_MAX_FILES', '200'))
+
+# Admin listeleri (core/admin.py): filtresiz listede tablo bu eşiği aşıyorsa COUNT(*) yerine
+# istatistiklerden okunan tahmini satır sayısı kullanılır; date_hierarchy sınırları cache'lenir
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.environ.get('ADMIN_ESTIMATED_COUNT_THRESHOLD', '100000'))
+ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT = int(os.environ.get('ADMIN_DATE_HIERARCHY_CACHE_TIMEOUT', '600'))
+
+# Fork öncesi ısınma (core/warmup.py, gunicorn.conf.py). /ready ısınma bitene kadar 503 döner;
+# READY_REQUIRES_WARMUP kapalıysa başarısız adımlar hazır olmayı engellemez
+WARMUP_ENABLED = os.environ.get('WARMUP_ENABLED', 'True').lower() == 'true'
+READY_REQUIRES_WARMUP = os.environ.get('READY_REQUIRES_WARMUP', 'True').lower() == 'true'
+
+# İş panosu (/api/workflows/board/): kolon başına varsayılan ve en fazla iş sayısı
+WORK_BOARD_LIMIT = int(os.environ.get('WORK_BOARD_LIMIT', '20'))
+WORK_BOARD_MAX_LIMIT = int(os.environ.get('WORK_BOARD_MAX_LIMIT', '100'))
+
+# Okuma replikası: DATABASES içinde bu alias tanımlıysa güvenli isteklerin okumaları oraya gider
+DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+DATABASE_REPLICA_ALIAS = 'replica'
+# Yazma yapan kullanıcının okumaları bu süre boyunca primary'den yapılır (replikasyon gecikmesi)
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', '10'))
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -97,9 +160,35 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
+# Kimlik doğrulamada kullanıcı cache süresi (saniye) - pasifleştirme en geç bu sürede etkili olur
+AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', '60'))
+
+# Token'daki yetki sürümünün cache süresi (saniye) - rol değişiklikleri en geç bu sürede etkili olur
+PERMISSION_VERSION_CACHE_TIMEOUT = int(os.environ.get('PERMISSION_VERSION_CACHE_TIMEOUT', '30'))
+
+# Kullanıcı arama indeksi ilk kurulumdan sonra arka planda yeniden kurulur (False: istek içinde)
+USER_INDEX_BACKGROUND_REBUILD = os.environ.get('USER_INDEX_BACKGROUND_REBUILD', 'True').lower() == 'true'
+
+# İptal edilen token listesinin diğer worker'lardan senkronize edilme aralığı (saniye)
+TOKEN_REVOCATION_SYNC_INTERVAL = int(os.environ.get('TOKEN_REVOCATION_SYNC_INTERVAL', '10'))
+# Artımlı senkronizasyonda geriye dönük örtüşme payı (saniye) - geç commit edilen iptalleri yakalar
+TOKEN_REVOCATION_SYNC_OVERLAP = int(os.environ.get('TOKEN_REVOCATION_SYNC_OVERLAP', '60'))
+
+# JSON çıktısı - FastCustomJSONRenderer aynı byte'ları daha hızlı üretir (orjson varsa)
+FAST_JSON_RENDERER = os.environ.get('FAST_JSON_RENDERER', 'True').lower() == 'true'
+
+# Büyük liste yanıtları parça parça serileştirilip akıtılır (bkz. core/streaming.py)
+STREAM_LIST_RESPONSES = os.environ.get('STREAM_LIST_RESPONSES', 'True').lower() == 'true'
+
+# ASGI modu: sık okunan GET uç noktaları async view + async ORM ile çalışır (bkz. asgi.py)
+# WSGI altında açılmamalı; her istek için ayrı event loop kurulur
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS', 'False').lower() == 'true'
+
 # REST Framework
 REST_FRAMEWORK = {
-    'DEFAULT_RENDERER_CLASSES': ['core.renderers.CustomJSONRenderer'],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastCustomJSONRenderer' if FAST_JSON_RENDERER else 'core.renderers.CustomJSONRenderer'
+    ],
     'EXCEPTION_HANDLER': 'core.exceptions.custom_exception_handler',
     'DEFAULT_AUTHENTICATION_CLASSES': ['core.jwt_auth.CustomJWTAuthentication'],
     'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.IsAuthenticated'],
@@ -14,11 +14,21 @@ DEBUG = True
 ALLOWED_HOSTS = ['*']
 
 # Database - Development için SQLite
+# DB_POOL=True ile havuzlu backend yerelde SQLite üzerinde denenebilir
+DB_POOL = os.environ.get('DB_POOL', 'False').lower() == 'true'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'core.db.backends.sqlite3' if DB_POOL else 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'POOL': {'SIZE': int(os.environ.get('DB_POOL_SIZE', '5'))},
+    },
+    # Geliştirmede replica aynı dosyayı okur; testlerde ayrı bir SQLite veritabanı olur
+    'replica': {
+        'ENGINE': 'core.db.backends.sqlite3' if DB_POOL else 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'POOL': {'SIZE': int(os.environ.get('DB_POOL_SIZE', '5'))},
+    },
 }
 
 # CORS - Development
@@ -33,6 +43,10 @@ CORS_ALLOWED_ORIGINS = [
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 # Logging
+# İstek ölçüm satırları (core.timing) konsola yazılmaz; Server-Timing başlığı yine döner.
+# REQUEST_TIMING_LOG_FILE verilirse satırlar bu dosyaya yazılır.
+REQUEST_TIMING_LOG_FILE = os.environ.get('REQUEST_TIMING_LOG_FILE', '')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -40,9 +54,20 @@ LOGGING = {
         'console': {
             'class': 'logging.StreamHandler',
         },
+        'request_timing': (
+            {'class': 'logging.FileHandler', 'filename': REQUEST_TIMING_LOG_FILE}
+            if REQUEST_TIMING_LOG_FILE else {'class': 'logging.NullHandler'}
+        ),
     },
     'root': {
         'handlers': ['console'],
         'level': 'DEBUG',
     },
+    'loggers': {
+        'core.timing': {
+            'handlers': ['request_timing'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
 }
\ No newline at end of file
@@ -35,9 +35,23 @@ if os.environ.get('ALLOWED_HOSTS'):
     ALLOWED_HOSTS.extend(os.environ.get('ALLOWED_HOSTS').split(','))
 
 # Database - Production (Environment variables kullanarak)
+# DB_POOL açıkken bağlantılar process içi havuzdan alınır (core/db/pool.py);
+# istek sonunda kapatılan bağlantı havuza döner, bu yüzden CONN_MAX_AGE = 0
+DB_POOL = os.environ.get('DB_POOL', 'True').lower() == 'true'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'mssql',  # mssql-django kullanıyoruz
+        'ENGINE': 'core.db.backends.mssql' if DB_POOL else 'mssql',  # mssql-django kullanıyoruz
+        'CONN_MAX_AGE': 0 if DB_POOL else int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': not DB_POOL,
+        'POOL': {
+            # Sync gunicorn worker'ında 1-2 yeterli; thread/ASGI worker'larında eşzamanlılığa göre artırılır
+            'SIZE': int(os.environ.get('DB_POOL_SIZE', '5')),
+            'TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', '10')),
+            'MAX_LIFETIME': float(os.environ.get('DB_POOL_MAX_LIFETIME', '1800')),
+            'PRE_PING': os.environ.get('DB_POOL_PRE_PING', 'True').lower() == 'true',
+            'PING_AFTER': float(os.environ.get('DB_POOL_PING_AFTER', '5')),
+        },
         'NAME': os.environ.get('DB_NAME', 'Mythos.WorkflowManagement'),
         'USER': os.environ.get('DB_USER', ''),
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
@@ -51,6 +65,18 @@ DATABASES = {
     }
 }
 
+# Okuma replikası (opsiyonel) - DB_REPLICA_HOST verilmezse tüm sorgular primary'ye gider
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ.get('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        'USER': os.environ.get('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'HOST': os.environ.get('DB_REPLICA_HOST'),
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'POOL': dict(DATABASES['default']['POOL']),
+    }
+
 # CORS - Production
 CORS_ALLOWED_ORIGINS = [
     "https://yourdomain.com",
@@ -108,6 +134,11 @@ LOGGING = {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        # slow_query_report satırın JSON kısmını okur
+        'slow_query': {
+            'format': '{asctime} {process:d} {message}',
+            'style': '{',
+        },
     },
     'handlers': {
         'file': {
@@ -118,6 +149,14 @@ LOGGING = {
             'backupCount': 10,
             'formatter': 'verbose',
         },
+        'slow_queries': {
+            'level': 'WARNING',
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': os.path.join(LOG_DIR, 'slow_queries.log'),
+            'maxBytes': 1024 * 1024 * 15,  # 15MB
+            'backupCount': 5,
+            'formatter': 'slow_query',
+        },
         'console': {
             'level': 'INFO',
             'class': 'logging.StreamHandler',
@@ -134,6 +173,11 @@ LOGGING = {
             'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
             'propagate': False,
         },
+        'core.slow_queries': {
+            'handlers': ['slow_queries'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
 }
 
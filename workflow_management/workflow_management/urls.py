@@ -5,9 +5,14 @@ URL configuration for workflow_management project.
 from django.contrib import admin
 from django.urls import path, include
 
+from core.views import metrics_view, ready_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
+    path('ready', ready_view, name='ready'),
     path('api/', include('workflows.urls')),
     path('api/auth/', include('authentication.urls')),
     path('api/permissions/', include('permissions.urls')),  # Yeni eklendi
+    path('api/profiles/', include('core.urls')),
 ]
\ No newline at end of file
@@ -2,6 +2,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
+from core.admin import LargeTableAdminMixin
 from .models import Work, Movement, Category, WorkType, SalesChannel
 
 
@@ -30,7 +31,7 @@ class SalesChannelAdmin(admin.ModelAdmin):
 
 
 @admin.register(Work)
-class WorkAdmin(admin.ModelAdmin):
+class WorkAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = (
         'name', 
         'category', 
@@ -42,6 +43,8 @@ class WorkAdmin(admin.ModelAdmin):
         'status_display',
         'created'
     )
+    # Satır başına kategori/tip/kanal sorgusu yerine tek JOIN
+    list_select_related = ('category', 'type', 'sales_channel')
     list_filter = (
         'category',
         'type',
@@ -161,7 +164,7 @@ class WorkAdmin(admin.ModelAdmin):
 
 
 @admin.register(Movement)
-class MovementAdmin(admin.ModelAdmin):
+class MovementAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = (
         'get_action_display',
         'user_display',
@@ -169,13 +172,14 @@ class MovementAdmin(admin.ModelAdmin):
         'description',
         'created'
     )
+    list_select_related = ('user', 'work')
     list_filter = ('action', 'created')
+    # Hareket tablosunda '%...%' araması tüm tabloyu tarar; yalnızca indeksli
+    # alanlarda tam eşleşme ve önek araması yapılır (açıklama aranmaz)
     search_fields = (
-        'user__username',
-        'user_fullname',
-        'work__name',
-        'work_name',
-        'description'
+        '=user__username',
+        '^user_fullname',
+        '^work_name',
     )
     date_hierarchy = 'created'
     readonly_fields = (
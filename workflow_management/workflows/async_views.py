@@ -0,0 +1,89 @@
+# workflows/async_views.py
+"""
+ASGI modunda sık okunan uç noktaların async karşılıkları.
+Sadece GET istekleri burada karşılanır; yazma işlemleri ve hata yanıtları
+mevcut senkron viewset'lere devredilir (bkz. core.async_views.async_read_view).
+Sorgu, filtre ve serileştirme senkron viewset'lerle aynı yardımcılardan gelir,
+böylece iki yolun yanıtları ayrışmaz.
+"""
+from asgiref.sync import sync_to_async
+from django.urls import path
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+
+from core.async_views import async_read_view
+from workflows.views import (
+    WorkflowViewSet, MovementViewSet, CategoryViewSet, WorkTypeViewSet, SalesChannelViewSet,
+    serialize_work, serialize_work_list, work_list_rows
+)
+
+
+async def workflow_list(request, user):
+    """İş listesi - yetki filtreli"""
+    queryset = work_list_rows(WorkflowViewSet.queryset.all(), request.GET)
+    rows = [row async for row in queryset]
+    return await sync_to_async(serialize_work_list)(rows, user)
+
+
+async def workflow_detail(request, user, pk):
+    """İş detayı - yetki filtreli (serializer ve yetki filtresi cache/veritabanına erişebilir)"""
+    work = await WorkflowViewSet.queryset.aget(pk=pk)
+    return await sync_to_async(serialize_work)(work, user)
+
+
+def viewset_handlers(viewset):
+    """
+    Salt okunur viewset için liste ve detay handler'ları; sorgu ve serializer
+    viewset'in kendisinden alınır (serializer veritabanına gitmez)
+    """
+    serializer_class = viewset.serializer_class
+
+    async def read_list(request, user):
+        items = [item async for item in viewset.queryset.all()]
+        return serializer_class(items, many=True).data
+
+    async def read_detail(request, user, pk):
+        item = await viewset.queryset.aget(pk=pk)
+        return serializer_class(item).data
+
+    return read_list, read_detail
+
+
+# Router'daki eşlemelerle aynı; hata ve yazma istekleri bunlara düşer
+LIST_ACTIONS = {'get': 'list', 'post': 'create'}
+DETAIL_ACTIONS = {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+
+workflow_list_view = async_read_view(workflow_list, WorkflowViewSet.as_view(LIST_ACTIONS))
+workflow_detail_view = async_read_view(workflow_detail, WorkflowViewSet.as_view(DETAIL_ACTIONS))
+
+movement_list, movement_detail = viewset_handlers(MovementViewSet)
+movement_list_view = async_read_view(
+    movement_list, MovementViewSet.as_view({'get': 'list'}), IsAdminUser
+)
+movement_detail_view = async_read_view(
+    movement_detail, MovementViewSet.as_view({'get': 'retrieve'}), IsAdminUser
+)
+
+DROPDOWN_VIEWS = {}
+for prefix, viewset in (
+    ('categories', CategoryViewSet),
+    ('work-types', WorkTypeViewSet),
+    ('sales-channels', SalesChannelViewSet),
+):
+    list_handler, detail_handler = viewset_handlers(viewset)
+    DROPDOWN_VIEWS[prefix] = (
+        async_read_view(list_handler, viewset.as_view(LIST_ACTIONS), IsAuthenticated),
+        async_read_view(detail_handler, viewset.as_view(DETAIL_ACTIONS), IsAuthenticated),
+    )
+
+# workflows/urls.py bunları router'ın önüne ekler; router'daki diğer action'lar senkron kalır
+urlpatterns = [
+    path('workflows/', workflow_list_view, name='work-list'),
+    path('workflows/<int:pk>/', workflow_detail_view, name='work-detail'),
+    path('movements/', movement_list_view, name='movement-list'),
+    path('movements/<int:pk>/', movement_detail_view, name='movement-detail'),
+]
+for prefix, (list_view, detail_view) in DROPDOWN_VIEWS.items():
+    urlpatterns += [
+        path(f'{prefix}/', list_view),
+        path(f'{prefix}/<int:pk>/', detail_view),
+    ]
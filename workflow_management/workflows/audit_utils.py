@@ -26,8 +26,8 @@ def format_display_value(value):
         return str(value)
 
 
-def log_work_action(user, work, action, old_data=None, new_data=None):
-    """Work modelindeki değişiklikleri loglar"""
+def log_work_action(user, work, action, old_data=None, new_data=None, description=None):
+    """Work modelindeki değişiklikleri loglar (description verilirse otomatik açıklamanın yerine geçer)"""
     
     if not user or not user.is_authenticated:
         return
@@ -36,16 +36,16 @@ def log_work_action(user, work, action, old_data=None, new_data=None):
     work_name = work.name if work else None
     
     if action == 'create':
-        description = f"{work_name} isimli yeni iş oluşturuldu"
+        description = description or f"{work_name} isimli yeni iş oluşturuldu"
         changes = None
         
     elif action == 'update':
         changes = _get_changes(work, old_data, new_data, work_name)
-        description = changes['description']
+        description = description or changes['description']
         changes = changes['data'] if changes['data'] and changes['data']['old'] else None
         
     elif action == 'delete':
-        description = f"{work_name} isimli iş silindi"
+        description = description or f"{work_name} isimli iş silindi"
         changes = None
     
     else:
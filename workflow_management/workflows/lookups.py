@@ -0,0 +1,116 @@
+# workflows/lookups.py
+import threading
+import time
+from itertools import islice
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+from core import metrics
+
+from workflows.models import Category, WorkType, SalesChannel
+
+
+class ActiveIdMap:
+    """
+    Aktif kayıtların süreç içi {id: instance} haritası.
+    FK doğrulamalarında her alan için ayrı SELECT atmak yerine kullanılır.
+    Sürüm numarası paylaşılan cache'te tutulur; bir kayıt değiştiğinde
+    tüm worker'lar haritayı en geç REFRESH_INTERVAL saniye içinde yeniler.
+    Cache süreç içi (LocMemCache) olduğunda sürüm artışı diğer worker'lara
+    ulaşmaz; bu yüzden harita sürümden bağımsız olarak MAX_AGE saniyede bir
+    baştan yüklenir. Harita en fazla MAX_ENTRIES kayıt tutar, taşan en eski
+    kayıtlar atılır.
+    """
+
+    REFRESH_INTERVAL = 5  # saniye
+    MAX_AGE = 60  # saniye
+    MAX_ENTRIES = 5000
+
+    def __init__(self, name, queryset_factory):
+        self.name = name
+        self.queryset_factory = queryset_factory
+        self.version_key = f'active_id_map:{name}:version'
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._version = None
+        self._checked_at = 0
+        self._loaded_at = 0
+
+    def __deepcopy__(self, memo):
+        # Serializer alanları kopyalanırken harita paylaşımlı kalmalı
+        return self
+
+    def _current_version(self):
+        return cache.get(self.version_key, 0)
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        expired = now - self._loaded_at >= self.MAX_AGE
+        if self._version is not None and not expired and now - self._checked_at < self.REFRESH_INTERVAL:
+            return
+
+        version = self._current_version()
+        with self._lock:
+            self._checked_at = now
+            if version == self._version and not expired:
+                return
+
+            # Tablo çok büyükse tamamını tutma, eksikler talep anında getirilir
+            rows = self.queryset_factory()[:self.MAX_ENTRIES]
+            self._entries = {obj.pk: obj for obj in rows}
+            self._version = version
+            self._loaded_at = now
+
+    def prime(self, pks):
+        """Haritada olmayan id'leri tek sorguda yükler (toplu istekler için)"""
+        self._ensure_fresh()
+        missing = {pk for pk in pks if pk is not None and pk not in self._entries}
+        if not missing:
+            return
+
+        found = self.queryset_factory().in_bulk(missing)
+        with self._lock:
+            self._entries.update(found)
+            # Sınır aşılırsa en önce eklenenler atılır (dict ekleme sırasını korur)
+            for pk in list(islice(self._entries, max(len(self._entries) - self.MAX_ENTRIES, 0))):
+                del self._entries[pk]
+
+    def get(self, pk):
+        """id'ye karşılık gelen aktif kaydı döndürür, yoksa None"""
+        self._ensure_fresh()
+        instance = self._entries.get(pk)
+        metrics.record_cache(f'id_map:{self.name}', instance is not None)
+        if instance is None:
+            # Harita kısmi olabilir ya da kayıt başka bir worker'da yeni eklenmiş olabilir
+            self.prime([pk])
+            instance = self._entries.get(pk)
+        return instance
+
+    def invalidate(self):
+        """Haritayı tüm worker'lar için geçersiz kılar"""
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, 1, None)
+        with self._lock:
+            self._version = None
+            self._entries = {}
+
+
+category_map = ActiveIdMap('category', lambda: Category.objects.filter(is_active=True))
+work_type_map = ActiveIdMap('work_type', lambda: WorkType.objects.filter(is_active=True))
+sales_channel_map = ActiveIdMap('sales_channel', lambda: SalesChannel.objects.filter(is_active=True))
+user_map = ActiveIdMap(
+    'user',
+    lambda: User.objects.filter(is_active=True).only(
+        'id', 'username', 'first_name', 'last_name', 'email', 'is_active'
+    )
+)
+
+MODEL_ID_MAPS = {
+    Category: category_map,
+    WorkType: work_type_map,
+    SalesChannel: sales_channel_map,
+    User: user_map,
+}
@@ -0,0 +1,45 @@
+# workflows/management/commands/backfill_work_derived_fields.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from workflows.models import DERIVED_FIELDS, Work
+
+
+class Command(BaseCommand):
+    help = (
+        'Work kayıtlarının JSON alanlarından türetilen kolonlarını (son onay tarihi, ana bağlantı) '
+        'yeniden hesaplar. Kolonlar eklendikten sonra bir kez çalıştırılır; yalnızca değişen satırlar yazılır, '
+        '"updated" alanı değişmez.'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Work.objects.only('id', 'confirmations', 'links', *DERIVED_FIELDS).order_by('id')
+        
+        last_id = 0
+        checked = changed = 0
+        while True:
+            # id aralığıyla sayfalanır; OFFSET büyük tablolarda yavaşlar
+            batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            checked += len(batch)
+            
+            to_update = []
+            for work in batch:
+                before = [getattr(work, name) for name in DERIVED_FIELDS]
+                work.refresh_derived_fields()
+                if before != [getattr(work, name) for name in DERIVED_FIELDS]:
+                    to_update.append(work)
+            
+            if to_update:
+                with transaction.atomic():
+                    Work.objects.bulk_update(to_update, DERIVED_FIELDS)
+                changed += len(to_update)
+            self.stdout.write(f'  {checked} iş tarandı, {changed} güncellendi', ending='\r')
+        
+        self.stdout.write(self.style.SUCCESS(f'{checked} iş tarandı, {changed} güncellendi'))
@@ -2,6 +2,7 @@ from django.db import models
 from django.conf import settings
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
+from datetime import datetime
 
 
 class BaseDropdownModel(models.Model):
@@ -40,6 +41,25 @@ class SalesChannel(BaseDropdownModel):
         verbose_name_plural = 'Satış Kanalları'
 
 
+# İş durumları; sıra pano kolonlarının sırasıdır
+STATUSES = {
+    'waiting': {'code': 'waiting', 'text': 'Beklemede', 'color': '#6c757d'},
+    'printing': {'code': 'printing', 'text': 'Baskı', 'color': '#28a745'},
+    'completed': {'code': 'completed', 'text': 'Tamamlandı', 'color': '#dc3545'},
+}
+
+# Durumların veritabanı karşılığı (Work.status_for ile aynı öncelik: stok girişi baskı onayından önce gelir)
+STATUS_FILTERS = {
+    'waiting': models.Q(stock_entry=False, printing_confirm=False),
+    'printing': models.Q(stock_entry=False, printing_confirm=True),
+    'completed': models.Q(stock_entry=True),
+}
+
+# Work'te JSON alanlarından türetilen kolonlar ve kaynakları
+DERIVED_FIELDS = ('latest_confirmation_date', 'primary_link_url', 'primary_link_title')
+DERIVED_FIELD_SOURCES = frozenset(['confirmations', 'links'])
+
+
 class Work(models.Model):
     """İş kayıtları"""
     
@@ -116,6 +136,14 @@ class Work(models.Model):
         help_text='[{"url": "https://...", "title": "Başlık", "description": "Açıklama"}]'
     )
     note = models.TextField(verbose_name='Not', blank=True, null=True)
+    
+    # JSON alanlarından türetilen kolonlar - save() içinde güncellenir (bkz. refresh_derived_fields)
+    latest_confirmation_date = models.DateField(
+        verbose_name='Son Onay Tarihi', blank=True, null=True, editable=False, db_index=True
+    )
+    primary_link_url = models.TextField(verbose_name='Ana Bağlantı', blank=True, null=True, editable=False)
+    primary_link_title = models.TextField(verbose_name='Ana Bağlantı Başlığı', blank=True, null=True, editable=False)
+    
     created = models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')
     updated = models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')
     
@@ -156,15 +184,20 @@ class Work(models.Model):
                 except ValueError:
                     raise ValidationError(f'Onay {i+1}: Geçersiz tarih formatı (YYYY-MM-DD olmalı)')
     
+    @staticmethod
+    def status_for(stock_entry, printing_confirm):
+        """Durumu alan değerlerinden hesapla (values() ile okunan satırlarda da kullanılır)"""
+        if stock_entry:
+            return dict(STATUSES['completed'])
+        elif printing_confirm:
+            return dict(STATUSES['printing'])
+        else:
+            return dict(STATUSES['waiting'])
+    
     @property
     def calculated_status(self):
         """İşin durumunu otomatik hesapla"""
-        if self.stock_entry:
-            return {'code': 'completed', 'text': 'Tamamlandı', 'color': '#dc3545'}
-        elif self.printing_confirm:
-            return {'code': 'printing', 'text': 'Baskı', 'color': '#28a745'}
-        else:
-            return {'code': 'waiting', 'text': 'Beklemede', 'color': '#6c757d'}
+        return self.status_for(self.stock_entry, self.printing_confirm)
     
     @property
     def status_code(self):
@@ -196,8 +229,36 @@ class Work(models.Model):
             return self.printing_controller.get_full_name() or self.printing_controller.username
         return None
     
+    @staticmethod
+    def latest_confirmation(confirmations):
+        """En son onay tarihi (metin); tarihi olmayan onaylar boş tarih sayılır"""
+        if not confirmations:
+            return None
+        # sorted(..., reverse=True)[0] ile aynı: en büyük tarihlerden ilk gelen
+        return max(confirmations, key=lambda x: x.get('date', '')).get('date')
+    
+    def refresh_derived_fields(self):
+        """confirmations ve links'ten türetilen kolonları hesapla"""
+        latest = self.latest_confirmation(self.confirmations)
+        try:
+            latest_date = datetime.strptime(latest, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            latest_date = None
+        # Yalnızca metinle birebir aynı yazılan tarih saklanır ('2024-1-2' gibi değerler JSON'dan okunur)
+        self.latest_confirmation_date = latest_date if latest_date and latest_date.isoformat() == latest else None
+        
+        first_link = self.links[0] if self.links and isinstance(self.links[0], dict) else {}
+        self.primary_link_url = first_link.get('url')
+        self.primary_link_title = first_link.get('title', '')
+    
     def save(self, *args, **kwargs):
-        """Save override - yeni kayıtta priority ayarla"""
+        """Save override - yeni kayıtta priority ayarla, türetilmiş kolonları güncelle"""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or not DERIVED_FIELD_SOURCES.isdisjoint(update_fields):
+            self.refresh_derived_fields()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *DERIVED_FIELDS}
+        
         if not self.pk and self.priority == 0:
             # Yeni kayıt ve priority verilmemişse, en sona ekle
             max_priority = Work.objects.aggregate(models.Max('priority'))['priority__max'] or 0
@@ -209,6 +270,11 @@ class Work(models.Model):
         verbose_name = 'İş'
         verbose_name_plural = 'İşler'
         ordering = ['priority', '-created']  # Önce priority'e göre, sonra oluşturma tarihine göre sırala
+        indexes = [
+            models.Index(fields=['created'], name='work_created_idx'),  # admin date_hierarchy
+            # Pano: durum toplamları bu indeksten sayılır, seyrek durum kolonları (priority, id) sırasıyla okunur
+            models.Index(fields=['printing_confirm', 'stock_entry', 'priority', 'id'], name='work_board_status_idx'),
+        ]
 
 
 class Movement(models.Model):
@@ -247,4 +313,11 @@ class Movement(models.Model):
     class Meta:
         verbose_name = 'Hareket'
         verbose_name_plural = 'Hareketler'
-        ordering = ['-created']
\ No newline at end of file
+        ordering = ['-created']
+        indexes = [
+            models.Index(fields=['created'], name='movement_created_idx'),
+            models.Index(fields=['action', 'created'], name='movement_action_created_idx'),
+            # Admin önek aramaları
+            models.Index(fields=['work_name'], name='movement_work_name_idx'),
+            models.Index(fields=['user_fullname'], name='movement_user_fullname_idx'),
+        ]
\ No newline at end of file
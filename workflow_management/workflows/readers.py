@@ -0,0 +1,267 @@
+# workflows/readers.py
+"""
+Liste yanıtları için derlenmiş okuma yolu.
+
+WorkflowSerializer her satır için model nesnesi kurar ve DRF alan makinesini
+(get_attribute, PKOnlyObject, iç içe serializer, SerializerMethodField) çalıştırır.
+WorkListReader serializer alanlarını bir kez inceleyip sütun listesi ve alan başına
+dönüştürücü çıkarır; satırlar values_list() ile ilişkili ad/kullanıcı sütunlarıyla
+birlikte tuple olarak okunur ve çıktı WorkflowSerializer ile aynı JSON'dur.
+Serializer'a desteklenmeyen bir alan eklenirse derleme ImproperlyConfigured fırlatır.
+"""
+import threading
+from datetime import date
+from functools import partial
+from operator import itemgetter
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from core.timing import timed_phase
+from workflows.models import Work
+from workflows.serializer import (
+    ConfirmationListField, LinkListField, PrintingLocationListField, WorkflowSerializer
+)
+
+# SerializerMethodField ile üretilen kullanıcı detayları: alan adı -> FK adı
+USER_DETAIL_FIELDS = {
+    'designer_detail': 'designer',
+    'printing_controller_detail': 'printing_controller',
+}
+USER_COLUMNS = ('id', 'username', 'first_name', 'last_name', 'email')
+
+# WorkflowSerializer.to_representation'daki geriye uyumluluk alanları, aynı sırayla
+DETAIL_NAME_FIELDS = (
+    ('category_detail', 'category_name', 'name'),
+    ('type_detail', 'type_name', 'name'),
+    ('sales_channel_detail', 'sales_channel_name', 'name'),
+    ('designer_detail', 'designer_name', 'full_name'),
+    ('printing_controller_detail', 'printing_controller_name', 'full_name'),
+)
+
+STATUS_FIELDS = {'status_code': 'code', 'status_text': 'text', 'status_color': 'color'}
+
+# Veritabanından doğru tipte gelen değerlerde DRF dönüşümü (str(), int(), bool()) atlanır
+IDENTITY_FIELDS = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField, serializers.RelatedField,
+)
+
+
+def _compact_items(lead_key):
+    """
+    LinkListField/ConfirmationListField/PrintingLocationListField.to_representation eşdeğeri.
+    Öncü anahtarla başlayan ve None içermeyen öğe zaten çıktı biçimindedir, kopyalanmaz
+    (satırlar her sorguda yeniden çözülür, paylaşılan nesne yoktur).
+    """
+    def convert(value):
+        if not value:
+            return []
+        return [
+            item if next(iter(item), None) == lead_key and None not in item.values() else {
+                lead_key: item.get(lead_key),
+                **{k: v for k, v in item.items() if k != lead_key and v is not None}
+            }
+            for item in value
+        ]
+    return convert
+
+
+# Özel liste alanları ve çıktıda ilk sıraya yazılan anahtarları
+LIST_FIELD_KEYS = {
+    LinkListField: 'url',
+    ConfirmationListField: 'date',
+    PrintingLocationListField: 'location',
+}
+
+
+def _iso_datetime(value, tz):
+    """DRF DateTimeField.to_representation (ISO 8601): saat dilimine çevirir, UTC için 'Z' yazar"""
+    if isinstance(value, str):
+        return value
+    value = value.astimezone(tz) if timezone.is_aware(value) else timezone.make_aware(value, tz)
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _converter(field):
+    """
+    Alan için dönüştürücü; None dönerse değer olduğu gibi yazılır.
+    DRF DateTimeField aktif saat dilimini her değerde yeniden okur (asgiref Local);
+    _iso_datetime'a saat dilimi serialize() içinde istek başına bir kez bağlanır.
+    """
+    if isinstance(field, IDENTITY_FIELDS):
+        return None
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        if output_format and output_format.lower() == ISO_8601 and not hasattr(field, 'timezone'):
+            return _iso_datetime
+    elif isinstance(field, serializers.DateField):
+        output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+        if output_format and output_format.lower() == ISO_8601:
+            return date.isoformat
+    elif type(field) in LIST_FIELD_KEYS:
+        return _compact_items(LIST_FIELD_KEYS[type(field)])
+    elif isinstance(field, serializers.FloatField):
+        return float
+    return field.to_representation
+
+
+def _user_detail(user_id, username, first_name, last_name, email):
+    """WorkflowSerializer.get_user_detail ile aynı çıktı (User.get_full_name dahil)"""
+    return {
+        'id': user_id,
+        'username': username,
+        'full_name': f'{first_name} {last_name}'.strip() or username,
+        'email': email,
+    }
+
+
+class WorkListReader:
+    """WorkflowSerializer(many=True).data yerine values_list() tabanlı liste çıktısı"""
+
+    def __init__(self, serializer_class=WorkflowSerializer):
+        self.serializer_class = serializer_class
+        self._lock = threading.Lock()
+        self._plan = None
+
+    def compile(self):
+        """Sütunlar ve dönüştürücüler ilk kullanımda bir kez hesaplanır"""
+        if self._plan is None:
+            with self._lock:
+                if self._plan is None:
+                    self._plan = self._compile()
+        return self._plan
+
+    def _compile(self):
+        serializer = self.serializer_class()
+        columns = []
+
+        def column(path):
+            if path not in columns:
+                columns.append(path)
+            return columns.index(path)
+
+        identity = []    # (anahtar, sütun) - değer olduğu gibi yazılır
+        converted = []   # (anahtar, sütun, dönüştürücü, alan) - None değilse dönüştürülür
+        nested = []      # (anahtar, FK sütunu, alt anahtarlar, sütunlar)
+        users = []       # (anahtar, kullanıcı sütunları)
+        statuses = []    # (anahtar, durum sözlüğü anahtarı)
+        for name, field in serializer.fields.items():
+            if name in STATUS_FIELDS:
+                statuses.append((name, STATUS_FIELDS[name]))
+            elif name in USER_DETAIL_FIELDS:
+                source = USER_DETAIL_FIELDS[name]
+                users.append((name, itemgetter(*(column(f'{source}__{col}') for col in USER_COLUMNS))))
+            elif isinstance(field, serializers.ModelSerializer):
+                keys = tuple(field.fields)
+                getter = itemgetter(*(column(f'{field.source}__{key}') for key in keys))
+                nested.append((name, column(field.source), keys, getter))
+            elif isinstance(field, (serializers.ReadOnlyField, serializers.SerializerMethodField)):
+                raise ImproperlyConfigured(f'WorkListReader "{name}" alanını derleyemiyor')
+            else:
+                converter = _converter(field)
+                if converter is None:
+                    identity.append((name, column(field.source)))
+                else:
+                    converted.append((name, column(field.source), converter, field))
+
+        status_getter = itemgetter(column('stock_entry'), column('printing_confirm'))
+        links_column, confirmations_column = column('links'), column('confirmations')
+        # Kayıtta türetilen kolonlar (bkz. Work.refresh_derived_fields)
+        derived_getter = itemgetter(
+            column('latest_confirmation_date'), column('primary_link_url'), column('primary_link_title')
+        )
+        return {
+            'columns': tuple(columns),
+            # Anahtar sırası serializer ile aynı kalsın diye her satır bu şablondan kopyalanır
+            'template': dict.fromkeys(serializer.fields),
+            'identity_names': tuple(name for name, _ in identity),
+            'identity_getter': itemgetter(*(index for _, index in identity)),
+            'converted': tuple(converted),
+            'nested': tuple(nested),
+            'users': tuple(users),
+            'statuses': tuple(statuses),
+            'status_getter': status_getter,
+            'links_column': links_column,
+            'confirmations_column': confirmations_column,
+            'derived_getter': derived_getter,
+            'detail_names': tuple(
+                (detail, name_field, key) for detail, name_field, key in DETAIL_NAME_FIELDS
+                if detail in serializer.fields
+            ),
+        }
+
+    def queryset(self, queryset):
+        """Work queryset'ini (filtre/sıralama korunur) satır tuple'larına çevirir"""
+        return queryset.values_list(*self.compile()['columns'])
+
+    @timed_phase('serializer')
+    def serialize(self, rows):
+        plan = self.compile()
+        template = plan['template']
+        identity_names, identity_getter = plan['identity_names'], plan['identity_getter']
+        nested, users, statuses = plan['nested'], plan['users'], plan['statuses']
+        status_getter = plan['status_getter']
+        links_column, confirmations_column = plan['links_column'], plan['confirmations_column']
+        detail_names, derived_getter = plan['detail_names'], plan['derived_getter']
+        status_for = Work.status_for
+
+        # Aktif saat dilimi (DRF default_timezone) istek başına bir kez okunur
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        converted = []
+        for name, index, converter, field in plan['converted']:
+            if converter is _iso_datetime:
+                converter = field.to_representation if tz is None else partial(_iso_datetime, tz=tz)
+            converted.append((name, index, converter))
+
+        results = []
+        for row in rows:
+            data = template.copy()
+            data.update(zip(identity_names, identity_getter(row)))
+            for name, index, converter in converted:
+                value = row[index]
+                if value is not None:
+                    data[name] = converter(value)
+            for name, fk_index, keys, getter in nested:
+                if row[fk_index] is not None:
+                    data[name] = dict(zip(keys, getter(row)))
+            for name, getter in users:
+                user = getter(row)
+                if user[0] is not None:
+                    data[name] = _user_detail(*user)
+            status = status_for(*status_getter(row))
+            for name, key in statuses:
+                data[name] = status[key]
+
+            for detail, name_field, key in detail_names:
+                if data[detail]:
+                    data[name_field] = data[detail][key]
+
+            # WorkflowSerializer.to_representation ile aynı: kolonlar doldurulmamışsa JSON'dan
+            latest_confirmation_date, link_url, link_title = derived_getter(row)
+            links = row[links_column]
+            if links:
+                if link_url is not None:
+                    data['link'] = link_url
+                    data['link_title'] = link_title
+                else:
+                    data['link'] = links[0].get('url')
+                    data['link_title'] = links[0].get('title', '')
+
+            confirmations = row[confirmations_column]
+            if confirmations:
+                if latest_confirmation_date is not None:
+                    data['confirm_date'] = latest_confirmation_date.isoformat()
+                else:
+                    data['confirm_date'] = Work.latest_confirmation(confirmations)
+
+            results.append(data)
+        return results
+
+
+work_list_reader = WorkListReader()
@@ -5,6 +5,7 @@ from django.utils import timezone
 from django.contrib.auth.models import User
 from workflows.models import Work, Movement, Category, SalesChannel, WorkType
 from permissions.utils import PermissionChecker
+from workflows.lookups import category_map, work_type_map, sales_channel_map, user_map
 from datetime import datetime
 
 
@@ -139,6 +140,54 @@ class PrintingLocationListField(serializers.ListField):
         } for loc in value]
 
 
+class IdMapRelatedField(serializers.PrimaryKeyRelatedField):
+    """Aktif kayıtları veritabanı yerine paylaşılan id haritasından doğrular"""
+    
+    def __init__(self, id_map, **kwargs):
+        self.id_map = id_map
+        super().__init__(**kwargs)
+    
+    def to_pk(self, data):
+        """Gelen değeri primary key tipine çevirir"""
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        try:
+            return self.get_queryset().model._meta.pk.to_python(data)
+        except (DjangoValidationError, TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+    
+    def to_internal_value(self, data):
+        instance = self.id_map.get(self.to_pk(data))
+        if instance is None:
+            self.fail('does_not_exist', pk_value=data)
+        return instance
+
+
+class WorkflowListSerializer(serializers.ListSerializer):
+    """Toplu yazmalarda FK id'lerini tek sorguda önceden yükler"""
+    
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            pks_by_map = {}
+            for field_name, field in self.child.fields.items():
+                if not isinstance(field, IdMapRelatedField) or field.read_only:
+                    continue
+                pks = pks_by_map.setdefault(field.id_map, set())
+                for item in data:
+                    if isinstance(item, dict) and item.get(field_name) is not None:
+                        try:
+                            pks.add(field.to_pk(item[field_name]))
+                        except serializers.ValidationError:
+                            pass  # Hata, alan doğrulamasında raporlanacak
+            
+            for id_map, pks in pks_by_map.items():
+                id_map.prime(pks)
+        
+        return super().to_internal_value(data)
+
+
 class BaseDropdownSerializer(serializers.ModelSerializer):
     """Dropdown modelleri için base serializer"""
     class Meta:
@@ -180,28 +229,33 @@ class WorkflowSerializer(serializers.ModelSerializer):
     confirmations = ConfirmationListField(required=False, allow_empty=True)
     printing_locations = PrintingLocationListField(required=False, allow_empty=True)  # YENİ EKLENEN
     
-    # Foreign key fields
-    category = serializers.PrimaryKeyRelatedField(
+    # Foreign key fields - doğrulama paylaşılan id haritası üzerinden
+    category = IdMapRelatedField(
+        id_map=category_map,
         queryset=Category.objects.filter(is_active=True),
         required=False,
         allow_null=True
     )
-    type = serializers.PrimaryKeyRelatedField(
+    type = IdMapRelatedField(
+        id_map=work_type_map,
         queryset=WorkType.objects.filter(is_active=True),
         required=False,
         allow_null=True
     )
-    sales_channel = serializers.PrimaryKeyRelatedField(
+    sales_channel = IdMapRelatedField(
+        id_map=sales_channel_map,
         queryset=SalesChannel.objects.filter(is_active=True),
         required=False,
         allow_null=True
     )
-    designer = serializers.PrimaryKeyRelatedField(
+    designer = IdMapRelatedField(
+        id_map=user_map,
         queryset=User.objects.filter(is_active=True),
         required=False,
         allow_null=True
     )
-    printing_controller = serializers.PrimaryKeyRelatedField(
+    printing_controller = IdMapRelatedField(
+        id_map=user_map,
         queryset=User.objects.filter(is_active=True),
         required=False,
         allow_null=True
@@ -209,6 +263,7 @@ class WorkflowSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Work
+        list_serializer_class = WorkflowListSerializer
         fields = [
             'id', 'name', 'category', 'price', 'type', 'sales_channel',
             'designer', 'designer_text', 'design_start_date', 'design_end_date',
@@ -261,16 +316,21 @@ class WorkflowSerializer(serializers.ModelSerializer):
                 elif 'full_name' in data[detail_field]:
                     data[name_field] = data[detail_field]['full_name']
         
-        # Legacy link alanları
+        # Legacy link alanları - kayıtta türetilen kolonlardan (doldurulmamışsa JSON'dan)
         if instance.links and len(instance.links) > 0:
-            data['link'] = instance.links[0].get('url')
-            data['link_title'] = instance.links[0].get('title', '')
+            if instance.primary_link_url is not None:
+                data['link'] = instance.primary_link_url
+                data['link_title'] = instance.primary_link_title
+            else:
+                data['link'] = instance.links[0].get('url')
+                data['link_title'] = instance.links[0].get('title', '')
         
-        # Legacy confirm_date alanı (geriye uyumluluk için)
+        # Legacy confirm_date alanı (geriye uyumluluk için) - en son onay tarihi
         if instance.confirmations and len(instance.confirmations) > 0:
-            # En son onay tarihini al
-            sorted_confirmations = sorted(instance.confirmations, key=lambda x: x.get('date', ''), reverse=True)
-            data['confirm_date'] = sorted_confirmations[0].get('date')
+            if instance.latest_confirmation_date is not None:
+                data['confirm_date'] = instance.latest_confirmation_date.isoformat()
+            else:
+                data['confirm_date'] = Work.latest_confirmation(instance.confirmations)
         
         return data
             
@@ -0,0 +1,34 @@
+# workflows/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+from core import metrics
+from .models import Category, WorkType, SalesChannel, Movement
+from .lookups import MODEL_ID_MAPS
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=WorkType)
+@receiver(post_save, sender=SalesChannel)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=WorkType)
+@receiver(post_delete, sender=SalesChannel)
+@receiver(post_delete, sender=User)
+def invalidate_active_id_map(sender, instance, **kwargs):
+    """
+    Dropdown veya kullanıcı değiştiğinde FK doğrulama haritasını geçersiz kıl
+    """
+    update_fields = kwargs.get('update_fields')
+    if sender is User and update_fields and set(update_fields) <= {'last_login'}:
+        # Giriş zamanı güncellemesi haritayı etkilemez
+        return
+    
+    MODEL_ID_MAPS[sender].invalidate()
+
+
+@receiver(post_save, sender=Movement)
+def count_movement(sender, instance, created, **kwargs):
+    """Movement yazma hızı metriği (işlem türüne göre)"""
+    if created:
+        metrics.inc('movements_created_total', action=instance.action)
@@ -1,3 +1,493 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from core.renderers import CustomJSONRenderer, FastCustomJSONRenderer
+from core.testing import AsyncParityMixin, QueryCountTestMixin, client_for, reset_caches
+from permissions.models import ColumnPermission, Role, SystemPermission, UserRole
+from permissions.sync import sync_role_permissions
+from workflows.lookups import category_map
+from workflows.models import Category, Movement, SalesChannel, Work, WorkType
+from workflows.readers import work_list_reader
+from workflows.serializer import WorkflowSerializer
+from workflows.views import WORK_RELATED_FIELDS
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class WorkflowQueryCountTests(QueryCountTestMixin, TestCase):
+    """
+    Sık kullanılan iş uç noktalarının sorgu sayıları sabitlenir.
+    Her iş farklı kategori/tip/kanal/tasarımcıya bağlıdır; satır başına yapılan
+    her ek sorgu (FK, yetki, kullanıcı adı) veri boyutuyla birlikte sayıyı artırır.
+    """
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+        self.editor = User.objects.create_user('editor', first_name='Edit', last_name='Ör')
+        role = Role.objects.create(name='Editör')
+        sync_role_permissions(role, ColumnPermission, {
+            column: ('write' if index % 3 == 0 else 'read' if index % 3 == 1 else 'none')
+            for index, (column, _) in enumerate(ColumnPermission.COLUMN_CHOICES)
+        } | {'note': 'write'}, replace=True)
+        sync_role_permissions(role, SystemPermission, {'work_reorder': True})
+        UserRole.objects.create(user=self.editor, role=role)
+
+    def seed(self, size):
+        for index in range(Work.objects.count(), size):
+            designer = User.objects.create_user(f'designer{index}', first_name=f'Tasarımcı {index}')
+            work = Work.objects.create(
+                name=f'İş {index}',
+                category=Category.objects.create(name=f'Kategori {index}'),
+                type=WorkType.objects.create(name=f'Tip {index}'),
+                sales_channel=SalesChannel.objects.create(name=f'Kanal {index}'),
+                designer=designer,
+                printing_control=True,
+                printing_controller=designer,
+                confirmations=[{'date': '2024-01-02', 'text': 'Onay', 'added_by': 'admin'}],
+                links=[{'url': f'https://example.com/{index}', 'title': 'Dosya'}],
+                printing_locations=[{'location': 'Ana Tesis'}],
+            )
+            Movement.objects.create(
+                user=designer, user_fullname=designer.first_name, work=work, work_name=work.name,
+                action='update', description=f'{work.name} isimli iş güncellendi',
+                changes={'old': {'priority': '1'}, 'new': {'priority': '2'}},
+            )
+
+    def first_work_id(self):
+        return Work.objects.order_by('id').values_list('id', flat=True).first()
+
+    def test_list_superuser(self):
+        client = client_for(self.admin)
+        self.assertConstantQueries(self.seed, lambda: client.get('/api/workflows/'), expected=1)
+        self.assertEqual(len(client.get('/api/workflows/').data), 12)
+
+    def test_list_role_user(self):
+        client = client_for(self.editor)
+        self.assertConstantQueries(self.seed, lambda: client.get('/api/workflows/'), expected=1)
+
+    def test_retrieve_role_user(self):
+        client = client_for(self.editor)
+        self.assertConstantQueries(
+            self.seed, lambda: client.get(f'/api/workflows/{self.first_work_id()}/'), expected=2
+        )
+
+    def test_update_role_user(self):
+        client = client_for(self.editor)
+        self.assertConstantQueries(
+            self.seed,
+            lambda: client.patch(f'/api/workflows/{self.first_work_id()}/', {'note': 'güncel'}, format='json'),
+            expected=9
+        )
+
+    def test_board_role_user(self):
+        client = client_for(self.editor)
+        # Toplamlar için bir, üç kolon için birer sorgu
+        self.assertConstantQueries(self.seed, lambda: client.get('/api/workflows/board/', {'limit': 2}), expected=4)
+
+    def test_movement_list(self):
+        client = client_for(self.admin)
+        self.assertConstantQueries(self.seed, lambda: client.get('/api/movements/'), expected=1)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class WorkListReaderTests(TestCase):
+    """values_list() tabanlı liste çıktısı WorkflowSerializer ile anahtar sırası dahil aynı olmalı"""
+
+    def setUp(self):
+        named = User.objects.create_user('named', first_name='Ayşe', last_name='Şahin', email='a@example.com')
+        bare = User.objects.create_user('bare')
+        category = Category.objects.create(name='Kartvizit')
+        Work.objects.create(
+            name='Dolu', category=category, type=WorkType.objects.create(name='Baskı'),
+            sales_channel=SalesChannel.objects.create(name='Web'), price=12.5,
+            designer=named, designer_text='Dış tasarımcı', printing_control=True, printing_controller=bare,
+            printing_control_date=timezone.now(), printing_confirm=True,
+            design_start_date='2024-03-01', shipping_date='2024-04-01',
+            confirmations=[
+                {'date': '2024-01-02', 'text': None, 'added_by': 'admin'},
+                {'date': '2024-02-01', 'text': 'İkinci'},
+                {'text': 'Tarihsiz', 'date': '2024-02-01'},
+            ],
+            links=[{'title': None, 'url': 'https://example.com/a'}, {'url': 'https://example.com/b', 'title': 'B'}],
+            printing_locations=[{'location': 'Hat 1', 'description': None}, {}],
+        )
+        Work.objects.create(name='Boş', stock_entry=True)
+        Work.objects.create(name='Kategori', category=category, designer=bare, links=[{'url': 'https://example.com/c'}])
+        # Kolonda saklanmayan tarih biçimi ve türetilmiş kolonları doldurulmamış kayıt JSON'dan okunur
+        Work.objects.create(name='Kısa tarih', confirmations=[{'date': '2024-1-15'}])
+        legacy = Work.objects.create(
+            name='Eski', confirmations=[{'date': '2024-05-05'}], links=[{'url': 'https://example.com/d', 'title': 'D'}]
+        )
+        Work.objects.filter(pk=legacy.pk).update(
+            latest_confirmation_date=None, primary_link_url=None, primary_link_title=None
+        )
+
+    def assertSameOutput(self):
+        expected = WorkflowSerializer(Work.objects.select_related(*WORK_RELATED_FIELDS), many=True).data
+        actual = work_list_reader.serialize(work_list_reader.queryset(Work.objects.all()))
+        self.assertEqual(json.dumps(actual, ensure_ascii=False), json.dumps(expected, ensure_ascii=False))
+
+    def test_matches_model_serializer(self):
+        self.assertSameOutput()
+
+    def test_matches_model_serializer_in_utc(self):
+        with timezone.override('UTC'):
+            self.assertSameOutput()
+
+    def test_list_endpoint_uses_reader_output(self):
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        response = client_for(admin).get('/api/workflows/')
+        self.assertEqual(response.data, work_list_reader.serialize(work_list_reader.queryset(Work.objects.all())))
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class StreamedListTests(TestCase):
+    """Parça boyutunu aşan listeler akıtılır; gövde akıtılmayan yanıtla byte-byte aynıdır"""
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.editor = User.objects.create_user('editor')
+        role = Role.objects.create(name='Editör')
+        sync_role_permissions(role, ColumnPermission, {'name': 'read', 'category': 'read'}, replace=True)
+        UserRole.objects.create(user=self.editor, role=role)
+
+        category = Category.objects.create(name='Kategori')
+        for index in range(5):
+            work = Work.objects.create(name=f'İş {index}', category=category, designer=self.editor)
+            Movement.objects.create(
+                user=self.admin, user_fullname='Yönetici', work=work, work_name=work.name,
+                action='update', description='güncellendi',
+            )
+
+        for target, attribute, value in (
+            (FastCustomJSONRenderer, 'CHUNK_SIZE', 2),
+            (CustomJSONRenderer, '_get_timestamp', lambda renderer: '2024-01-01T00:00:00'),
+        ):
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assertStreamsSameBytes(self, user, url):
+        client = client_for(user)
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        streamed = b''.join(response.streaming_content)
+
+        with override_settings(STREAM_LIST_RESPONSES=False):
+            expected = client.get(url)
+        self.assertFalse(expected.streaming)
+        self.assertEqual(streamed, expected.content)
+
+    def test_work_list(self):
+        self.assertStreamsSameBytes(self.admin, '/api/workflows/')
+        self.assertStreamsSameBytes(self.editor, '/api/workflows/')
+
+    def test_movement_list(self):
+        self.assertStreamsSameBytes(self.admin, '/api/movements/')
+
+    def test_small_and_indented_lists_are_not_streamed(self):
+        client = client_for(self.admin)
+        self.assertTrue(client.get('/api/workflows/', {'ordering': 'confirm_date'}).streaming)
+        self.assertFalse(client.get('/api/workflows/', HTTP_ACCEPT='application/json; indent=2').streaming)
+        Work.objects.exclude(pk=Work.objects.order_by('pk')[0].pk).delete()
+        self.assertFalse(client.get('/api/workflows/').streaming)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class WorkDerivedFieldsTests(TestCase):
+    """Son onay tarihi ve ana bağlantı kolonları JSON alanları her değiştiğinde güncellenir"""
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.api = client_for(self.admin)
+        self.work = Work.objects.create(
+            name='İş',
+            confirmations=[{'date': '2024-01-02'}, {'date': '2024-03-04'}],
+            links=[{'url': 'https://example.com/a', 'title': 'A'}],
+        )
+
+    def test_save_derives_columns(self):
+        self.assertEqual(str(self.work.latest_confirmation_date), '2024-03-04')
+        self.assertEqual((self.work.primary_link_url, self.work.primary_link_title), ('https://example.com/a', 'A'))
+
+        self.work.links = []
+        self.work.save(update_fields=['links'])
+        self.work.refresh_from_db()
+        self.assertIsNone(self.work.primary_link_url)
+
+    def test_actions_update_columns(self):
+        path = f'/api/workflows/{self.work.pk}'
+        self.api.post(f'{path}/add_confirmation/', {'date': '2024-05-06'}, format='json')
+        self.api.post(f'{path}/add_link/', {'url': 'https://example.com/b'}, format='json')
+        self.api.post(f'{path}/remove_link/', {'url': 'https://example.com/a'}, format='json')
+        self.work.refresh_from_db()
+        self.assertEqual(str(self.work.latest_confirmation_date), '2024-05-06')
+        self.assertEqual(self.work.primary_link_url, 'https://example.com/b')
+
+        self.api.post(f'{path}/remove_confirmation/', {'date': '2024-05-06'}, format='json')
+        self.work.refresh_from_db()
+        self.assertEqual(str(self.work.latest_confirmation_date), '2024-03-04')
+
+        response = self.api.get(f'{path}/')
+        self.assertEqual((response.data['confirm_date'], response.data['link']), ('2024-03-04', 'https://example.com/b'))
+
+    def test_list_orders_and_filters_by_confirm_date(self):
+        older = Work.objects.create(name='Eski', confirmations=[{'date': '2023-06-01'}])
+        empty = Work.objects.create(name='Onaysız')
+
+        ids = [row['id'] for row in self.api.get('/api/workflows/', {'ordering': '-confirm_date'}).data]
+        self.assertEqual(ids, [self.work.pk, older.pk, empty.pk])
+
+        response = self.api.get('/api/workflows/', {'confirm_date_from': '2024-01-01', 'confirm_date_to': '2024-12-31'})
+        self.assertEqual([row['id'] for row in response.data], [self.work.pk])
+
+        self.assertEqual(self.api.get('/api/workflows/', {'confirm_date_from': '01.01.2024'}).status_code, 400)
+        self.assertEqual(self.api.get('/api/workflows/', {'ordering': 'name'}).status_code, 400)
+
+    def test_backfill_command(self):
+        Work.objects.filter(pk=self.work.pk).update(latest_confirmation_date=None, primary_link_url=None)
+        updated = Work.objects.values_list('updated', flat=True).get(pk=self.work.pk)
+
+        out = StringIO()
+        call_command('backfill_work_derived_fields', stdout=out)
+        self.assertIn('1 güncellendi', out.getvalue())
+        self.work.refresh_from_db()
+        self.assertEqual(str(self.work.latest_confirmation_date), '2024-03-04')
+        self.assertEqual(self.work.primary_link_url, 'https://example.com/a')
+        self.assertEqual(self.work.updated, updated)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class ActiveIdMapTests(TestCase):
+    """FK alanları aktif kayıtların süreç içi haritasından doğrulanır"""
+
+    def setUp(self):
+        reset_caches()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.api = client_for(self.admin)
+        self.work = Work.objects.create(name='İş')
+        self.category = Category.objects.create(name='Kartvizit')
+
+    def patch_category(self, value):
+        return self.api.patch(f'/api/workflows/{self.work.pk}/', {'category': value}, format='json')
+
+    def test_invalid_id_is_rejected(self):
+        for value in (999999, 'abc', True):
+            with self.subTest(value=value):
+                response = self.patch_category(value)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('category', response.data)
+        self.assertEqual(self.patch_category(self.category.pk).status_code, 200)
+
+    def test_inactive_id_is_rejected(self):
+        inactive = Category.objects.create(name='Eski', is_active=False)
+        self.assertIsNone(category_map.get(inactive.pk))
+        self.assertEqual(self.patch_category(inactive.pk).status_code, 400)
+
+        # Sinyal ile geçersiz kılma anında etkili olur
+        self.category.is_active = False
+        self.category.save()
+        self.assertEqual(self.patch_category(self.category.pk).status_code, 400)
+
+    def test_full_reload_after_max_age(self):
+        self.assertIsNotNone(category_map.get(self.category.pk))
+
+        # Sürüm artışı görülmeyen bir worker gibi: kayıt sinyalsiz pasifleştirilir
+        Category.objects.filter(pk=self.category.pk).update(is_active=False)
+        self.assertIsNotNone(category_map.get(self.category.pk))
+
+        category_map._loaded_at -= category_map.MAX_AGE
+        self.assertIsNone(category_map.get(self.category.pk))
+
+    def test_entries_are_capped(self):
+        category_map.MAX_ENTRIES = 3
+        self.addCleanup(delattr, category_map, 'MAX_ENTRIES')
+        pks = [Category.objects.create(name=f'Kategori {index}').pk for index in range(6)]
+        category_map.invalidate()
+
+        category_map.prime(pks)
+        self.assertEqual(len(category_map._entries), 3)
+        for pk in pks:
+            self.assertEqual(category_map.get(pk).pk, pk)
+            self.assertLessEqual(len(category_map._entries), 3)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class WorkBoardTests(TestCase):
+    """Pano kolonları durum filtresi, (priority, id) sırası ve imleçle sayfalanır"""
+
+    def setUp(self):
+        reset_caches()
+        self.api = client_for(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        # Aynı öncelikte birden fazla iş: imleç id ile ayırt etmeli
+        self.waiting = [Work.objects.create(name=f'Bekleyen {index}', priority=index // 2 + 1).pk for index in range(5)]
+        self.printing = [Work.objects.create(name='Baskıda', printing_confirm=True, priority=1).pk]
+        Work.objects.create(name='Biten', printing_confirm=True, stock_entry=True, priority=1)
+
+    def board(self, **params):
+        response = self.api.get('/api/workflows/board/', params)
+        self.assertEqual(response.status_code, 200)
+        return {column['status_code']: column for column in response.data['columns']}
+
+    def test_columns_with_totals_and_limit(self):
+        columns = self.board(limit=2)
+        self.assertEqual(list(columns), ['waiting', 'printing', 'completed'])
+        self.assertEqual([columns[code]['total'] for code in columns], [5, 1, 1])
+        self.assertEqual([work['id'] for work in columns['waiting']['results']], self.waiting[:2])
+        self.assertIsNotNone(columns['waiting']['next_cursor'])
+        self.assertIsNone(columns['printing']['next_cursor'])
+        self.assertEqual(columns['completed']['results'][0]['status_code'], 'completed')
+
+    def test_cursor_pages_through_column(self):
+        seen, cursor = [], None
+        while True:
+            params = {'status': 'waiting', 'limit': 2}
+            if cursor:
+                params['cursor'] = cursor
+            columns = self.board(**params)
+            self.assertEqual(list(columns), ['waiting'])
+            seen += [work['id'] for work in columns['waiting']['results']]
+            cursor = columns['waiting']['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(seen, self.waiting)
+
+    def test_invalid_params(self):
+        for params in ({'limit': 0}, {'status': 'archived'}, {'cursor': 'eHl6'}, {'status': 'waiting', 'cursor': '!!'}):
+            self.assertEqual(self.api.get('/api/workflows/board/', params).status_code, 400, params)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None)
+class MovementAdminTests(TestCase):
+    """Hareket listesi tahmini sayım ve takvimden üretilen date_hierarchy ile çalışır"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.client.force_login(self.admin)
+        now = timezone.now()
+        for index in range(5):
+            movement = Movement.objects.create(
+                user=self.admin, user_fullname='Yönetici', work_name=f'İş {index}',
+                action='update', description='güncellendi'
+            )
+            # İki kayıt arasında kaydı olmayan günler bırakılır
+            Movement.objects.filter(pk=movement.pk).update(created=now - timedelta(days=index * 3))
+        Movement.objects.filter(work_name='İş 2').delete()
+
+    def test_changelist_uses_estimated_count_over_threshold(self):
+        with override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1):
+            response = self.client.get('/admin/workflows/movement/')
+        self.assertEqual(response.status_code, 200)
+        # SQLite istatistik yokken rowid aralığını kullanır; silinen kayıt da sayılır
+        self.assertEqual(response.context['cl'].result_count, 5)
+
+    def test_changelist_counts_exactly_below_threshold(self):
+        response = self.client.get('/admin/workflows/movement/')
+        self.assertEqual(response.context['cl'].result_count, 4)
+
+    def test_filtered_changelist_counts_exactly(self):
+        with override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1):
+            response = self.client.get('/admin/workflows/movement/', {'q': '"İş 1"'})
+        self.assertEqual(response.context['cl'].result_count, 1)
+
+    def test_date_hierarchy_bounds_are_cached(self):
+        self.client.get('/admin/workflows/movement/')
+        Movement.objects.filter(work_name='İş 4').delete()
+        with self.assertNumQueries(6):
+            # oturum, kullanıcı, tahmin (2), eşik altında tam sayım ve sayfa; MIN/MAX ve DISTINCT tarih yok
+            response = self.client.get('/admin/workflows/movement/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_date_hierarchy_lists_calendar_between_bounds(self):
+        queryset = self.client.get('/admin/workflows/movement/').context['cl'].queryset
+        days = queryset.datetimes('created', 'day')
+        first, last = days[0].date(), days[-1].date()
+        self.assertEqual(len(days), (last - first).days + 1)
+
+
+@override_settings(DATABASE_REPLICA_ALIAS=None, ASYNC_READ_VIEWS=True)
+class AsyncReadViewTests(AsyncParityMixin, TransactionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.editor = User.objects.create_user('editor', first_name='Edit', last_name='Ör')
+        role = Role.objects.create(name='Editör')
+        sync_role_permissions(role, ColumnPermission, {
+            column: ('read' if index % 2 else 'none')
+            for index, (column, _) in enumerate(ColumnPermission.COLUMN_CHOICES)
+        }, replace=True)
+        UserRole.objects.create(user=self.editor, role=role)
+
+        self.category = Category.objects.create(name='Kategori')
+        Category.objects.create(name='Pasif', is_active=False)
+        work_type = WorkType.objects.create(name='Tip')
+        channel = SalesChannel.objects.create(name='Kanal')
+        for index in range(3):
+            work = Work.objects.create(
+                name=f'İş {index}', category=self.category, type=work_type, sales_channel=channel,
+                designer=self.editor,
+                confirmations=[{'date': f'2024-01-0{index + 1}', 'text': 'Onay', 'added_by': 'admin'}],
+                links=[{'url': f'https://example.com/{index}', 'title': 'Dosya'}],
+            )
+            self.movement = Movement.objects.create(
+                user=self.admin, user_fullname='Yönetici', work=work, work_name=work.name,
+                action='update', description='güncellendi',
+            )
+        self.work = work
+
+    def test_work_list(self):
+        for user in (self.admin, self.editor):
+            self.assertSameResponse(user, '/api/workflows/')
+            self.assertSameResponse(user, '/api/workflows/', {'ordering': '-confirm_date'})
+            self.assertSameResponse(user, '/api/workflows/', {'confirm_date_from': '2024-01-02'})
+        self.assertSameResponse(self.admin, '/api/workflows/', headers={'Accept': 'application/json; indent=2'})
+
+    def test_work_retrieve(self):
+        for user in (self.admin, self.editor):
+            self.assertSameResponse(user, f'/api/workflows/{self.work.pk}/')
+        self.assertSameResponse(self.admin, '/api/workflows/999999/', status_code=404)
+
+    def test_movements(self):
+        self.assertSameResponse(self.admin, '/api/movements/')
+        self.assertSameResponse(self.admin, f'/api/movements/{self.movement.pk}/')
+        self.assertSameResponse(self.admin, '/api/movements/999999/', status_code=404)
+
+    def test_dropdowns(self):
+        inactive = Category.objects.get(is_active=False)
+        for prefix in ('categories', 'work-types', 'sales-channels'):
+            self.assertSameResponse(self.editor, f'/api/{prefix}/')
+        self.assertSameResponse(self.editor, f'/api/categories/{self.category.pk}/')
+        self.assertSameResponse(self.editor, f'/api/categories/{inactive.pk}/', status_code=404)
+
+    def test_invalid_params(self):
+        self.assertSameResponse(self.admin, '/api/workflows/', {'ordering': 'name'}, status_code=400)
+        self.assertSameResponse(self.admin, '/api/workflows/', {'confirm_date_to': '02.01.2024'}, status_code=400)
+        self.assertSameResponse(self.admin, '/api/workflows/', headers={'Accept': 'text/csv'}, status_code=406)
+
+    def test_unauthenticated(self):
+        self.assertSameResponse(None, '/api/workflows/', status_code=401)
+        self.assertSameResponse(None, '/api/movements/', status_code=401)
+        self.assertSameResponse(None, '/api/categories/', status_code=401)
+        response = self.assertSameResponse(
+            None, '/api/workflows/', headers={'Authorization': 'Bearer bozuk'}, status_code=401
+        )
+        self.assertIn('Bearer', response['WWW-Authenticate'])
+
+    def test_forbidden(self):
+        self.assertSameResponse(self.editor, '/api/movements/', status_code=403)
+        self.assertSameResponse(self.editor, f'/api/movements/{self.movement.pk}/', status_code=403)
@@ -1,4 +1,5 @@
 # urls.py
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from workflows.views import WorkflowViewSet, MovementViewSet, CategoryViewSet, WorkTypeViewSet, SalesChannelViewSet
@@ -12,4 +13,11 @@ router.register('sales-channels', SalesChannelViewSet)
 
 urlpatterns = [
     path('', include(router.urls))
-]
\ No newline at end of file
+]
+
+if settings.ASYNC_READ_VIEWS:
+    # ASGI modunda sık okunan uç noktalar async view'lara yönlendirilir,
+    # router'daki diğer action'lar (set_priority, add_link vb.) senkron kalır
+    from workflows import async_views
+
+    urlpatterns = async_views.urlpatterns + urlpatterns
@@ -1,19 +1,90 @@
-from rest_framework import viewsets, status
+from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django.utils import timezone
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError as DjangoValidationError
-from workflows.models import Work, Movement, Category, WorkType, SalesChannel
+from workflows.models import DERIVED_FIELDS, STATUS_FILTERS, STATUSES, Work, Movement, Category, WorkType, SalesChannel
 from workflows.serializer import (
     WorkflowSerializer, MovementSerializer, 
     CategorySerializer, WorkTypeSerializer, SalesChannelSerializer
 )
+from workflows.readers import work_list_reader
 from .audit_utils import log_work_action
 from permissions.utils import PermissionChecker
+from core.streaming import stream_list_response
 from datetime import datetime
 from django.db import transaction
+from django.db.models import Count, F, Q
+from django.conf import settings
+import base64
+import binascii
+
+
+# Liste ve detayda serializer'ın eriştiği ilişkiler tek sorguda çekilir
+WORK_RELATED_FIELDS = ('category', 'type', 'sales_channel', 'designer', 'printing_controller')
+
+
+# İş listesinde ?ordering= ile seçilebilen sıralamalar; eşitlikte varsayılan sıra korunur
+WORK_ORDERINGS = {
+    'confirm_date': (F('latest_confirmation_date').asc(nulls_last=True), 'priority', '-created'),
+    '-confirm_date': (F('latest_confirmation_date').desc(nulls_last=True), 'priority', '-created'),
+}
+
+# Son onay tarihine göre filtreler: parametre -> lookup
+WORK_DATE_FILTERS = {
+    'confirm_date_from': 'latest_confirmation_date__gte',
+    'confirm_date_to': 'latest_confirmation_date__lte',
+}
+
+
+def filter_works(queryset, params):
+    """İş listesi sorgu parametreleri; hatalı değerde ValidationError (400)"""
+    for param, lookup in WORK_DATE_FILTERS.items():
+        value = params.get(param)
+        if not value:
+            continue
+        try:
+            value = datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise serializers.ValidationError({param: 'Geçersiz tarih formatı (YYYY-MM-DD olmalı)'})
+        queryset = queryset.filter(**{lookup: value})
+    
+    ordering = params.get('ordering')
+    if ordering:
+        if ordering not in WORK_ORDERINGS:
+            raise serializers.ValidationError({'ordering': f"Geçerli değerler: {', '.join(WORK_ORDERINGS)}"})
+        queryset = queryset.order_by(*WORK_ORDERINGS[ordering])
+    return queryset
+
+
+def work_list_rows(queryset, params):
+    """İş listesi satır sorgusu: filtre/sıralama + okuma yolu (senkron ve async view ortak)"""
+    return work_list_reader.queryset(filter_works(queryset, params))
+
+
+def serialize_work_list(rows, user):
+    """Liste satırlarını serileştirip kullanıcının okuyamadığı alanları süzer"""
+    return PermissionChecker.filter_readable_fields(user, work_list_reader.serialize(rows))
+
+
+def serialize_work(instance, user):
+    """Tek iş: WorkflowSerializer çıktısı, yetki filtreli"""
+    return PermissionChecker.filter_readable_fields(user, WorkflowSerializer(instance).data)
+
+
+def encode_board_cursor(priority, pk):
+    """Pano kolonunda son gösterilen işin (priority, id) anahtarı"""
+    return base64.urlsafe_b64encode(f'{priority}:{pk}'.encode()).decode().rstrip('=')
+
+
+def decode_board_cursor(cursor):
+    try:
+        priority, pk = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode().split(':')
+        return int(priority), int(pk)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise serializers.ValidationError({'cursor': 'Geçersiz imleç'})
 
 
 class BaseDropdownViewSet(viewsets.ModelViewSet):
@@ -47,7 +118,7 @@ class SalesChannelViewSet(BaseDropdownViewSet):
 
 class WorkflowViewSet(viewsets.ModelViewSet):
     """İş akışı yönetimi"""
-    queryset = Work.objects.all()
+    queryset = Work.objects.select_related(*WORK_RELATED_FIELDS)
     serializer_class = WorkflowSerializer
     permission_classes = [IsAuthenticated]
 
@@ -179,35 +250,76 @@ class WorkflowViewSet(viewsets.ModelViewSet):
         
         return Response({'message': 'Sıralama normalize edildi'})
     
-    def _can_reorder_works(self, user):
-        """Kullanıcının iş sıralama yetkisi var mı?"""
+    @action(detail=False, methods=['get'])
+    def board(self, request):
+        """
+        Durum kolonlarına göre iş panosu - yetki filtreli.
+        Her kolonda (priority, id) sırasıyla ilk `limit` iş, kolon toplamı ve devam imleci döner.
+        Devamı için ?status=<kolon>&cursor=<next_cursor>. Sorgu sayısı sabittir:
+        toplamlar için bir, her kolon için bir sorgu.
+        """
+        params = request.query_params
         try:
-            from permissions.models import UserRole, SystemPermission
-            # Kullanıcının rollerini al
-            user_roles = UserRole.objects.filter(user=user).values_list('role', flat=True)
+            limit = int(params.get('limit', settings.WORK_BOARD_LIMIT))
+            if limit < 1:
+                raise ValueError()
+        except (ValueError, TypeError):
+            return Response({'message': 'Geçerli bir limit girin (1 veya daha büyük)'},
+                          status=status.HTTP_400_BAD_REQUEST)
+        limit = min(limit, settings.WORK_BOARD_MAX_LIMIT)
+        
+        status_code = params.get('status')
+        if status_code and status_code not in STATUS_FILTERS:
+            return Response({'message': f"Geçerli durumlar: {', '.join(STATUS_FILTERS)}"},
+                          status=status.HTTP_400_BAD_REQUEST)
+        cursor = params.get('cursor')
+        if cursor and not status_code:
+            return Response({'message': 'İmleç ile birlikte durum (status) belirtilmeli'},
+                          status=status.HTTP_400_BAD_REQUEST)
+        after = decode_board_cursor(cursor) if cursor else None
+        
+        codes = [status_code] if status_code else list(STATUS_FILTERS)
+        totals = Work.objects.aggregate(**{code: Count('id', filter=STATUS_FILTERS[code]) for code in codes})
+        
+        columns = []
+        for code in codes:
+            queryset = Work.objects.filter(STATUS_FILTERS[code]).order_by('priority', 'id')
+            if after:
+                priority, pk = after
+                queryset = queryset.filter(Q(priority__gt=priority) | Q(priority=priority, id__gt=pk))
             
-            # Bu roller için work_reorder izni var mı kontrol et
-            return SystemPermission.objects.filter(
-                role__in=user_roles,
-                permission_type='work_reorder',
-                granted=True
-            ).exists()
-        except Exception as e:
-            print(f"Permission check error: {e}")
-            return False
+            # Bir fazla satır okunur; varsa kolonun devamı vardır
+            rows = list(work_list_reader.queryset(queryset)[:limit + 1])
+            works = work_list_reader.serialize(rows[:limit])
+            next_cursor = None
+            if len(rows) > limit:
+                next_cursor = encode_board_cursor(works[-1]['priority'], works[-1]['id'])
+            
+            columns.append({
+                'status_code': code,
+                'status_text': STATUSES[code]['text'],
+                'status_color': STATUSES[code]['color'],
+                'total': totals[code],
+                'results': self._filter_by_permissions(works, request.user),
+                'next_cursor': next_cursor,
+            })
+        
+        return Response({'columns': columns})
+    
+    def _can_reorder_works(self, user):
+        """Kullanıcının iş sıralama yetkisi var mı?"""
+        return PermissionChecker.can_reorder_work(user)
 
     def _filter_by_permissions(self, data, user):
-        """Yetki bazlı filtreleme"""
-        if isinstance(data, list):
-            return [PermissionChecker.filter_readable_fields(user, item) for item in data]
+        """Yetki bazlı filtreleme (liste tek seferde süzülür)"""
         return PermissionChecker.filter_readable_fields(user, data)
     
     def _get_instance_data(self, instance):
-        """Instance'dan tüm field verilerini al"""
+        """Instance'dan tüm field verilerini al (türetilmiş kolonlar kaynak JSON ile loglanır)"""
         data = {}
         for field in instance._meta.fields:
             field_name = field.name
-            if field_name not in ['id', 'created', 'updated']:
+            if field_name not in ['id', 'created', 'updated', *DERIVED_FIELDS]:
                 data[field_name] = getattr(instance, field_name)
         return data
 
@@ -377,25 +489,25 @@ class WorkflowViewSet(viewsets.ModelViewSet):
         return Response({'message': 'Onay silindi', 'confirmations': work.confirmations})
     
     def list(self, request, *args, **kwargs):
-        """Liste görünümü - yetki filtreli"""
-        queryset = self.filter_queryset(self.get_queryset())
+        """Liste görünümü - yetki filtreli (model nesnesi kurmadan, bkz. workflows.readers)"""
+        queryset = work_list_rows(self.filter_queryset(self.get_queryset()), request.query_params)
         page = self.paginate_queryset(queryset)
         
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            filtered_data = self._filter_by_permissions(serializer.data, request.user)
-            return self.get_paginated_response(filtered_data)
+            return self.get_paginated_response(serialize_work_list(page, request.user))
         
-        serializer = self.get_serializer(queryset, many=True)
-        filtered_data = self._filter_by_permissions(serializer.data, request.user)
-        return Response(filtered_data)
+        # Büyük listeler parça parça serileştirilip akıtılır (bkz. core.streaming)
+        rows = list(queryset)
+        response = stream_list_response(
+            request, rows, lambda chunk: serialize_work_list(chunk, request.user), view=self
+        )
+        if response is not None:
+            return response
+        return Response(serialize_work_list(rows, request.user))
     
     def retrieve(self, request, *args, **kwargs):
         """Detay görünümü - yetki filtreli"""
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        filtered_data = self._filter_by_permissions(serializer.data, request.user)
-        return Response(filtered_data)
+        return Response(serialize_work(self.get_object(), request.user))
     
     def create(self, request, *args, **kwargs):
         """Yeni kayıt oluştur"""
@@ -555,6 +667,21 @@ class WorkflowViewSet(viewsets.ModelViewSet):
 
 class MovementViewSet(viewsets.ReadOnlyModelViewSet):
     """Movement kayıtları - sadece okunabilir"""
-    queryset = Movement.objects.all()
+    queryset = Movement.objects.select_related('user', 'work')
     serializer_class = MovementSerializer
-    permission_classes = [IsAdminUser]
\ No newline at end of file
+    permission_classes = [IsAdminUser]
+    
+    def list(self, request, *args, **kwargs):
+        """Liste görünümü - büyük listeler parça parça akıtılır (bkz. core.streaming)"""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        
+        movements = list(queryset)
+        response = stream_list_response(
+            request, movements, lambda chunk: self.get_serializer(chunk, many=True).data, view=self
+        )
+        if response is not None:
+            return response
+        return Response(self.get_serializer(movements, many=True).data)
\ No newline at end of file